@@ -1,21 +1,21 @@
 import random
-import requests
 
 from web3 import Web3
 from web3.eth import AsyncEth
 from web3.middleware import async_geth_poa_middleware
 from eth_account.signers.local import LocalAccount
-from fake_useragent import UserAgent
 from async_eth_lib.models.logger.logger import CustomLogger
 
 from async_eth_lib.models.networks.network import Network
 from async_eth_lib.models.networks.networks import Networks
-import async_eth_lib.models.others.exceptions as exceptions
+from async_eth_lib.models.providers.provider_pool import ProviderPool
+from async_eth_lib.models.providers.proxy_checker import ProxyChecker
+from async_eth_lib.utils.user_agents import UserAgentPool
 
 
 class AccountManager:
+    SECP256K1_ORDER: int = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
     network: Network
-    account: LocalAccount | None
     w3: Web3
 
     def __init__(
@@ -25,73 +25,102 @@ class AccountManager:
         network: Network = Networks.Goerli,
         proxy: str | None = None,
         check_proxy: bool = True,
-        create_log_file_per_account: bool = False
+        create_log_file_per_account: bool = False,
+        batch_window: float | None = None
     ) -> None:
         self.account_id = account_id
         self.network = network
-        self.network.rpc = (
-            random.choice(network.rpc)
-            if isinstance(self.network.rpc, list)
-            else self.network.rpc
-        )
         self.proxy = proxy
         self._initialize_proxy(check_proxy)
         self._initialize_headers()
 
         self.w3 = Web3(
-            Web3.AsyncHTTPProvider(
-                endpoint_uri=self.network.rpc,
-                request_kwargs={'proxy': self.proxy, 'headers': self.headers}
+            ProviderPool.get_provider(
+                rpc=self.network.rpc,
+                proxy=self.proxy,
+                headers=self.headers,
+                batch_window=batch_window
             ),
             modules={'eth': (AsyncEth,)},
             middlewares=[]
         )
         self.w3.middleware_onion.inject(async_geth_poa_middleware, layer=0)
 
-        self._initialize_account(private_key)
-        self._initialize_logger(create_log_file_per_account)
+        self._validate_private_key(private_key)
+        self._private_key = private_key
+        self._account: LocalAccount | None = None
+        self._is_account_initialized = False
+        self.create_log_file_per_account = create_log_file_per_account
+        self._custom_logger: CustomLogger | None = None
+
+    @property
+    def account(self) -> LocalAccount | None:
+        # deriving the address from a key is the costliest part of the setup, so it is deferred
+        if not self._is_account_initialized:
+            self._initialize_account(self._private_key)
+            self._private_key = None
+            self._is_account_initialized = True
+
+        return self._account
+
+    @property
+    def custom_logger(self) -> CustomLogger:
+        if not self._custom_logger:
+            self._initialize_logger(self.create_log_file_per_account)
+
+        return self._custom_logger
 
     def _initialize_proxy(self, check_proxy: bool):
         if not self.proxy:
             return
 
-        if 'http' not in self.proxy:
-            self.proxy = f'http://{self.proxy}'
+        self.proxy = ProxyChecker.normalize_proxy(self.proxy)
 
         if check_proxy:
-            your_ip = requests.get(
-                'http://eth0.me', proxies={'http': self.proxy, 'https': self.proxy}, timeout=10
-            ).text.rstrip()
-
-            if your_ip not in self.proxy:
-                raise exceptions.InvalidProxy(
-                    f"Proxy doesn't work! It's IP is {your_ip}")
+            ProxyChecker.check_proxy_sync(self.proxy)
 
     def _initialize_headers(self):
         self.headers = {
             'Accept': '*/*',
             'Accept-Language': 'en-US,en;q=0.9',
             'Content-Type': 'application/json',
-            'User-Agent': UserAgent().random
+            'User-Agent': UserAgentPool.get_random()
         }
 
+    @classmethod
+    def _validate_private_key(cls, private_key: str | None) -> None:
+        # the key is only derived on the first use of .account, so a bad key is rejected here
+        if not private_key:
+            return
+
+        key = private_key[2:] if private_key[:2].lower() == '0x' else private_key
+        try:
+            is_valid = len(key) == 64 and 0 < int(key, 16) < cls.SECP256K1_ORDER
+        except ValueError:
+            is_valid = False
+
+        if not is_valid:
+            raise ValueError(
+                'The private key must be 32 bytes of hex within the secp256k1 order'
+            )
+
     def _initialize_account(self, private_key: str | None):
         if private_key:
-            self.account: LocalAccount = self.w3.eth.account.from_key(
+            self._account = self.w3.eth.account.from_key(
                 private_key=private_key)
 
         elif private_key == '':
-            self.account = None
+            self._account = None
 
         else:
-            self.account = self.w3.eth.account.create(
+            self._account = self.w3.eth.account.create(
                 extra_entropy=str(random.randint(1, 999_999_999)))
 
     def _initialize_logger(
         self,
         create_log_file_per_account: bool
     ) -> None:
-        self.custom_logger = CustomLogger(
+        self._custom_logger = CustomLogger(
             account_id=self.account_id,
             address=self.account.address,
             network=self.network.name.capitalize(),
@@ -1,7 +1,11 @@
 from async_eth_lib.models.networks.network import Network
 from async_eth_lib.models.networks.networks import Networks
 from .account.account_manager import AccountManager
+from .metrics.metrics import Metrics
+from .providers.proxy_checker import ProxyChecker
+from .providers.rate_limiter import RateLimiter
 from .contracts.contract import Contract
+from .contracts.multicall import Multicall
 
 
 class Client:
@@ -12,15 +16,101 @@ class Client:
         network: Network = Networks.Goerli,
         proxy: str | None = None,
         check_proxy: bool = True,
-        create_log_file_per_account: bool = False
-    ) -> None:        
+        create_log_file_per_account: bool = False,
+        batch_window: float | None = None
+    ) -> None:
         self.account_manager = AccountManager(
             account_id=account_id,
             private_key=private_key,
             network=network,
             proxy=proxy,
             check_proxy=check_proxy,
-            create_log_file_per_account=create_log_file_per_account
+            create_log_file_per_account=create_log_file_per_account,
+            batch_window=batch_window
         )
 
-        self.contract = Contract(self.account_manager)
\ No newline at end of file
+        self.contract = Contract(self.account_manager)
+        self.multicall = Multicall(self.account_manager)
+
+    @classmethod
+    async def create(
+        cls,
+        account_id: int | None = None,
+        private_key: str | None = None,
+        network: Network = Networks.Goerli,
+        proxy: str | None = None,
+        check_proxy: bool = True,
+        create_log_file_per_account: bool = False,
+        batch_window: float | None = None
+    ) -> 'Client':
+        """
+        Create a client, checking its proxy and resolving its network without blocking the event loop.
+
+        Clients created concurrently check their proxies concurrently, and
+        a proxy checked recently is not checked again.
+
+        Example:
+        ```python
+        clients = await asyncio.gather(*[
+            Client.create(private_key=private_key, network=Networks.Arbitrum, proxy=proxy)
+            for private_key, proxy in zip(PRIVATE_KEYS, PROXIES)
+        ])
+        ```
+        """
+        if proxy and check_proxy:
+            await ProxyChecker.check_proxy(proxy)
+
+        await network.resolve()
+
+        return cls(
+            account_id=account_id,
+            private_key=private_key,
+            network=network,
+            proxy=proxy,
+            check_proxy=False,
+            create_log_file_per_account=create_log_file_per_account,
+            batch_window=batch_window
+        )
+
+    @property
+    def metrics(self) -> dict[str, list[dict]]:
+        """
+        Get the latency statistics of the transaction phases on the client chain and of the RPC methods.
+
+        Example:
+        ```python
+        for histogram in client.metrics['tx_phase_seconds']:
+            print(histogram['labels']['phase'], histogram['p50'], histogram['p95'], histogram['p99'])
+        ```
+        """
+        network = self.account_manager.network
+        # the transaction phases are only observed on resolved networks
+        chain_metrics = (
+            Metrics.snapshot(chain_id=network.chain_id) if network.is_resolved else {}
+        )
+        rpc_metrics = Metrics.snapshot()
+
+        return {
+            Metrics.TX_PHASE: chain_metrics.get(Metrics.TX_PHASE, []),
+            Metrics.RPC_REQUEST: rpc_metrics.get(Metrics.RPC_REQUEST, []),
+        }
+
+    @property
+    def rpc_calls(self) -> dict[str, dict[str, int]]:
+        """Get the numbers of JSON-RPC calls per method to the endpoints of the client network."""
+        return RateLimiter.get_calls(self.account_manager.network.rpc)
+
+    def batch(self):
+        """
+        Send the JSON-RPC requests gathered inside the block as one batch.
+
+        Example:
+        ```python
+        async with client.batch():
+            balance, nonce = await asyncio.gather(
+                client.contract.get_balance(),
+                client.contract.transaction.get_nonce()
+            )
+        ```
+        """
+        return self.account_manager.w3.provider.batcher.batch()
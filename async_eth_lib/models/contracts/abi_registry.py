@@ -0,0 +1,68 @@
+import hashlib
+import json
+from typing import Any
+
+from async_eth_lib.utils.helpers import join_path, read_json
+
+
+class AbiRegistry:
+    """
+    A process-wide registry of parsed ABIs.
+
+    Every ABI file is parsed once, and identical ABIs share one list object,
+    which also lets ContractCache reuse contract objects across RawContracts.
+    """
+    ABIS_BY_PATH: dict[str, list[dict[str, Any]]] = {}
+    ABIS_BY_HASH: dict[str, list[dict[str, Any]]] = {}
+    REGISTERED_IDS: set[int] = set()
+
+    @classmethod
+    def get_abi(cls, path: str | tuple | list) -> list[dict[str, Any]]:
+        """
+        Get the ABI of a JSON file, parsing the file on the first request only.
+
+        Args:
+            path (str | tuple | list): the ABI file path.
+
+        Returns:
+            list[dict[str, Any]]: the ABI.
+
+        """
+        path = join_path(path)
+
+        if path not in cls.ABIS_BY_PATH:
+            cls.ABIS_BY_PATH[path] = cls.register(abi=read_json(path=path))
+
+        return cls.ABIS_BY_PATH[path]
+
+    @classmethod
+    def register(cls, abi: list[dict[str, Any]] | str) -> list[dict[str, Any]]:
+        """
+        Deduplicate the ABI against the already registered ones.
+
+        Args:
+            abi (list[dict[str, Any]] | str): the ABI or its JSON string.
+
+        Returns:
+            list[dict[str, Any]]: the registered ABI object equal to the given one.
+
+        """
+        if cls.is_registered(abi):
+            return abi
+
+        if isinstance(abi, str):
+            abi = json.loads(abi)
+
+        abi_hash = hashlib.sha256(
+            json.dumps(abi, sort_keys=True).encode()
+        ).hexdigest()
+
+        abi = cls.ABIS_BY_HASH.setdefault(abi_hash, abi)
+        cls.REGISTERED_IDS.add(id(abi))
+
+        return abi
+
+    @classmethod
+    def is_registered(cls, abi: list[dict[str, Any]] | str) -> bool:
+        # the registry keeps its ABIs alive, so their ids are never reused
+        return id(abi) in cls.REGISTERED_IDS
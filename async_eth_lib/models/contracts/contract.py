@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any, Union
 from web3 import Web3
 from web3.contract import Contract, AsyncContract
@@ -5,6 +6,11 @@ from web3.types import TxParams
 from eth_typing import ChecksumAddress
 
 from async_eth_lib.models.account.account_manager import AccountManager
+from async_eth_lib.models.contracts.contract_cache import ContractCache
+from async_eth_lib.models.contracts.token_metadata_cache import (
+    TokenMetadata,
+    TokenMetadataCache
+)
 from async_eth_lib.models.others.constants import LogStatus
 from async_eth_lib.models.others.dataclasses import CommonValues, DefaultAbis
 from async_eth_lib.models.others.params_types import ParamsTypes
@@ -209,8 +215,8 @@ class Contract:
         if not abi:
             abi = contract_abi
 
-        contract = self.account_manager.w3.eth.contract(
-            address=contract_address, abi=abi
+        contract = ContractCache.get_contract(
+            w3=self.account_manager.w3, address=contract_address, abi=abi
         )
 
         return contract
@@ -285,6 +291,7 @@ class Contract:
 
         else:
             amount = await self.account_manager.w3.eth.get_balance(account=address)
+            await self.account_manager.network.resolve()
             decimals = self.account_manager.network.decimals
 
         return TokenAmount(
@@ -314,19 +321,87 @@ class Contract:
         # Output: 18
         """
 
-        if type(token_contract) in ParamsTypes.TokenContract.__args__:
-            if not token_contract.decimals:
-                contract = self.account_manager.w3.eth.contract(
-                    address=token_contract.address,
-                    abi=token_contract.abi
-                )
-                token_contract.decimals = await contract.functions.decimals().call()
-            decimals = token_contract.decimals
+        is_token_contract = (
+            type(token_contract) in ParamsTypes.TokenContract.__args__
+        )
+        if is_token_contract and token_contract.decimals:
+            return token_contract.decimals
+
+        await self.account_manager.network.resolve()
+        chain_id = self.account_manager.network.chain_id
+        metadata = TokenMetadataCache.get(
+            chain_id=chain_id, address=token_contract.address
+        )
+
+        if metadata and metadata.decimals is not None:
+            decimals = metadata.decimals
         else:
-            decimals = await token_contract.functions.decimals().call()
+            contract = await self.get_token_contract(token=token_contract)
+            decimals = await contract.functions.decimals().call()
+            TokenMetadataCache.update(
+                chain_id=chain_id,
+                address=token_contract.address,
+                decimals=decimals
+            )
+
+        if is_token_contract:
+            token_contract.decimals = decimals
 
         return decimals
 
+    async def get_token_metadata(
+        self,
+        token_contract: ParamsTypes.TokenContract | ParamsTypes.Contract
+            | ParamsTypes.Address
+    ) -> TokenMetadata:
+        """
+        Retrieve the decimals, symbol and name of a token, using the process-wide cache.
+
+        Args:
+            token_contract (TokenContract | NativeTokenContract | RawContract | AsyncContract | Contract | str | Address | ChecksumAddress | ENS):
+                The token contract or its address.
+
+        Returns:
+            TokenMetadata: the token metadata.
+
+        Example:
+        ```python
+        metadata = await client.contract.get_token_metadata(token_contract=ZkSyncTokenContracts.USDC)
+        print(metadata)
+        # Output: TokenMetadata(decimals=6, symbol='USDC', name='USD Coin')
+        ```
+        """
+        address, _ = await self.get_contract_attributes(contract=token_contract)
+        await self.account_manager.network.resolve()
+        chain_id = self.account_manager.network.chain_id
+
+        metadata = TokenMetadataCache.get(chain_id=chain_id, address=address)
+        if (
+            metadata
+            and metadata.decimals is not None
+            and metadata.symbol is not None
+            and metadata.name is not None
+        ):
+            return metadata
+
+        contract = await self.get_token_contract(token=token_contract)
+        decimals, symbol, name = await asyncio.gather(
+            contract.functions.decimals().call(),
+            contract.functions.symbol().call(),
+            contract.functions.name().call(),
+            return_exceptions=True
+        )
+        if isinstance(decimals, Exception):
+            raise decimals
+
+        return TokenMetadataCache.update(
+            chain_id=chain_id,
+            address=address,
+            decimals=decimals,
+            symbol=symbol if isinstance(symbol, str) else None,
+            name=name if isinstance(name, str) else None
+        )
+
     def add_multiplier_of_gas(
         self,
         tx_params: TxParams | dict,
@@ -352,12 +427,10 @@ class Contract:
             TxParams | dict: The updated transaction parameters.
 
         """
+        # gas is priced in gwei whatever the coin decimals are,
+        # so this sync setter does not need a resolved network
         if isinstance(gas_price, float | int):
-            gas_price = TokenAmount(
-                amount=gas_price,
-                decimals=self.account_manager.network.decimals,
-                set_gwei=True
-            )
+            gas_price = TokenAmount(amount=gas_price, set_gwei=True)
         tx_params['gasPrice'] = gas_price.GWei
         return tx_params
 
@@ -377,12 +450,9 @@ class Contract:
             dict | TxParams: The updated transaction parameters.
 
         """
+        # a gas limit is a number of gas units, not a coin amount
         if isinstance(gas_limit, int):
-            gas_limit = TokenAmount(
-                amount=gas_limit,
-                decimals=self.account_manager.network.decimals,
-                wei=True
-            )
+            gas_limit = TokenAmount(amount=gas_limit, wei=True)
         tx_params['gas'] = gas_limit.Wei
         return tx_params
 
@@ -409,8 +479,8 @@ class Contract:
         """
         if type(token) in ParamsTypes.Address.__args__:
             address = Web3.to_checksum_address(token)
-            contract = self.account_manager.w3.eth.contract(
-                address=address, abi=DefaultAbis.Token
+            contract = ContractCache.get_contract(
+                w3=self.account_manager.w3, address=address, abi=DefaultAbis.Token
             )
         else:
             address = Web3.to_checksum_address(token.address)
@@ -421,8 +491,8 @@ class Contract:
             else:
                 abi = DefaultAbis.Token
 
-            contract = self.account_manager.w3.eth.contract(
-                address=address, abi=abi
+            contract = ContractCache.get_contract(
+                w3=self.account_manager.w3, address=address, abi=abi
             )
 
         return contract
@@ -0,0 +1,86 @@
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any
+
+from eth_typing import ChecksumAddress
+from web3 import Web3
+from web3.contract import AsyncContract
+
+from async_eth_lib.models.contracts.abi_registry import AbiRegistry
+
+
+class ContractCache:
+    """
+    A bounded LRU cache of contract objects built by `w3.eth.contract`, kept per Web3 instance.
+
+    Building a contract parses its ABI and creates function and event classes
+    bound to the Web3 instance and its provider, so the objects are reused per
+    (address, ABI key) within that instance only. The ABI key of an AbiRegistry
+    ABI is its identity, only other ABIs are hashed. The cache is stored on the
+    Web3 instance itself, so it is collected together with the instance and
+    no global reference keeps a Web3 alive.
+    """
+    MAX_SIZE: int = 1024
+    ATTRIBUTE_NAME: str = '_contract_cache'
+
+    @classmethod
+    def get_contract(
+        cls,
+        w3: Web3,
+        address: ChecksumAddress,
+        abi: list[dict[str, Any]] | str
+    ) -> AsyncContract:
+        """
+        Get a cached contract object or build and cache a new one.
+
+        Args:
+            w3 (Web3): the Web3 instance the contract is bound to.
+            address (ChecksumAddress): the contract address.
+            abi (list[dict[str, Any]] | str): the contract ABI.
+
+        Returns:
+            AsyncContract: the contract object.
+
+        """
+        contracts = cls._get_contracts(w3)
+        key = (address, cls.get_abi_key(abi))
+
+        contract = contracts.get(key)
+        if contract:
+            contracts.move_to_end(key)
+            return contract
+
+        contract = w3.eth.contract(address=address, abi=abi)
+        contracts[key] = contract
+
+        if len(contracts) > cls.MAX_SIZE:
+            contracts.popitem(last=False)
+
+        return contract
+
+    @staticmethod
+    def get_abi_key(abi: list[dict[str, Any]] | str) -> int | str:
+        if AbiRegistry.is_registered(abi):
+            return id(abi)
+
+        if not isinstance(abi, str):
+            abi = json.dumps(abi, sort_keys=True)
+
+        return hashlib.sha1(abi.encode()).hexdigest()
+
+    @classmethod
+    def clear(cls, w3: Web3) -> None:
+        cls._get_contracts(w3).clear()
+
+    @classmethod
+    def _get_contracts(
+        cls,
+        w3: Web3
+    ) -> OrderedDict[tuple[ChecksumAddress, int | str], AsyncContract]:
+        contracts = getattr(w3, cls.ATTRIBUTE_NAME, None)
+        if contracts is None:
+            contracts = OrderedDict()
+            setattr(w3, cls.ATTRIBUTE_NAME, contracts)
+
+        return contracts
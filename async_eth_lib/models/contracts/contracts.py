@@ -6,31 +6,36 @@ from async_eth_lib.models.contracts.raw_contract import (
     TokenContract,
     NativeTokenContract
 )
-from async_eth_lib.utils.helpers import read_json
 
 
 class ContractsFactory:
     @staticmethod
     def get_contract(network_name: str, token_symbol: str):
+        token_contracts = ContractsFactory.get_token_contracts(network_name)
+
+        return token_contracts.get_token(token_symbol)
+
+    @staticmethod
+    def get_token_contracts(network_name: str) -> type['TokenContractData']:
         match(network_name):
+            case Networks.Ethereum.name:
+                return EthereumTokenContracts
             case Networks.Arbitrum.name:
-                return EthereumTokenContracts.get_token(token_symbol)
-            case Networks.Arbitrum.name:
-                return ArbitrumTokenContracts.get_token(token_symbol)
+                return ArbitrumTokenContracts
             case Networks.Avalanche.name:
-                return AvalancheTokenContracts.get_token(token_symbol)
+                return AvalancheTokenContracts
             case Networks.BSC.name:
-                return BscTokenContracts.get_token(token_symbol)
+                return BscTokenContracts
             case Networks.Fantom.name:
-                return FantomTokenContracts.get_token(token_symbol)
+                return FantomTokenContracts
             # case Networks.Kava.name:
-            #     return KavaTokenContracts.get_token(token_symbol)
+            #     return KavaTokenContracts
             case Networks.Optimism.name:
-                return OptimismTokenContracts.get_token(token_symbol)
+                return OptimismTokenContracts
             case Networks.Polygon.name:
-                return PolygonTokenContracts.get_token(token_symbol)
+                return PolygonTokenContracts
             case Networks.ZkSync.name:
-                return ZkSyncTokenContracts.get_token(token_symbol)
+                return ZkSyncTokenContracts
             case _:
                 raise ValueError("Network not supported")
 
@@ -60,6 +65,25 @@ class TokenContractData(metaclass=Singleton):
 
         return getattr(cls, contract_name)
 
+    @classmethod
+    def get_tokens(cls) -> list[TokenContract]:
+        """
+        Get all the token contracts of the class.
+
+        Returns:
+            list[TokenContract]: the token contracts without duplicates.
+        """
+        tokens = {}
+        for name in dir(cls):
+            if name == 'NATIVE_ETH':
+                continue
+
+            value = getattr(cls, name)
+            if isinstance(value, TokenContract):
+                tokens.setdefault(value.address, value)
+
+        return list(tokens.values())
+
 
 class USDVContract:
     USDV = TokenContract(
@@ -270,9 +294,7 @@ class ZkSyncTokenContracts(TokenContractData):
     WETH = TokenContract(
         title=TokenSymbol.WETH,
         address='0x5AEa5775959fBC2557Cc8789bC1bf90A239D9a91',
-        abi=read_json(
-            path=('data', 'abis', 'zksync', 'weth_abi.json')
-        )
+        abi_path=('data', 'abis', 'zksync', 'weth_abi.json')
     )
 
     WBTC = TokenContract(
@@ -0,0 +1,251 @@
+import asyncio
+
+from eth_abi import abi
+from eth_typing import ChecksumAddress
+from web3 import Web3
+from web3.contract import AsyncContract
+
+from async_eth_lib.models.account.account_manager import AccountManager
+from async_eth_lib.models.contracts.contract_cache import ContractCache
+from async_eth_lib.models.contracts.raw_contract import TokenContract
+from async_eth_lib.models.contracts.token_metadata_cache import TokenMetadataCache
+from async_eth_lib.models.networks.networks import Networks
+from async_eth_lib.models.others.dataclasses import DefaultAbis
+from async_eth_lib.models.others.params_types import ParamsTypes
+from async_eth_lib.models.others.token_amount import TokenAmount
+
+
+class Multicall:
+    """
+    Aggregates many read-only calls into chunked Multicall3 `aggregate3` calls.
+
+    Attributes:
+        account_manager (AccountManager): the account manager whose w3 is used.
+        chunk_size (int): the max number of calls in one `aggregate3` call.
+
+    """
+    DEFAULT_ADDRESS: str = '0xcA11bde05977b3631167028862bE2a173976CA11'
+    ADDRESSES: dict[str, str] = {
+        Networks.ZkSync.name: '0xF9cda624FBC7e059355ce98a31693d299FACd963',
+    }
+    CHUNK_SIZE: int = 500
+
+    BALANCE_OF_SELECTOR = Web3.keccak(text='balanceOf(address)')[:4]
+    ALLOWANCE_SELECTOR = Web3.keccak(text='allowance(address,address)')[:4]
+    DECIMALS_SELECTOR = Web3.keccak(text='decimals()')[:4]
+    GET_ETH_BALANCE_SELECTOR = Web3.keccak(text='getEthBalance(address)')[:4]
+
+    def __init__(
+        self,
+        account_manager: AccountManager,
+        chunk_size: int | None = None
+    ) -> None:
+        self.account_manager = account_manager
+        self.chunk_size = chunk_size or self.CHUNK_SIZE
+        self.address = Web3.to_checksum_address(
+            self.ADDRESSES.get(account_manager.network.name, self.DEFAULT_ADDRESS)
+        )
+
+    @property
+    def contract(self) -> AsyncContract:
+        return ContractCache.get_contract(
+            w3=self.account_manager.w3, address=self.address, abi=DefaultAbis.Multicall3
+        )
+
+    async def aggregate(
+        self,
+        calls: list[tuple[ChecksumAddress, bytes]]
+    ) -> list[tuple[bool, bytes]]:
+        """
+        Execute the calls via `aggregate3`, allowing every call to fail on its own.
+
+        Args:
+            calls (list[tuple[ChecksumAddress, bytes]]): the (target, calldata) pairs.
+
+        Returns:
+            list[tuple[bool, bytes]]: the (success, return data) pairs in the order of the calls.
+
+        """
+        chunks = [
+            calls[i:i + self.chunk_size]
+            for i in range(0, len(calls), self.chunk_size)
+        ]
+        results = await asyncio.gather(*(
+            self.contract.functions.aggregate3([
+                (target, True, call_data) for target, call_data in chunk
+            ]).call()
+            for chunk in chunks
+        ))
+
+        return [
+            (success, return_data)
+            for chunk_result in results
+            for success, return_data in chunk_result
+        ]
+
+    async def get_balances(
+        self,
+        token_contracts: list[ParamsTypes.TokenContract],
+        owners: list[ParamsTypes.Address]
+    ) -> dict[ChecksumAddress, dict[ChecksumAddress, TokenAmount | None]]:
+        """
+        Get balances of every owner for every token.
+
+        Native tokens are read with `getEthBalance` of the Multicall3 contract.
+
+        Args:
+            token_contracts (list[TokenContract | NativeTokenContract]): the tokens.
+            owners (list[str | Address | ChecksumAddress | ENS]): the owners.
+
+        Returns:
+            dict[ChecksumAddress, dict[ChecksumAddress, TokenAmount | None]]:
+                owner -> token address -> balance (None if the call or
+                the decimals fetch failed).
+
+        Example:
+        ```python
+        balances = await client.multicall.get_balances(
+            token_contracts=ZkSyncTokenContracts.get_tokens(),
+            owners=addresses
+        )
+        ```
+        """
+        owners = [Web3.to_checksum_address(owner) for owner in owners]
+        await self.fill_decimals(token_contracts)
+
+        calls = []
+        for owner in owners:
+            encoded_owner = abi.encode(['address'], [owner])
+            for token_contract in token_contracts:
+                if token_contract.is_native_token:
+                    calls.append((
+                        self.address,
+                        self.GET_ETH_BALANCE_SELECTOR + encoded_owner
+                    ))
+                else:
+                    calls.append((
+                        token_contract.address,
+                        self.BALANCE_OF_SELECTOR + encoded_owner
+                    ))
+
+        results = iter(await self.aggregate(calls))
+        balances = {}
+        for owner in owners:
+            balances[owner] = {
+                token_contract.address: self._decode_amount(
+                    result=next(results), decimals=token_contract.decimals
+                )
+                for token_contract in token_contracts
+            }
+
+        return balances
+
+    async def get_allowances(
+        self,
+        token_contracts: list[TokenContract],
+        owners: list[ParamsTypes.Address],
+        spender_address: ParamsTypes.Address
+    ) -> dict[ChecksumAddress, dict[ChecksumAddress, TokenAmount | None]]:
+        """
+        Get approved amounts of every owner for every token to the spender.
+
+        Args:
+            token_contracts (list[TokenContract]): the tokens.
+            owners (list[str | Address | ChecksumAddress | ENS]): the owners.
+            spender_address (str | Address | ChecksumAddress | ENS): the spender.
+
+        Returns:
+            dict[ChecksumAddress, dict[ChecksumAddress, TokenAmount | None]]:
+                owner -> token address -> approved amount (None if the call
+                or the decimals fetch failed).
+
+        """
+        owners = [Web3.to_checksum_address(owner) for owner in owners]
+        spender_address = Web3.to_checksum_address(spender_address)
+        await self.fill_decimals(token_contracts)
+
+        calls = [
+            (
+                token_contract.address,
+                self.ALLOWANCE_SELECTOR + abi.encode(
+                    ['address', 'address'], [owner, spender_address]
+                )
+            )
+            for owner in owners
+            for token_contract in token_contracts
+        ]
+
+        results = iter(await self.aggregate(calls))
+        allowances = {}
+        for owner in owners:
+            allowances[owner] = {
+                token_contract.address: self._decode_amount(
+                    result=next(results), decimals=token_contract.decimals
+                )
+                for token_contract in token_contracts
+            }
+
+        return allowances
+
+    async def fill_decimals(
+        self,
+        token_contracts: list[ParamsTypes.TokenContract]
+    ) -> None:
+        """
+        Fetch the missing decimals of the tokens in one multicall and save them to the tokens.
+
+        Decimals already known to the TokenMetadataCache are not fetched again.
+
+        Args:
+            token_contracts (list[TokenContract | NativeTokenContract]): the tokens.
+
+        """
+        await self.account_manager.network.resolve()
+        chain_id = self.account_manager.network.chain_id
+        missing = {}
+        for token_contract in token_contracts:
+            if token_contract.decimals is not None:
+                continue
+
+            if token_contract.is_native_token:
+                token_contract.decimals = self.account_manager.network.decimals
+                continue
+
+            metadata = TokenMetadataCache.get(
+                chain_id=chain_id, address=token_contract.address
+            )
+            if metadata and metadata.decimals is not None:
+                token_contract.decimals = metadata.decimals
+            else:
+                missing.setdefault(token_contract.address, []).append(token_contract)
+
+        if not missing:
+            return
+
+        results = await self.aggregate([
+            (address, self.DECIMALS_SELECTOR) for address in missing
+        ])
+        for (address, contracts), (success, return_data) in zip(missing.items(), results):
+            if not success or not return_data:
+                continue
+
+            decimals = abi.decode(['uint256'], return_data)[0]
+            TokenMetadataCache.update(
+                chain_id=chain_id, address=address, decimals=decimals
+            )
+            for token_contract in contracts:
+                token_contract.decimals = decimals
+
+    @staticmethod
+    def _decode_amount(
+        result: tuple[bool, bytes],
+        decimals: int | None
+    ) -> TokenAmount | None:
+        success, return_data = result
+        # without the decimals the amount can not be scaled, so it is not guessed
+        if not success or not return_data or decimals is None:
+            return None
+
+        amount = abi.decode(['uint256'], return_data)[0]
+
+        return TokenAmount(amount=amount, decimals=decimals, wei=True)
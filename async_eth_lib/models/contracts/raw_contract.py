@@ -1,5 +1,3 @@
-import json
-
 from web3 import (
     Web3,
     types
@@ -7,6 +5,7 @@ from web3 import (
 from typing import Any
 from eth_typing import ChecksumAddress
 
+from async_eth_lib.models.contracts.abi_registry import AbiRegistry
 from async_eth_lib.models.others.common import AutoRepr
 from async_eth_lib.models.others.dataclasses import DefaultAbis
 
@@ -18,19 +17,18 @@ class RawContract(AutoRepr):
     Attributes:
         title (str): a contract title.
         address (ChecksumAddress): a contract address.
-        abi (list[dict[str, Any]] | str): an ABI of the contract.
-        is_native_token (bool): is this contract native token of network (False)
+        abi (list[dict[str, Any]]): an ABI of the contract.
 
     """
     title: str
     address: ChecksumAddress
-    abi: list[dict[str, Any]]
 
     def __init__(
         self,
         title: str,
         address: str | types.Address | types.ChecksumAddress | types.ENS,
-        abi: list[dict[str, Any]] | str
+        abi: list[dict[str, Any]] | str | None = None,
+        abi_path: str | tuple | list | None = None
     ) -> None:
         """
         Initialize the class.
@@ -38,12 +36,28 @@ class RawContract(AutoRepr):
         Args:
             title (str): a contract title.
             address (str): a contract address.
-            abi (Union[List[Dict[str, Any]], str]): an ABI of the contract.
-            is_native_token (bool): is this contract native token of network (False)
+            abi (list[dict[str, Any]] | str | None): an ABI of the contract (default is None).
+            abi_path (str | tuple | list | None): a path to the ABI JSON file,
+                which is read on the first access to `abi` (default is None).
         """
         self.title = title
         self.address = Web3.to_checksum_address(address)
-        self.abi = json.loads(abi) if isinstance(abi, str) else abi
+        self._abi = abi
+        self._abi_path = abi_path
+
+    @property
+    def abi(self) -> list[dict[str, Any]] | None:
+        if self._abi is None and self._abi_path:
+            self._abi = AbiRegistry.get_abi(path=self._abi_path)
+
+        elif isinstance(self._abi, str):
+            self._abi = AbiRegistry.register(abi=self._abi)
+
+        return self._abi
+
+    @abi.setter
+    def abi(self, abi: list[dict[str, Any]] | str | None) -> None:
+        self._abi = abi
 
 
 class TokenContract(RawContract):
@@ -51,14 +65,19 @@ class TokenContract(RawContract):
         self,
         title: str,
         address: str | types.Address | types.ChecksumAddress | types.ENS,
-        abi: list[dict[str, Any]] | str = DefaultAbis.Token,
+        abi: list[dict[str, Any]] | str | None = None,
         decimals: int | None = None,
-        is_native_token: bool = False
+        is_native_token: bool = False,
+        abi_path: str | tuple | list | None = None
     ) -> None:
+        if abi is None and not abi_path:
+            abi = DefaultAbis.Token
+
         super().__init__(
             title=title,
             address=address,
-            abi=abi
+            abi=abi,
+            abi_path=abi_path
         )
         self.decimals = decimals
         self.is_native_token = is_native_token
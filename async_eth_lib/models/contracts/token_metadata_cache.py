@@ -0,0 +1,187 @@
+import asyncio
+import atexit
+import json
+import os
+from pathlib import Path
+
+from web3 import Web3
+
+from async_eth_lib.models.others.common import AutoRepr
+from async_eth_lib.models.others.params_types import ParamsTypes
+
+
+class TokenMetadata(AutoRepr):
+    """
+    Immutable facts about a token.
+
+    Attributes:
+        decimals (int | None): the token decimals.
+        symbol (str | None): the token symbol.
+        name (str | None): the token name.
+
+    """
+
+    def __init__(
+        self,
+        decimals: int | None = None,
+        symbol: str | None = None,
+        name: str | None = None
+    ) -> None:
+        self.decimals = decimals
+        self.symbol = symbol
+        self.name = name
+
+
+class TokenMetadataCache:
+    """
+    A process-wide cache of token metadata keyed by chain id and token address.
+
+    The cache lives in memory; call `load()` to also persist it to a JSON file,
+    so the metadata survives restarts. Inside an event loop the changes are
+    written at most once per SAVE_DELAY seconds in a worker thread, and the
+    pending changes are flushed at exit.
+    """
+    FOLDER_NAME: str = 'user_data/cache'
+    FILE_NAME: str = 'token_metadata.json'
+    FILE_PATH: str | None = None
+    SAVE_DELAY: float = 5.
+    METADATA: dict[str, TokenMetadata] = {}
+    _is_dirty: bool = False
+    _save_task: asyncio.Task | None = None
+
+    @staticmethod
+    def _get_key(chain_id: int, address: ParamsTypes.Address) -> str:
+        return f'{chain_id}:{Web3.to_checksum_address(address)}'
+
+    @classmethod
+    def get(
+        cls,
+        chain_id: int,
+        address: ParamsTypes.Address
+    ) -> TokenMetadata | None:
+        """
+        Get the cached metadata of a token.
+
+        Args:
+            chain_id (int): the chain id of the token network.
+            address (str | Address | ChecksumAddress | ENS): the token address.
+
+        Returns:
+            TokenMetadata | None: the metadata or None if it is not cached.
+
+        """
+        return cls.METADATA.get(cls._get_key(chain_id, address))
+
+    @classmethod
+    def update(
+        cls,
+        chain_id: int,
+        address: ParamsTypes.Address,
+        **fields
+    ) -> TokenMetadata:
+        """
+        Save the known fields of token metadata to the cache.
+
+        Args:
+            chain_id (int): the chain id of the token network.
+            address (str | Address | ChecksumAddress | ENS): the token address.
+            **fields: `decimals`, `symbol` and/or `name` values.
+
+        Returns:
+            TokenMetadata: the updated metadata.
+
+        """
+        key = cls._get_key(chain_id, address)
+        metadata = cls.METADATA.setdefault(key, TokenMetadata())
+
+        is_changed = False
+        for field, value in fields.items():
+            if value is not None and getattr(metadata, field) != value:
+                setattr(metadata, field, value)
+                is_changed = True
+
+        if is_changed and cls.FILE_PATH:
+            cls._schedule_save()
+
+        return metadata
+
+    @classmethod
+    def load(cls, path: str | None = None) -> None:
+        """
+        Enable the on-disk persistence and load the previously saved metadata.
+
+        Args:
+            path (str | None): a JSON file path (default is 'user_data/cache/token_metadata.json').
+
+        """
+        if not cls.FILE_PATH:
+            atexit.register(cls.save)
+        cls.FILE_PATH = path or os.path.join(cls.FOLDER_NAME, cls.FILE_NAME)
+
+        if not os.path.exists(cls.FILE_PATH):
+            return
+
+        with open(cls.FILE_PATH, 'r') as file:
+            saved_metadata = json.load(file)
+
+        for key, fields in saved_metadata.items():
+            cls.METADATA.setdefault(key, TokenMetadata(**fields))
+
+    @classmethod
+    def save(cls) -> None:
+        """Write the pending changes to the JSON file enabled by `load()`."""
+        if not cls.FILE_PATH or not cls._is_dirty:
+            return
+
+        cls._write(cls.FILE_PATH, cls._get_snapshot())
+
+    @classmethod
+    async def flush(cls) -> None:
+        """Write the pending changes now without blocking the event loop."""
+        if cls._save_task and not cls._save_task.done():
+            cls._save_task.cancel()
+        cls._save_task = None
+
+        if not cls.FILE_PATH or not cls._is_dirty:
+            return
+
+        try:
+            await asyncio.to_thread(cls._write, cls.FILE_PATH, cls._get_snapshot())
+        except Exception:
+            cls._is_dirty = True
+            raise
+
+    @classmethod
+    def _schedule_save(cls) -> None:
+        cls._is_dirty = True
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            cls.save()
+            return
+
+        if not cls._save_task or cls._save_task.done():
+            cls._save_task = asyncio.ensure_future(cls._save_later())
+
+    @classmethod
+    async def _save_later(cls) -> None:
+        await asyncio.sleep(cls.SAVE_DELAY)
+        cls._save_task = None
+        await cls.flush()
+
+    @classmethod
+    def _get_snapshot(cls) -> dict[str, dict]:
+        # taken in the event loop thread, so the writer thread never sees a changing dict
+        cls._is_dirty = False
+
+        return {key: dict(vars(metadata)) for key, metadata in cls.METADATA.items()}
+
+    @staticmethod
+    def _write(path: str, snapshot: dict[str, dict]) -> None:
+        # a crash while writing leaves the previous file intact
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w') as file:
+            json.dump(snapshot, file, indent=2)
+        os.replace(tmp_path, path)
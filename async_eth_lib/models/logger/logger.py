@@ -1,15 +1,97 @@
-import inspect
+import atexit
 import logging
 import os
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 from async_eth_lib.models.others.constants import LogStatus
 
 
+class BufferedFileHandler(logging.FileHandler):
+    """
+    A file handler which does not flush the file after every record.
+
+    The buffered records are written when the BufferedQueueListener runs out
+    of queued records, when the handler is closed or on errors.
+    """
+
+    def flush(self) -> None:
+        pass
+
+    def flush_buffer(self) -> None:
+        super().flush()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        super().emit(record)
+        if record.levelno >= logging.ERROR:
+            self.flush_buffer()
+
+    def close(self) -> None:
+        self.flush_buffer()
+        super().close()
+
+
+class AccountFileHandler(logging.Handler):
+    """Writes the records of accounts with their own log files to these files."""
+
+    def __init__(self, folder_name: str, formatter: logging.Formatter) -> None:
+        super().__init__(level=logging.INFO)
+        self.folder_name = folder_name
+        self.account_formatter = formatter
+        self.handlers: dict[str, BufferedFileHandler] = {}
+
+    def emit(self, record: logging.LogRecord) -> None:
+        account_log_id = getattr(record, 'account_log_id', None)
+        if account_log_id is None:
+            return
+
+        if account_log_id not in self.handlers:
+            handler = BufferedFileHandler(
+                f"{self.folder_name}/log_{account_log_id}.log"
+            )
+            handler.setFormatter(self.account_formatter)
+            self.handlers[account_log_id] = handler
+
+        self.handlers[account_log_id].handle(record)
+
+    def flush_buffer(self) -> None:
+        for handler in self.handlers.values():
+            handler.flush_buffer()
+
+    def close(self) -> None:
+        for handler in self.handlers.values():
+            handler.close()
+        super().close()
+
+
+class BufferedQueueListener(QueueListener):
+    """A queue listener which flushes the buffered files once the queue is empty."""
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            for handler in self.handlers:
+                if hasattr(handler, 'flush_buffer'):
+                    handler.flush_buffer()
+
+            return self.queue.get(block)
+
+
 class CustomLogger:
+    """
+    Logs messages of an account to the console, 'main.log' and optionally its own file.
+
+    The records are only put into a queue in the calling thread; formatting
+    and writing are done by a listener thread, so logging does not block
+    the event loop.
+    """
     FOLDER_NAME: str = 'user_data/logs'
     LOGGERS: dict[str, logging.Logger] = {}
+    QUEUE: queue.SimpleQueue = queue.SimpleQueue()
+    LISTENER: BufferedQueueListener | None = None
 
     def __init__(
         self,
@@ -30,7 +112,8 @@ class CustomLogger:
         relative_path = Path(cls.FOLDER_NAME)
         relative_path.mkdir(parents=True, exist_ok=True)
 
-    def get_logging_format(self) -> dict:
+    @staticmethod
+    def get_logging_format() -> dict:
         log_format_dict = {
             'log_format': (
                 CustomLogDataAndRecord.LOG_TIME 
@@ -42,71 +125,88 @@ class CustomLogger:
 
         return log_format_dict
 
-    def _initialize_main_log(self) -> logging.Logger:
-        if 'main_logger' not in self.LOGGERS:
-            main_logger = logging.getLogger("main")
-            main_logger.setLevel(logging.DEBUG)
-            log_format_dict = self.get_logging_format()
-
-            console_handler = logging.StreamHandler(sys.stderr)
-            console_handler.setLevel(logging.INFO)
-            console_handler.setFormatter(logging.Formatter(
-                log_format_dict['log_format'],
-                datefmt=log_format_dict['datafmt']
-            ))
-            main_logger.addHandler(console_handler)
-
-            file_handler = logging.FileHandler(f"main.log")
-            file_handler.setLevel(logging.INFO)
-            file_handler.setFormatter(logging.Formatter(
-                log_format_dict['log_format'],
-                datefmt=log_format_dict['datafmt']
-            ))
-            main_logger.addHandler(file_handler)
-            main_logger.handlers[0].setFormatter(
-                CustomLogDataAndRecord(log_format_dict['log_format'])
-            )
-
+    @classmethod
+    def _initialize_main_log(cls) -> logging.Logger:
+        if 'main_logger' not in cls.LOGGERS:
             logging.addLevelName(210, LogStatus.APPROVED)
             logging.addLevelName(201, LogStatus.MINTED)
             logging.addLevelName(202, LogStatus.BRIDGED)
             logging.addLevelName(203, LogStatus.SWAPPED)
             logging.addLevelName(204, LogStatus.FAILED)
 
-            self.LOGGERS["main_logger"] = main_logger
+            main_logger = logging.getLogger("main")
+            main_logger.setLevel(logging.DEBUG)
+            main_logger.addHandler(QueueHandler(cls.QUEUE))
+            cls.start_listener()
+
+            cls.LOGGERS["main_logger"] = main_logger
 
-        return self.LOGGERS["main_logger"]
+        return cls.LOGGERS["main_logger"]
 
-    def _initialize_account_log(self, account_id: str) -> logging.Logger:
-        if account_id not in self.LOGGERS:
-            wallet_logger = logging.getLogger(
-                f'{self.FOLDER_NAME}/log_{account_id}'
-            )
-            wallet_logger.setLevel(logging.DEBUG)
-            log_format_dict = self.get_logging_format()
+    @classmethod
+    def start_listener(cls) -> None:
+        """Start the thread which writes the queued records."""
+        if cls.LISTENER:
+            return
 
-            file_handler = logging.FileHandler(
-                f"{self.FOLDER_NAME}/log_{account_id}.log"
-            )
-            file_handler.setLevel(logging.INFO)
-            file_handler.setFormatter(CustomAccountLogFormatter(
+        log_format_dict = cls.get_logging_format()
+
+        console_handler = logging.StreamHandler(sys.stderr)
+        console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(
+            CustomLogDataAndRecord(log_format_dict['log_format'])
+        )
+
+        file_handler = BufferedFileHandler(f"main.log")
+        file_handler.setLevel(logging.INFO)
+        file_handler.setFormatter(logging.Formatter(
+            log_format_dict['log_format'],
+            datefmt=log_format_dict['datafmt']
+        ))
+
+        account_file_handler = AccountFileHandler(
+            folder_name=cls.FOLDER_NAME,
+            formatter=CustomAccountLogFormatter(
                 log_format_dict['log_format'],
                 datefmt=log_format_dict['datafmt']
-            ))
-            wallet_logger.addHandler(file_handler)
+            )
+        )
 
-            self.LOGGERS[account_id] = wallet_logger
+        cls.LISTENER = BufferedQueueListener(
+            cls.QUEUE,
+            console_handler,
+            file_handler,
+            account_file_handler,
+            respect_handler_level=True
+        )
+        cls.LISTENER.start()
+        atexit.register(cls.stop_listener)
 
-        return self.LOGGERS[account_id]
+    @classmethod
+    def stop_listener(cls) -> None:
+        """Write the queued records, then stop the listener thread and close the files."""
+        if not cls.LISTENER:
+            return
+
+        cls.LISTENER.stop()
+        for handler in cls.LISTENER.handlers:
+            handler.close()
+        cls.LISTENER = None
+        cls.LOGGERS.pop("main_logger", None)
+        logging.getLogger("main").handlers.clear()
 
     def log_message(self, status: str, message: str) -> None:
-        caller_frame = inspect.currentframe().f_back
+        caller_frame = sys._getframe(1)
         calling_line = f"{caller_frame.f_code.co_filename}:{caller_frame.f_lineno}"
         message_with_calling_line = f"{calling_line} - {message}"
         extra = {
             "account_id": self.account_id,
             "address": self.masked_address,
-            "network": self.network
+            "network": self.network,
+            # the listener also writes the record to the account file
+            "account_log_id": (
+                str(self.account_id) if self.create_log_file_per_account else None
+            )
         }
 
         main_logger = self._initialize_main_log()
@@ -116,14 +216,6 @@ class CustomLogger:
             extra=extra
         )
 
-        if self.create_log_file_per_account:
-            logger = self._initialize_account_log(self.account_id)
-            logger.log(
-                level=logging.getLevelName(status),
-                msg=message_with_calling_line,
-                extra=extra
-            )
-
 
 class CustomLogFormattedRecord(logging.Formatter):
     def __init__(self, *args, **kwargs):
@@ -176,14 +268,18 @@ class CustomLogDataAndRecord(CustomLogFormattedRecord):
         LogStatus.FAILED: RED + LOG_LEVELNAME_FORMAT + RESET 
     }
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.formatters = {
+            levelname: logging.Formatter(
+                self.LOG_TIME + level_format + self.LOG_MESSAGE
+            )
+            for levelname, level_format in self.FORMATS.items()
+        }
+
     def format(self, record):
         record = self.format_message(record)
-
-        levelname = record.levelname
-        if levelname in self.FORMATS:
-            formatted_message = self.LOG_TIME + \
-                self.FORMATS[levelname] + self.LOG_MESSAGE
-            formatter = logging.Formatter(formatted_message)
+        formatter = self.formatters.get(record.levelname, super())
 
         return formatter.format(record)
 
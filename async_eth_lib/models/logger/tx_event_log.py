@@ -0,0 +1,132 @@
+import atexit
+import gzip
+import json
+import logging
+import os
+import queue
+import shutil
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+from typing import Any
+
+from hexbytes import HexBytes
+
+
+class TxEventLog:
+    """
+    A JSON Lines log of transaction lifecycle events for offline analysis.
+
+    Every event is one JSON object with its UNIX time, name and fields.
+    The lines are written by a listener thread into a rotating file, and
+    the rotated files can be compressed with gzip. The log is disabled
+    until `enable()` is called.
+
+    Example:
+    ```python
+    TxEventLog.enable(max_bytes=50 * 1024 * 1024, compress=True)
+    ```
+    """
+    FOLDER_NAME: str = 'user_data/events'
+    FILE_NAME: str = 'tx_events.jsonl'
+    MAX_BYTES: int = 50 * 1024 * 1024
+    BACKUP_COUNT: int = 10
+    LOGGER_NAME: str = 'tx_events'
+    QUEUE: queue.SimpleQueue = queue.SimpleQueue()
+    LISTENER: QueueListener | None = None
+    is_enabled: bool = False
+
+    @classmethod
+    def enable(
+        cls,
+        path: str | None = None,
+        max_bytes: int | None = None,
+        backup_count: int | None = None,
+        compress: bool = False
+    ) -> None:
+        """
+        Start writing the events.
+
+        Args:
+            path (str | None): the log file path (default is 'user_data/events/tx_events.jsonl').
+            max_bytes (int | None): the file size to rotate at (default is TxEventLog.MAX_BYTES).
+            backup_count (int | None): the number of rotated files to keep
+                (default is TxEventLog.BACKUP_COUNT).
+            compress (bool): whether to gzip the rotated files (default is False).
+
+        """
+        if cls.is_enabled:
+            return
+
+        path = path or os.path.join(cls.FOLDER_NAME, cls.FILE_NAME)
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        file_handler = RotatingFileHandler(
+            path,
+            maxBytes=max_bytes or cls.MAX_BYTES,
+            backupCount=backup_count or cls.BACKUP_COUNT,
+            encoding='utf-8'
+        )
+        file_handler.setFormatter(logging.Formatter('%(message)s'))
+        if compress:
+            file_handler.namer = cls._get_compressed_name
+            file_handler.rotator = cls._compress
+
+        logger = logging.getLogger(cls.LOGGER_NAME)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        logger.addHandler(QueueHandler(cls.QUEUE))
+
+        cls.LISTENER = QueueListener(cls.QUEUE, file_handler)
+        cls.LISTENER.start()
+        cls.is_enabled = True
+        atexit.register(cls.disable)
+
+    @classmethod
+    def disable(cls) -> None:
+        """Write the queued events and stop writing."""
+        if not cls.is_enabled:
+            return
+
+        cls.is_enabled = False
+        logging.getLogger(cls.LOGGER_NAME).handlers.clear()
+        cls.LISTENER.stop()
+        for handler in cls.LISTENER.handlers:
+            handler.close()
+        cls.LISTENER = None
+
+    @classmethod
+    def emit(cls, event: str, **fields) -> None:
+        """
+        Write an event, if the log is enabled.
+
+        Args:
+            event (str): a TxEventType value.
+            **fields: the event fields; bytes values are written as hex strings.
+
+        """
+        if not cls.is_enabled:
+            return
+
+        record = {'time': time.time(), 'event': event, **fields}
+        logging.getLogger(cls.LOGGER_NAME).info(
+            json.dumps(record, default=cls._to_json)
+        )
+
+    @staticmethod
+    def _to_json(value: Any) -> Any:
+        if isinstance(value, (bytes, HexBytes)):
+            return HexBytes(value).hex()
+
+        return str(value)
+
+    @staticmethod
+    def _get_compressed_name(name: str) -> str:
+        return f'{name}.gz'
+
+    @staticmethod
+    def _compress(source: str, destination: str) -> None:
+        with open(source, 'rb') as source_file:
+            with gzip.open(destination, 'wb') as destination_file:
+                shutil.copyfileobj(source_file, destination_file)
+        os.remove(source)
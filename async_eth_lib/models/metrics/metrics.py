@@ -0,0 +1,231 @@
+import bisect
+import math
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from aiohttp import web
+
+
+class Histogram:
+    """
+    A histogram of durations with fixed buckets.
+
+    Quantiles are interpolated within the buckets, so the memory does not
+    grow with the number of observations.
+
+    Attributes:
+        bucket_counts (list[int]): the number of observations per bucket.
+        count (int): the number of observations.
+        sum (float): the sum of the observations.
+        min (float): the smallest observation.
+        max (float): the largest observation.
+
+    """
+    BUCKETS: tuple[float, ...] = (
+        0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25,
+        0.5, 1., 2.5, 5., 10., 30., 60., 120., math.inf
+    )
+
+    def __init__(self) -> None:
+        self.bucket_counts = [0] * len(self.BUCKETS)
+        self.count = 0
+        self.sum = 0.
+        self.min = math.inf
+        self.max = 0.
+
+    def observe(self, value: float) -> None:
+        self.bucket_counts[bisect.bisect_left(self.BUCKETS, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def get_quantile(self, quantile: float) -> float | None:
+        """
+        Estimate a quantile of the observations.
+
+        Args:
+            quantile (float): the quantile from 0 to 1.
+
+        Returns:
+            float | None: the estimate or None if there are no observations.
+
+        """
+        if not self.count:
+            return None
+
+        rank = quantile * self.count
+        cumulative_count = 0
+        for i, bucket_count in enumerate(self.bucket_counts):
+            if cumulative_count + bucket_count >= rank and bucket_count:
+                lower = self.BUCKETS[i - 1] if i else 0.
+                upper = min(self.BUCKETS[i], self.max)
+                lower = max(lower, self.min)
+                share = (rank - cumulative_count) / bucket_count
+                return lower + (upper - lower) * share
+
+            cumulative_count += bucket_count
+
+        return self.max
+
+    def get_snapshot(self) -> dict[str, float | int | None]:
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'avg': self.sum / self.count if self.count else None,
+            'min': self.min if self.count else None,
+            'max': self.max if self.count else None,
+            'p50': self.get_quantile(0.5),
+            'p95': self.get_quantile(0.95),
+            'p99': self.get_quantile(0.99),
+        }
+
+
+class Metrics:
+    """
+    A process-wide registry of latency histograms.
+
+    Histograms are identified by a metric name and labels, e.g.
+    `tx_phase_seconds{phase="estimate_gas", chain_id="324"}`.
+
+    Example:
+    ```python
+    with Metrics.span('tx_phase_seconds', phase='sign', chain_id=324):
+        signed_tx = ...
+
+    print(client.metrics)
+    print(Metrics.to_prometheus())
+    ```
+    """
+    TX_PHASE: str = 'tx_phase_seconds'
+    RPC_REQUEST: str = 'rpc_request_seconds'
+    HISTOGRAMS: dict[tuple[str, tuple[tuple[str, str], ...]], Histogram] = {}
+
+    @classmethod
+    def observe(cls, name: str, value: float, **labels) -> None:
+        """
+        Add an observation to a histogram.
+
+        Args:
+            name (str): the metric name.
+            value (float): the observed duration in seconds.
+            **labels: the label values of the histogram.
+
+        """
+        key = (
+            name,
+            tuple(sorted((label, str(label_value)) for label, label_value in labels.items()))
+        )
+        histogram = cls.HISTOGRAMS.get(key)
+        if not histogram:
+            histogram = cls.HISTOGRAMS[key] = Histogram()
+
+        histogram.observe(value)
+
+    @classmethod
+    @contextmanager
+    def span(cls, name: str, **labels) -> Iterator[None]:
+        """Observe the duration of the block, including the time of failed blocks."""
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            cls.observe(name, time.perf_counter() - start_time, **labels)
+
+    @classmethod
+    def snapshot(cls, **labels) -> dict[str, list[dict]]:
+        """
+        Get the statistics of the histograms.
+
+        Args:
+            **labels: optional label values the histograms must have.
+
+        Returns:
+            dict[str, list[dict]]: the labels and statistics of the histograms by metric names.
+
+        """
+        snapshot = {}
+        for (name, histogram_labels), histogram in cls.HISTOGRAMS.items():
+            label_dict = dict(histogram_labels)
+            if any(
+                label_dict.get(label) != str(label_value)
+                for label, label_value in labels.items()
+            ):
+                continue
+
+            snapshot.setdefault(name, []).append({
+                'labels': label_dict,
+                **histogram.get_snapshot()
+            })
+
+        return snapshot
+
+    @classmethod
+    def reset(cls) -> None:
+        cls.HISTOGRAMS.clear()
+
+    @classmethod
+    def to_prometheus(cls) -> str:
+        """Render the histograms in the Prometheus text exposition format."""
+        lines = []
+        written_names = set()
+
+        for (name, labels), histogram in sorted(cls.HISTOGRAMS.items()):
+            if name not in written_names:
+                lines.append(f'# TYPE {name} histogram')
+                written_names.add(name)
+
+            cumulative_count = 0
+            for bucket, bucket_count in zip(Histogram.BUCKETS, histogram.bucket_counts):
+                cumulative_count += bucket_count
+                bucket_labels = (*labels, ('le', '+Inf' if bucket == math.inf else repr(bucket)))
+                lines.append(
+                    f'{name}_bucket{cls._format_labels(bucket_labels)} {cumulative_count}'
+                )
+
+            lines.append(f'{name}_sum{cls._format_labels(labels)} {histogram.sum}')
+            lines.append(f'{name}_count{cls._format_labels(labels)} {histogram.count}')
+
+        return '\n'.join(lines) + '\n'
+
+    @classmethod
+    async def serve(cls, host: str = '127.0.0.1', port: int = 9100) -> web.AppRunner:
+        """
+        Serve the histograms for Prometheus at http://host:port/metrics.
+
+        Args:
+            host (str): the host to listen on (default is '127.0.0.1').
+            port (int): the port to listen on (default is 9100).
+
+        Returns:
+            web.AppRunner: the runner of the server, call its `cleanup()` to stop the server.
+
+        """
+        async def handle_metrics(request: web.Request) -> web.Response:
+            return web.Response(
+                text=cls.to_prometheus(), content_type='text/plain', charset='utf-8'
+            )
+
+        app = web.Application()
+        app.router.add_get('/metrics', handle_metrics)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, host, port).start()
+
+        return runner
+
+    @staticmethod
+    def _format_labels(labels: tuple[tuple[str, str], ...]) -> str:
+        if not labels:
+            return ''
+
+        formatted_labels = ','.join(
+            '{}="{}"'.format(
+                label,
+                value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+            )
+            for label, value in labels
+        )
+
+        return f'{{{formatted_labels}}}'
@@ -0,0 +1,133 @@
+import asyncio
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from aiohttp import ClientTimeout
+
+from async_eth_lib.models.providers.provider_pool import ProviderPool
+
+
+class ChainRegistry:
+    """
+    A registry of native currencies of chains indexed by chain id.
+
+    The chains list of CHAINS_URL is downloaded and parsed at most once,
+    only when a chain is missing from the registry, and its compact index
+    is saved to disk, so later runs never download it again.
+    """
+    CHAINS_URL: str = 'https://chainid.network/chains.json'
+    TIMEOUT: float = 30
+    FOLDER_NAME: str = 'user_data/cache'
+    FILE_NAME: str = 'chains.json'
+    CHAINS: dict[int, dict[str, Any]] = {}
+    is_loaded: bool = False
+    is_fetched: bool = False
+    _fetch: asyncio.Future | None = None
+
+    @classmethod
+    def get_file_path(cls) -> str:
+        return os.path.join(cls.FOLDER_NAME, cls.FILE_NAME)
+
+    @classmethod
+    def get_chain(cls, chain_id: int) -> dict[str, Any] | None:
+        """
+        Get a chain from the registry without any network requests.
+
+        Args:
+            chain_id (int): the chain id.
+
+        Returns:
+            dict[str, Any] | None: the chain with `name`, `symbol` and `decimals`
+                or None if it is not known yet.
+
+        """
+        if not cls.is_loaded:
+            cls.load()
+
+        return cls.CHAINS.get(chain_id)
+
+    @classmethod
+    async def fetch_chain(cls, chain_id: int) -> dict[str, Any] | None:
+        """
+        Get a chain, downloading the chains list once if it is missing from the registry.
+
+        Args:
+            chain_id (int): the chain id.
+
+        Returns:
+            dict[str, Any] | None: the chain with `name`, `symbol` and `decimals`
+                or None if the chain is unknown.
+
+        """
+        chain = cls.get_chain(chain_id)
+        if chain or cls.is_fetched:
+            return chain
+
+        if not cls._fetch:
+            cls._fetch = asyncio.ensure_future(cls._download())
+            cls._fetch.add_done_callback(cls._on_fetched)
+
+        await asyncio.shield(cls._fetch)
+
+        return cls.CHAINS.get(chain_id)
+
+    @classmethod
+    def load(cls) -> None:
+        """Load the saved index of chains."""
+        cls.is_loaded = True
+        file_path = cls.get_file_path()
+
+        if not os.path.exists(file_path):
+            return
+
+        with open(file_path, 'r') as file:
+            saved_chains = json.load(file)
+
+        for chain_id, chain in saved_chains.items():
+            cls.CHAINS.setdefault(int(chain_id), chain)
+
+    @classmethod
+    def save(cls) -> None:
+        """Write the index of chains to disk."""
+        file_path = cls.get_file_path()
+        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = f'{file_path}.tmp'
+        with open(tmp_path, 'w') as file:
+            json.dump(cls.CHAINS, file)
+        os.replace(tmp_path, file_path)
+
+    @classmethod
+    async def _download(cls) -> None:
+        session = ProviderPool.get_session(rpc=cls.CHAINS_URL)
+
+        async with session.get(
+            cls.CHAINS_URL, timeout=ClientTimeout(cls.TIMEOUT)
+        ) as response:
+            response.raise_for_status()
+            body = await response.read()
+
+        # the chains list is several megabytes, so it is parsed off the event loop
+        cls.CHAINS.update(await asyncio.to_thread(cls._index_chains, body))
+        cls.is_fetched = True
+        await asyncio.get_running_loop().run_in_executor(None, cls.save)
+
+    @staticmethod
+    def _index_chains(body: bytes) -> dict[int, dict[str, Any]]:
+        chains = {}
+        for chain in json.loads(body):
+            native_currency = chain.get('nativeCurrency') or {}
+            chains[chain['chainId']] = {
+                'name': chain.get('name'),
+                'symbol': native_currency.get('symbol'),
+                'decimals': native_currency.get('decimals'),
+            }
+
+        return chains
+
+    @classmethod
+    def _on_fetched(cls, fetch: asyncio.Future) -> None:
+        # a failed download may be retried by the next request
+        cls._fetch = None
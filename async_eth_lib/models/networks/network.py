@@ -1,13 +1,23 @@
-import random
-import requests
+import asyncio
 
-from typing import List
+from typing import Any, List
 from web3 import Web3
+from web3.eth import AsyncEth
 
+from async_eth_lib.models.providers.provider_pool import ProviderPool
 import async_eth_lib.models.others.exceptions as exceptions
+from .chain_registry import ChainRegistry
 
 
 class Network:
+    """
+    An EVM network.
+
+    The chain id, coin symbol and decimals of a custom network may be left
+    out and filled by the awaitable `resolve()`. Reading one of them before
+    the network is resolved raises NetworkNotResolved, so no cache or lock
+    is ever keyed on None.
+    """
     TxPath: str = "/tx/"
     ContractPath: str = "/contract/"
     AddressPath: str = "/address/"
@@ -24,39 +34,129 @@ class Network:
     ) -> None:
         self.name: str = name.lower()
         self.rpc: str | List[str] = rpc
-        self.chain_id: int | None = chain_id
+        self._chain_id: int | None = chain_id
         self.tx_type: int = tx_type
-        self.coin_symbol: str | None = coin_symbol
-        self.decimals: int | None = decimals
+        self._coin_symbol: str | None = coin_symbol
+        self._decimals: int | None = decimals
         self.explorer: str | None = explorer
+        self._resolve_lock: asyncio.Lock | None = None
 
-        self._initialize_chain_id()
         self._initialize_coin_symbol_and_decimals()
         self._coin_symbol_to_upper()
 
-    def _initialize_chain_id(self):
-        if self.chain_id:
+    @property
+    def chain_id(self) -> int:
+        return self._get_resolved('_chain_id')
+
+    @chain_id.setter
+    def chain_id(self, chain_id: int) -> None:
+        self._chain_id = chain_id
+
+    @property
+    def coin_symbol(self) -> str:
+        return self._get_resolved('_coin_symbol')
+
+    @coin_symbol.setter
+    def coin_symbol(self, coin_symbol: str) -> None:
+        self._coin_symbol = coin_symbol
+
+    @property
+    def decimals(self) -> int:
+        return self._get_resolved('_decimals')
+
+    @decimals.setter
+    def decimals(self, decimals: int) -> None:
+        self._decimals = decimals
+
+    @property
+    def is_resolved(self) -> bool:
+        return (
+            self._chain_id is not None
+            and self._coin_symbol is not None
+            and self._decimals is not None
+        )
+
+    async def resolve(self) -> 'Network':
+        """
+        Fill the missing chain id, coin symbol and decimals without blocking the event loop.
+
+        The chain id is requested from the RPC and the coin data is taken
+        from the ChainRegistry. Resolved networks return at once.
+
+        Returns:
+            Network: the network itself.
+
+        """
+        if self.is_resolved:
+            return self
+
+        if not self._resolve_lock:
+            self._resolve_lock = asyncio.Lock()
+
+        async with self._resolve_lock:
+            await self._initialize_chain_id()
+            await self._fetch_coin_symbol_and_decimals()
+            self._coin_symbol_to_upper()
+
+        return self
+
+    def _get_resolved(self, attribute: str) -> Any:
+        value = getattr(self, attribute)
+        if value is None:
+            raise exceptions.NetworkNotResolved(
+                f"The '{self.name}' network {attribute.lstrip('_')} is unknown, "
+                f"await network.resolve() or Client.create() first"
+            )
+
+        return value
+
+    async def _initialize_chain_id(self):
+        if self._chain_id is not None:
             return
         try:
-            self.chain_id = Web3(Web3.HTTPProvider(self.rpc)).eth.chain_id
+            w3 = Web3(
+                ProviderPool.get_provider(rpc=self.rpc),
+                modules={'eth': (AsyncEth,)},
+                middlewares=[]
+            )
+            self._chain_id = await w3.eth.chain_id
         except Exception as err:
             raise exceptions.WrongChainId(f'Can not get chainId: {err}')
 
     def _initialize_coin_symbol_and_decimals(self):
-        if self.coin_symbol and self.decimals:
+        # only the already known chains are filled here, without network requests
+        if (
+            self._coin_symbol is not None and self._decimals is not None
+            or self._chain_id is None
+        ):
+            return
+
+        self._set_coin_symbol_and_decimals(ChainRegistry.get_chain(self._chain_id))
+
+    async def _fetch_coin_symbol_and_decimals(self):
+        if self._coin_symbol is not None and self._decimals is not None:
             return
         try:
-            response = requests.get(
-                'https://chainid.network/chains.json').json()
-            for network in response:
-                if network['chainId'] == self.chain_id:
-                    self.coin_symbol = network['nativeCurrency']['symbol']
-                    self.decimals = network['nativeCurrency']['decimals']
-                    break
+            chain = await ChainRegistry.fetch_chain(self._chain_id)
         except Exception as err:
             raise exceptions.WrongCoinSymbol(
                 f'Can not get coin symbol: {err}')
 
+        if not chain:
+            raise exceptions.WrongCoinSymbol(
+                f'Can not get coin symbol: unknown chainId {self._chain_id}')
+
+        self._set_coin_symbol_and_decimals(chain)
+
+    def _set_coin_symbol_and_decimals(self, chain: dict | None):
+        if not chain:
+            return
+
+        if self._coin_symbol is None:
+            self._coin_symbol = chain['symbol']
+        if self._decimals is None:
+            self._decimals = chain['decimals']
+
     def _coin_symbol_to_upper(self):
-        if self.coin_symbol:
-            self.coin_symbol = self.coin_symbol.upper()
+        if self._coin_symbol:
+            self._coin_symbol = self._coin_symbol.upper()
@@ -42,3 +42,25 @@ class LogStatus:
     MINTED = 'MINTED'
     BRIDGED = 'BRIDGED'
     SWAPPED = 'SWAPPED'
+
+
+class FeeStrategy:
+    SLOW = 'SLOW'
+    NORMAL = 'NORMAL'
+    FAST = 'FAST'
+
+
+class JobStatus:
+    PENDING = 'PENDING'
+    SENT = 'SENT'
+    DONE = 'DONE'
+    FAILED = 'FAILED'
+
+
+class TxEventType:
+    PARAMS_BUILT = 'params_built'
+    SIGNED = 'signed'
+    SENT = 'sent'
+    SEND_FAILED = 'send_failed'
+    RECEIPT = 'receipt'
+    RECEIPT_TIMEOUT = 'receipt_timeout'
@@ -1,9 +1,11 @@
 from dataclasses import dataclass
 
+from async_eth_lib.models.contracts.abi_registry import AbiRegistry
+
 
 @dataclass
 class DefaultAbis:
-    Token = [
+    Token = AbiRegistry.register([
         {
             'constant': True,
             'inputs': [],
@@ -75,7 +77,43 @@ class DefaultAbis:
             'stateMutability': 'nonpayable',
             'type': 'function'
         }
-    ]
+    ])
+
+    Multicall3 = AbiRegistry.register([
+        {
+            'inputs': [
+                {
+                    'components': [
+                        {'name': 'target', 'type': 'address'},
+                        {'name': 'allowFailure', 'type': 'bool'},
+                        {'name': 'callData', 'type': 'bytes'}
+                    ],
+                    'name': 'calls',
+                    'type': 'tuple[]'
+                }
+            ],
+            'name': 'aggregate3',
+            'outputs': [
+                {
+                    'components': [
+                        {'name': 'success', 'type': 'bool'},
+                        {'name': 'returnData', 'type': 'bytes'}
+                    ],
+                    'name': 'returnData',
+                    'type': 'tuple[]'
+                }
+            ],
+            'stateMutability': 'payable',
+            'type': 'function'
+        },
+        {
+            'inputs': [{'name': 'addr', 'type': 'address'}],
+            'name': 'getEthBalance',
+            'outputs': [{'name': 'balance', 'type': 'uint256'}],
+            'stateMutability': 'view',
+            'type': 'function'
+        }
+    ])
 
 
 @dataclass
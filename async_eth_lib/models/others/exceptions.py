@@ -9,6 +9,10 @@ class WrongCoinSymbol(Exception):
     pass
 
 
+class NetworkNotResolved(Exception):
+    pass
+
+
 class ClientException(Exception):
     pass
 
@@ -0,0 +1,292 @@
+import asyncio
+import time
+from typing import Any
+
+from aiohttp import (
+    ClientError,
+    ClientResponseError,
+    ClientSession,
+    ClientTimeout,
+    TCPConnector
+)
+from web3 import AsyncHTTPProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+from async_eth_lib.models.metrics.metrics import Metrics
+from async_eth_lib.models.providers.rate_limiter import RateLimiter
+from async_eth_lib.models.providers.request_batcher import RequestBatcher
+from async_eth_lib.models.providers.rpc_router import RpcRouter
+
+
+class PooledAsyncHTTPProvider(AsyncHTTPProvider):
+    """
+    An AsyncHTTPProvider that sends requests through a session of the ProviderPool.
+
+    Attributes:
+        proxy (str | None): a proxy used for the requests.
+        batcher (RequestBatcher): a batcher of JSON-RPC requests.
+
+    """
+
+    def __init__(
+        self,
+        endpoint_uri: str,
+        proxy: str | None = None,
+        request_kwargs: dict[str, Any] | None = None,
+        batch_window: float | None = None
+    ) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            endpoint_uri (str): an RPC URL.
+            proxy (str | None): a proxy used for the requests (default is None).
+            request_kwargs (dict[str, Any] | None): extra kwargs of every request (default is None).
+            batch_window (float | None): a window to coalesce requests into
+                JSON-RPC batches; None disables auto batching (default is None).
+
+        """
+        self.proxy = proxy
+        super().__init__(endpoint_uri=endpoint_uri, request_kwargs=request_kwargs)
+        self.batcher = RequestBatcher(provider=self, window=batch_window)
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        with Metrics.span(Metrics.RPC_REQUEST, method=method):
+            if self.batcher.is_enabled:
+                return await self.batcher.add_request(method, params)
+
+            request_data = self.encode_rpc_request(method, params)
+            raw_response = await self.make_post_request(data=request_data)
+
+            return self.decode_rpc_response(raw_response)
+
+    async def make_post_request(self, data: bytes) -> bytes:
+        """
+        Post raw JSON-RPC data to the endpoint using the pooled session.
+
+        The calls are counted and wait for the endpoint rate limit, if any.
+
+        Args:
+            data (bytes): an encoded JSON-RPC request.
+
+        Returns:
+            bytes: a raw response.
+
+        """
+        return await self._post(rpc=self.endpoint_uri, data=data)
+
+    async def _post(self, rpc: str, data: bytes) -> bytes:
+        await RateLimiter.acquire(rpc=rpc, data=data)
+        session = ProviderPool.get_session(rpc=rpc, proxy=self.proxy)
+
+        async with session.post(
+            rpc, data=data, **self._get_session_kwargs()
+        ) as response:
+            response.raise_for_status()
+            return await response.read()
+
+    def _get_session_kwargs(self) -> dict[str, Any]:
+        request_kwargs = self.get_request_kwargs()
+        request_kwargs.setdefault(
+            'timeout', ClientTimeout(ProviderPool.REQUEST_TIMEOUT)
+        )
+
+        return request_kwargs
+
+
+class RoutedAsyncHTTPProvider(PooledAsyncHTTPProvider):
+    """
+    A pooled provider which sends every request to the healthiest of several endpoints.
+
+    A request failing with a connection error, a timeout, a 429/5xx status or
+    a rate limit JSON-RPC error is retried on the next endpoint.
+
+    Attributes:
+        endpoint_uris (list[str]): all the RPC URLs of the network.
+
+    """
+
+    def __init__(
+        self,
+        endpoint_uris: list[str],
+        proxy: str | None = None,
+        request_kwargs: dict[str, Any] | None = None,
+        batch_window: float | None = None
+    ) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            endpoint_uris (list[str]): the RPC URLs.
+            proxy (str | None): a proxy used for the requests (default is None).
+            request_kwargs (dict[str, Any] | None): extra kwargs of every request (default is None).
+            batch_window (float | None): a window to coalesce requests into
+                JSON-RPC batches; None disables auto batching (default is None).
+
+        """
+        self.endpoint_uris = list(endpoint_uris)
+        super().__init__(
+            endpoint_uri=self.endpoint_uris[0],
+            proxy=proxy,
+            request_kwargs=request_kwargs,
+            batch_window=batch_window
+        )
+
+    async def make_post_request(self, data: bytes) -> bytes:
+        rpcs = RpcRouter.rank(self.endpoint_uris)
+        last_error = None
+
+        for i, rpc in enumerate(rpcs):
+            is_last = i == len(rpcs) - 1
+            start_time = time.monotonic()
+
+            try:
+                raw_response = await self._post(rpc=rpc, data=data)
+            except ClientResponseError as err:
+                RpcRouter.record_error(
+                    rpc,
+                    rate_limited=err.status in RpcRouter.RATE_LIMIT_STATUSES,
+                    retry_after=self._get_retry_after(err)
+                )
+                if err.status not in RpcRouter.FAILOVER_STATUSES:
+                    raise
+                last_error = err
+                continue
+            except (ClientError, asyncio.TimeoutError) as err:
+                RpcRouter.record_error(rpc)
+                last_error = err
+                continue
+
+            if RpcRouter.is_rate_limit_response(raw_response):
+                RpcRouter.record_error(rpc, rate_limited=True)
+                if not is_last:
+                    continue
+            else:
+                RpcRouter.record_success(rpc, time.monotonic() - start_time)
+
+            return raw_response
+
+        raise last_error
+
+    @staticmethod
+    def _get_retry_after(error: ClientResponseError) -> float | None:
+        retry_after = (error.headers or {}).get('Retry-After')
+
+        try:
+            return float(retry_after) if retry_after else None
+        except ValueError:
+            return None
+
+
+class ProviderPool:
+    """
+    A process-wide pool of aiohttp sessions keyed by (rpc URL, proxy).
+
+    Every AccountManager with the same RPC and proxy shares one session, so
+    TCP/TLS handshakes are made once per endpoint instead of once per wallet.
+
+    Example:
+    ```python
+    async with ProviderPool():
+        client = Client(private_key=..., network=Networks.Arbitrum)
+        await client.contract.get_balance()
+    ```
+    """
+    LIMIT_PER_HOST: int = 100
+    KEEPALIVE_TIMEOUT: float = 60
+    REQUEST_TIMEOUT: float = 30
+    SESSIONS: dict[tuple[str, str | None], ClientSession] = {}
+
+    @classmethod
+    def get_provider(
+        cls,
+        rpc: str | list[str],
+        proxy: str | None = None,
+        headers: dict[str, str] | None = None,
+        batch_window: float | None = None
+    ) -> PooledAsyncHTTPProvider:
+        """
+        Get a provider which uses the shared session of the (rpc, proxy) pair.
+
+        Several RPC URLs give a RoutedAsyncHTTPProvider, which routes every
+        request to the healthiest of them.
+
+        Args:
+            rpc (str | list[str]): an RPC URL or several RPC URLs of a network.
+            proxy (str | None): a proxy (default is None).
+            headers (dict[str, str] | None): request headers (default is None).
+            batch_window (float | None): a window to coalesce requests into
+                JSON-RPC batches (default is None).
+
+        Returns:
+            PooledAsyncHTTPProvider: the provider.
+
+        """
+        request_kwargs = {'proxy': proxy}
+        if headers:
+            request_kwargs['headers'] = headers
+
+        if isinstance(rpc, list) and len(rpc) > 1:
+            return RoutedAsyncHTTPProvider(
+                endpoint_uris=rpc,
+                proxy=proxy,
+                request_kwargs=request_kwargs,
+                batch_window=batch_window
+            )
+
+        return PooledAsyncHTTPProvider(
+            endpoint_uri=rpc[0] if isinstance(rpc, list) else rpc,
+            proxy=proxy,
+            request_kwargs=request_kwargs,
+            batch_window=batch_window
+        )
+
+    @classmethod
+    def get_session(
+        cls,
+        rpc: str,
+        proxy: str | None = None
+    ) -> ClientSession:
+        """
+        Get the session of the (rpc, proxy) pair, creating it if it is missing or stale.
+
+        Args:
+            rpc (str): an RPC URL.
+            proxy (str | None): a proxy (default is None).
+
+        Returns:
+            ClientSession: the shared session.
+
+        """
+        key = (rpc, proxy)
+        session = cls.SESSIONS.get(key)
+
+        if not session or session.closed or session._loop.is_closed():
+            session = ClientSession(
+                connector=TCPConnector(
+                    limit=cls.LIMIT_PER_HOST,
+                    limit_per_host=cls.LIMIT_PER_HOST,
+                    keepalive_timeout=cls.KEEPALIVE_TIMEOUT
+                )
+            )
+            cls.SESSIONS[key] = session
+
+        return session
+
+    @classmethod
+    async def close(cls) -> None:
+        """Close all the pooled sessions."""
+        sessions = list(cls.SESSIONS.values())
+        cls.SESSIONS.clear()
+
+        await asyncio.gather(*(
+            session.close()
+            for session in sessions
+            if not session.closed and not session._loop.is_closed()
+        ))
+
+    async def __aenter__(self) -> 'ProviderPool':
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
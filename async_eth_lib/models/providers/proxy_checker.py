@@ -0,0 +1,164 @@
+import asyncio
+import time
+
+import requests
+from aiohttp import ClientTimeout
+
+from async_eth_lib.models.providers.provider_pool import ProviderPool
+import async_eth_lib.models.others.exceptions as exceptions
+
+
+class ProxyChecker:
+    """
+    Checks that proxies work, caching the results for a while.
+
+    A proxy works if the IP address seen by CHECK_URL through it is a part of
+    the proxy string. Concurrent checks of one proxy share a single request.
+
+    Example:
+    ```python
+    async with ProviderPool():
+        results = await ProxyChecker.check_proxies(PROXIES)
+        working_proxies = [proxy for proxy, is_valid in results.items() if is_valid]
+    ```
+    """
+    CHECK_URL: str = 'http://eth0.me'
+    TIMEOUT: float = 10
+    TTL: float = 600
+    RESULTS: dict[str, tuple[float, str | None, str | None]] = {}
+    CHECKS: dict[str, asyncio.Future] = {}
+
+    @staticmethod
+    def normalize_proxy(proxy: str) -> str:
+        if 'http' not in proxy:
+            proxy = f'http://{proxy}'
+
+        return proxy
+
+    @classmethod
+    async def check_proxy(cls, proxy: str) -> str:
+        """
+        Check that the proxy works.
+
+        Args:
+            proxy (str): the proxy.
+
+        Returns:
+            str: the IP address of the proxy.
+
+        Raises:
+            InvalidProxy: if the proxy does not work.
+
+        """
+        proxy = cls.normalize_proxy(proxy)
+
+        if not cls._get_result(proxy):
+            check = cls.CHECKS.get(proxy)
+            if not check:
+                check = asyncio.ensure_future(cls._check(proxy))
+                cls.CHECKS[proxy] = check
+                check.add_done_callback(lambda _: cls.CHECKS.pop(proxy, None))
+
+            await asyncio.shield(check)
+
+        return cls._get_ip(proxy)
+
+    @classmethod
+    async def check_proxies(cls, proxies: list[str]) -> dict[str, bool]:
+        """
+        Check the proxies concurrently.
+
+        Args:
+            proxies (list[str]): the proxies.
+
+        Returns:
+            dict[str, bool]: whether each proxy works.
+
+        """
+        results = await asyncio.gather(
+            *[cls.check_proxy(proxy) for proxy in proxies],
+            return_exceptions=True
+        )
+
+        return {
+            proxy: not isinstance(result, Exception)
+            for proxy, result in zip(proxies, results)
+        }
+
+    @classmethod
+    def check_proxy_sync(cls, proxy: str) -> str:
+        """
+        Check that the proxy works, blocking until the check is done.
+
+        Prefer `check_proxy` inside a running event loop.
+
+        Args:
+            proxy (str): the proxy.
+
+        Returns:
+            str: the IP address of the proxy.
+
+        Raises:
+            InvalidProxy: if the proxy does not work.
+
+        """
+        proxy = cls.normalize_proxy(proxy)
+
+        if not cls._get_result(proxy):
+            try:
+                your_ip = requests.get(
+                    cls.CHECK_URL,
+                    proxies={'http': proxy, 'https': proxy},
+                    timeout=cls.TIMEOUT
+                ).text.rstrip()
+            except requests.RequestException as err:
+                cls._save_result(proxy, error=str(err))
+            else:
+                cls._save_result(proxy, your_ip=your_ip)
+
+        return cls._get_ip(proxy)
+
+    @classmethod
+    async def _check(cls, proxy: str) -> None:
+        session = ProviderPool.get_session(rpc=cls.CHECK_URL)
+
+        try:
+            async with session.get(
+                cls.CHECK_URL,
+                proxy=proxy,
+                timeout=ClientTimeout(cls.TIMEOUT)
+            ) as response:
+                response.raise_for_status()
+                your_ip = (await response.text()).rstrip()
+        except Exception as err:
+            cls._save_result(proxy, error=str(err) or err.__class__.__name__)
+        else:
+            cls._save_result(proxy, your_ip=your_ip)
+
+    @classmethod
+    def _save_result(
+        cls,
+        proxy: str,
+        your_ip: str | None = None,
+        error: str | None = None
+    ) -> None:
+        if your_ip is not None and your_ip not in proxy:
+            error = f"Proxy doesn't work! It's IP is {your_ip}"
+
+        cls.RESULTS[proxy] = (time.monotonic(), your_ip, error)
+
+    @classmethod
+    def _get_result(cls, proxy: str) -> tuple[float, str | None, str | None] | None:
+        result = cls.RESULTS.get(proxy)
+        if result and time.monotonic() - result[0] < cls.TTL:
+            return result
+
+        return None
+
+    @classmethod
+    def _get_ip(cls, proxy: str) -> str:
+        _, your_ip, error = cls.RESULTS[proxy]
+        if error:
+            raise exceptions.InvalidProxy(error)
+
+        return your_ip
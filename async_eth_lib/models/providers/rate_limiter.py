@@ -0,0 +1,222 @@
+import asyncio
+import hashlib
+import json
+import time
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """
+    A token bucket which makes callers wait for tokens in the order they came.
+
+    Attributes:
+        rate (float): the number of tokens added per second.
+        capacity (float): the maximum number of tokens, i.e. the allowed burst.
+        tokens (float): the number of available tokens.
+
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            rate (float): the number of tokens added per second.
+            capacity (float | None): the maximum number of tokens (default is the rate).
+
+        """
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock: asyncio.Lock | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def get_delay(self, tokens: float = 1) -> float:
+        """
+        Get the time to wait for the tokens, not counting the callers already waiting.
+
+        Args:
+            tokens (float): the number of tokens (default is 1).
+
+        Returns:
+            float: the delay in seconds.
+
+        """
+        self._refill()
+
+        return max(min(tokens, self.capacity) - self.tokens, 0) / self.rate
+
+    async def acquire(self, tokens: float = 1) -> None:
+        """
+        Wait until the tokens are available and take them.
+
+        A request for more tokens than the capacity waits for a full bucket
+        and takes the bucket into debt, which delays the next callers.
+
+        Args:
+            tokens (float): the number of tokens (default is 1).
+
+        """
+        async with self._get_lock():
+            delay = self.get_delay(tokens)
+            if delay:
+                await asyncio.sleep(delay)
+                self._refill()
+
+            self.tokens -= tokens
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(
+            self.tokens + (now - self._updated_at) * self.rate, self.capacity
+        )
+        self._updated_at = now
+
+    def _get_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+
+        if self._loop is not loop:
+            self._lock = asyncio.Lock()
+            self._loop = loop
+
+        return self._lock
+
+
+class RateLimiter:
+    """
+    Counts JSON-RPC calls per endpoint and keeps them under the endpoint rate limits.
+
+    The token buckets are process-wide and keyed by the RPC URL, so all
+    clients of an endpoint (and of its API key) share its budget. Calls
+    over the limit wait in a queue instead of failing with 429. Every call
+    of a JSON-RPC batch takes one token.
+
+    Endpoints are reported by their host and a short URL hash, so API keys
+    in the URLs do not leak into logs and metrics.
+
+    Example:
+    ```python
+    RateLimiter.set_limit('rpc.ankr.com', rate=30)
+    RateLimiter.set_limit(Networks.ZkSync.rpc, rate=25, burst=50)
+
+    ...
+
+    print(RateLimiter.get_calls())
+    ```
+    """
+    LIMITS: dict[str, tuple[float, float | None]] = {}
+    BUCKETS: dict[str, TokenBucket] = {}
+    CALLS: dict[str, dict[str, int]] = {}
+
+    @classmethod
+    def set_limit(
+        cls,
+        rpc: str,
+        rate: float | None,
+        burst: float | None = None
+    ) -> None:
+        """
+        Set the rate limit of an endpoint.
+
+        Args:
+            rpc (str): an RPC URL or a host; the limit of a host applies to
+                every URL of the host separately.
+            rate (float | None): the allowed calls per second; None removes the limit.
+            burst (float | None): the allowed burst of calls (default is the rate).
+
+        """
+        if rate is None:
+            cls.LIMITS.pop(rpc, None)
+        else:
+            cls.LIMITS[rpc] = (rate, burst)
+
+        for bucket_rpc in list(cls.BUCKETS):
+            if rpc in (bucket_rpc, cls.get_host(bucket_rpc)):
+                del cls.BUCKETS[bucket_rpc]
+
+    @classmethod
+    def get_bucket(cls, rpc: str) -> TokenBucket | None:
+        bucket = cls.BUCKETS.get(rpc)
+        if bucket:
+            return bucket
+
+        limit = cls.LIMITS.get(rpc) or cls.LIMITS.get(cls.get_host(rpc))
+        if not limit:
+            return None
+
+        bucket = cls.BUCKETS[rpc] = TokenBucket(*limit)
+
+        return bucket
+
+    @classmethod
+    def get_delay(cls, rpc: str, calls: int = 1) -> float:
+        bucket = cls.get_bucket(rpc)
+
+        return bucket.get_delay(calls) if bucket else 0.
+
+    @classmethod
+    async def acquire(cls, rpc: str, data: bytes) -> None:
+        """
+        Count the calls of a JSON-RPC request and wait for the endpoint budget.
+
+        Args:
+            rpc (str): the RPC URL.
+            data (bytes): the encoded JSON-RPC request or batch.
+
+        """
+        methods = cls._get_methods(data)
+        calls = cls.CALLS.setdefault(cls.get_endpoint_name(rpc), {})
+        for method in methods:
+            calls[method] = calls.get(method, 0) + 1
+
+        bucket = cls.get_bucket(rpc)
+        if bucket:
+            await bucket.acquire(len(methods))
+
+    @classmethod
+    def get_calls(cls, rpc: str | list[str] | None = None) -> dict[str, dict[str, int]]:
+        """
+        Get the numbers of calls.
+
+        Args:
+            rpc (str | list[str] | None): RPC URLs to get the calls of (default is all).
+
+        Returns:
+            dict[str, dict[str, int]]: the numbers of calls per method by endpoint names.
+
+        """
+        if rpc is None:
+            return {name: dict(calls) for name, calls in cls.CALLS.items()}
+
+        names = [cls.get_endpoint_name(rpc)] if isinstance(rpc, str) else [
+            cls.get_endpoint_name(url) for url in rpc
+        ]
+
+        return {name: dict(cls.CALLS[name]) for name in names if name in cls.CALLS}
+
+    @classmethod
+    def reset(cls) -> None:
+        cls.CALLS.clear()
+
+    @staticmethod
+    def get_host(rpc: str) -> str:
+        return urlparse(rpc).netloc or rpc
+
+    @classmethod
+    def get_endpoint_name(cls, rpc: str) -> str:
+        url_hash = hashlib.sha256(rpc.encode()).hexdigest()[:8]
+
+        return f'{cls.get_host(rpc)}#{url_hash}'
+
+    @staticmethod
+    def _get_methods(data: bytes) -> list[str]:
+        try:
+            rpc_requests = json.loads(data)
+        except ValueError:
+            return ['unknown']
+
+        if isinstance(rpc_requests, dict):
+            rpc_requests = [rpc_requests]
+
+        return [rpc_request.get('method', 'unknown') for rpc_request in rpc_requests]
@@ -0,0 +1,164 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, AsyncIterator
+
+from eth_utils import to_bytes
+from web3._utils.encoding import FriendlyJsonSerde, Web3JsonEncoder
+from web3.types import RPCEndpoint, RPCResponse
+
+if TYPE_CHECKING:
+    from async_eth_lib.models.providers.provider_pool import PooledAsyncHTTPProvider
+
+
+class RequestBatcher:
+    """
+    Coalesces JSON-RPC requests of a provider into JSON-RPC array POSTs.
+
+    Requests issued while batching is enabled are queued and sent together
+    once the window expires, then every caller gets its own response back.
+
+    Attributes:
+        provider (PooledAsyncHTTPProvider): the provider which sends the batches.
+        window (float | None): a coalescing window in seconds; None disables auto batching.
+
+    """
+    MAX_BATCH_SIZE: int = 100
+
+    def __init__(
+        self,
+        provider: 'PooledAsyncHTTPProvider',
+        window: float | None = None
+    ) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            provider (PooledAsyncHTTPProvider): the provider which sends the batches.
+            window (float | None): a coalescing window in seconds (default is None).
+
+        """
+        self.provider = provider
+        self.window = window
+        self._batch_depth = 0
+        self._pending: list[tuple[RPCEndpoint, Any, asyncio.Future]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def is_enabled(self) -> bool:
+        return self.window is not None or self._batch_depth > 0
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator['RequestBatcher']:
+        """
+        Enable batching inside the block.
+
+        Only requests that are awaited concurrently can share a batch, so the
+        calls inside the block should be gathered.
+
+        Example:
+        ```python
+        async with client.batch():
+            balance, nonce = await asyncio.gather(
+                client.contract.get_balance(),
+                client.contract.transaction.get_nonce()
+            )
+        ```
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._pending and not self.is_enabled:
+                self._flush()
+
+    async def add_request(
+        self,
+        method: RPCEndpoint,
+        params: Any
+    ) -> RPCResponse:
+        """
+        Queue a request into the current batch and wait for its response.
+
+        Args:
+            method (RPCEndpoint): a JSON-RPC method.
+            params (Any): the method params.
+
+        Returns:
+            RPCResponse: the response of the request.
+
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((method, params, future))
+
+        if len(self._pending) >= self.MAX_BATCH_SIZE:
+            self._flush()
+        elif not self._flush_handle:
+            self._flush_handle = loop.call_later(self.window or 0, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        task = asyncio.ensure_future(self._send(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(
+        self,
+        pending: list[tuple[RPCEndpoint, Any, asyncio.Future]]
+    ) -> None:
+        futures = {}
+        rpc_requests = []
+        for method, params, future in pending:
+            request_id = next(self.provider.request_counter)
+            futures[request_id] = future
+            rpc_requests.append({
+                'jsonrpc': '2.0',
+                'method': method,
+                'params': params or [],
+                'id': request_id
+            })
+
+        try:
+            encoded = FriendlyJsonSerde().json_encode(
+                rpc_requests, cls=Web3JsonEncoder
+            )
+            raw_response = await self.provider.make_post_request(
+                data=to_bytes(text=encoded)
+            )
+            responses = self.provider.decode_rpc_response(raw_response)
+        except Exception as err:
+            for future in futures.values():
+                if not future.done():
+                    future.set_exception(err)
+            return
+
+        # some endpoints answer a whole batch with a single error object
+        if isinstance(responses, dict):
+            responses = [
+                {**responses, 'id': request_id} for request_id in futures
+            ]
+
+        responses_by_id = {response.get('id'): response for response in responses}
+        for request_id, future in futures.items():
+            if future.done():
+                continue
+
+            future.set_result(responses_by_id.get(request_id, {
+                'jsonrpc': '2.0',
+                'id': request_id,
+                'error': {
+                    'code': -32603,
+                    'message': 'No response for the request in JSON-RPC batch'
+                }
+            }))
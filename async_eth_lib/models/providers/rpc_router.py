@@ -0,0 +1,146 @@
+import random
+import time
+
+from async_eth_lib.models.others.common import AutoRepr
+from async_eth_lib.models.providers.rate_limiter import RateLimiter
+
+
+class EndpointHealth(AutoRepr):
+    """
+    Health statistics of an RPC endpoint.
+
+    Attributes:
+        latency (float): a moving average of the response time in seconds.
+        error_rate (float): a moving average of the failed requests share.
+        rate_limited_until (float): the monotonic time the rate limit of the endpoint ends.
+        last_error_time (float): the monotonic time of the last failed request.
+        requests (int): the number of requests.
+        errors (int): the number of failed requests.
+
+    """
+
+    def __init__(self) -> None:
+        self.latency = 0.
+        self.error_rate = 0.
+        self.rate_limited_until = 0.
+        self.last_error_time = 0.
+        self.requests = 0
+        self.errors = 0
+
+    @property
+    def is_rate_limited(self) -> bool:
+        return time.monotonic() < self.rate_limited_until
+
+
+class RpcRouter:
+    """
+    Tracks the health of RPC endpoints and ranks them for every request.
+
+    The statistics are process-wide, so all clients of a network learn
+    which of its endpoints are slow, failing or rate limited.
+    """
+    SMOOTHING: float = 0.2
+    ERROR_PENALTY: float = 1.
+    RECOVERY_HALF_LIFE: float = 60.
+    RATE_LIMIT_COOLDOWN: float = 30.
+    RATE_LIMIT_STATUSES: tuple[int, ...] = (429,)
+    FAILOVER_STATUSES: tuple[int, ...] = (429, 500, 502, 503, 504)
+    RATE_LIMIT_MESSAGES: tuple[bytes, ...] = (
+        b'rate limit',
+        b'too many requests',
+        b'request limit',
+        b'compute units',
+    )
+    HEALTH: dict[str, EndpointHealth] = {}
+
+    @classmethod
+    def get_health(cls, rpc: str) -> EndpointHealth:
+        if rpc not in cls.HEALTH:
+            cls.HEALTH[rpc] = EndpointHealth()
+
+        return cls.HEALTH[rpc]
+
+    @classmethod
+    def get_score(cls, rpc: str) -> float:
+        """
+        Get the score of an endpoint, the lower the healthier.
+
+        The score is the average latency plus a penalty for the error rate,
+        which halves every RECOVERY_HALF_LIFE seconds without errors, so a
+        failed endpoint is tried again after a while. The wait for the rate
+        limit budget of the endpoint is added too.
+
+        Args:
+            rpc (str): an RPC URL.
+
+        Returns:
+            float: the score.
+
+        """
+        health = cls.get_health(rpc)
+        error_rate = health.error_rate * 0.5 ** (
+            (time.monotonic() - health.last_error_time) / cls.RECOVERY_HALF_LIFE
+        )
+        score = (
+            health.latency
+            + cls.ERROR_PENALTY * error_rate
+            + RateLimiter.get_delay(rpc)
+        )
+
+        if health.is_rate_limited:
+            score += cls.RATE_LIMIT_COOLDOWN
+
+        return score
+
+    @classmethod
+    def rank(cls, rpcs: list[str]) -> list[str]:
+        """
+        Order the endpoints from the healthiest one.
+
+        Endpoints with equal scores are shuffled to spread the load.
+
+        Args:
+            rpcs (list[str]): RPC URLs.
+
+        Returns:
+            list[str]: the ordered RPC URLs.
+
+        """
+        return sorted(random.sample(rpcs, len(rpcs)), key=cls.get_score)
+
+    @classmethod
+    def record_success(cls, rpc: str, latency: float) -> None:
+        health = cls.get_health(rpc)
+        health.requests += 1
+        health.latency = (
+            latency if health.requests == 1
+            else health.latency + cls.SMOOTHING * (latency - health.latency)
+        )
+        health.error_rate -= cls.SMOOTHING * health.error_rate
+
+    @classmethod
+    def record_error(
+        cls,
+        rpc: str,
+        rate_limited: bool = False,
+        retry_after: float | None = None
+    ) -> None:
+        health = cls.get_health(rpc)
+        health.requests += 1
+        health.errors += 1
+        health.error_rate += cls.SMOOTHING * (1 - health.error_rate)
+        health.last_error_time = time.monotonic()
+
+        if rate_limited:
+            health.rate_limited_until = (
+                time.monotonic() + (retry_after or cls.RATE_LIMIT_COOLDOWN)
+            )
+
+    @classmethod
+    def is_rate_limit_response(cls, raw_response: bytes) -> bool:
+        if b'"error"' not in raw_response:
+            return False
+
+        raw_response = raw_response.lower()
+
+        return any(message in raw_response for message in cls.RATE_LIMIT_MESSAGES)
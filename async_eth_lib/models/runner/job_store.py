@@ -0,0 +1,319 @@
+import asyncio
+import functools
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable
+
+from async_eth_lib.models.others.common import AutoRepr
+
+
+class JobState(AutoRepr):
+    """
+    The saved state of a campaign step of a wallet.
+
+    Attributes:
+        campaign (str): the campaign name.
+        step (str): the step name.
+        address (str): the wallet address.
+        status (str): a JobStatus value.
+        tx_hash (str | None): the hash of the last sent transaction.
+        receipt_status (int | None): the receipt status of the last transaction.
+        error (str | None): the error of a failed step.
+        updated_at (float): the UNIX time of the last update.
+
+    """
+
+    def __init__(
+        self,
+        campaign: str,
+        step: str,
+        address: str,
+        status: str,
+        tx_hash: str | None = None,
+        receipt_status: int | None = None,
+        error: str | None = None,
+        updated_at: float = 0.
+    ) -> None:
+        self.campaign = campaign
+        self.step = step
+        self.address = address
+        self.status = status
+        self.tx_hash = tx_hash
+        self.receipt_status = receipt_status
+        self.error = error
+        self.updated_at = updated_at
+
+
+class JobTx(AutoRepr):
+    """
+    A transaction sent by a campaign step of a wallet.
+
+    Attributes:
+        tx_index (int): the order of the transaction in the step, from 0.
+        tx_hash (str): the transaction hash.
+        is_approve (bool): whether the transaction is a token approval.
+
+    """
+
+    def __init__(self, tx_index: int, tx_hash: str, is_approve: bool = False) -> None:
+        self.tx_index = tx_index
+        self.tx_hash = tx_hash
+        self.is_approve = bool(is_approve)
+
+
+class JobStore:
+    """
+    A SQLite store of the per-wallet progress of campaigns.
+
+    Every state change is committed at once, so a crashed run can be
+    restarted and only the remaining work is done again. Every sent
+    transaction of a step is recorded, so a resumed run knows whether the
+    step got past its approvals.
+
+    The methods are blocking; from a coroutine they are run with `run`,
+    which executes them in order on the single writer thread of the store.
+
+    Attributes:
+        path (str): the database file path.
+
+    Example:
+    ```python
+    job_store = JobStore()
+    runner = WalletRunner(
+        task=swap, job_store=job_store, campaign='zksync', step='syncswap'
+    )
+    ```
+    """
+    FOLDER_NAME: str = 'user_data/jobs'
+    FILE_NAME: str = 'jobs.db'
+    FIELDS: tuple[str, ...] = (
+        'campaign', 'step', 'address', 'status', 'tx_hash',
+        'receipt_status', 'error', 'updated_at'
+    )
+
+    def __init__(self, path: str | None = None) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            path (str | None): a database file path (default is 'user_data/jobs/jobs.db').
+
+        """
+        self.path = path or os.path.join(self.FOLDER_NAME, self.FILE_NAME)
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='job_store'
+        )
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute(
+            '''
+            CREATE TABLE IF NOT EXISTS jobs (
+                campaign TEXT NOT NULL,
+                step TEXT NOT NULL,
+                address TEXT NOT NULL,
+                status TEXT NOT NULL,
+                tx_hash TEXT,
+                receipt_status INTEGER,
+                error TEXT,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (campaign, step, address)
+            )
+            '''
+        )
+        self._connection.execute(
+            '''
+            CREATE TABLE IF NOT EXISTS txs (
+                campaign TEXT NOT NULL,
+                step TEXT NOT NULL,
+                address TEXT NOT NULL,
+                tx_index INTEGER NOT NULL,
+                tx_hash TEXT NOT NULL,
+                is_approve INTEGER NOT NULL,
+                PRIMARY KEY (campaign, step, address, tx_index)
+            )
+            '''
+        )
+        self._connection.commit()
+
+    def run(self, method: Callable[..., Any], *args, **kwargs) -> asyncio.Future:
+        """
+        Run a method of the store on its writer thread without blocking the event loop.
+
+        The calls are executed in the order they were made, so a call which is
+        not awaited is still done before any later one.
+
+        Args:
+            method (Callable[..., Any]): a method of the store, e.g. `job_store.set_state`.
+            *args: the method args.
+            **kwargs: the method kwargs.
+
+        Returns:
+            asyncio.Future: the future of the method result.
+
+        Example:
+        ```python
+        state = await job_store.run(job_store.get_state, 'zksync', 'syncswap', address)
+        ```
+        """
+        return asyncio.get_running_loop().run_in_executor(
+            self._executor, functools.partial(method, *args, **kwargs)
+        )
+
+    def get_state(
+        self,
+        campaign: str,
+        step: str,
+        address: str
+    ) -> JobState | None:
+        """
+        Get the saved state of a campaign step of a wallet.
+
+        Args:
+            campaign (str): the campaign name.
+            step (str): the step name.
+            address (str): the wallet address.
+
+        Returns:
+            JobState | None: the state or None if the step was never started.
+
+        """
+        row = self._connection.execute(
+            f'SELECT {", ".join(self.FIELDS)} FROM jobs '
+            'WHERE campaign = ? AND step = ? AND address = ?',
+            (campaign, step, address)
+        ).fetchone()
+
+        return JobState(*row) if row else None
+
+    def get_states(self, campaign: str, step: str | None = None) -> list[JobState]:
+        """
+        Get the saved states of a campaign.
+
+        Args:
+            campaign (str): the campaign name.
+            step (str | None): the step name (default is all steps).
+
+        Returns:
+            list[JobState]: the states.
+
+        """
+        query = f'SELECT {", ".join(self.FIELDS)} FROM jobs WHERE campaign = ?'
+        params = [campaign]
+        if step:
+            query += ' AND step = ?'
+            params.append(step)
+
+        return [
+            JobState(*row) for row in self._connection.execute(query, params)
+        ]
+
+    def set_state(
+        self,
+        campaign: str,
+        step: str,
+        address: str,
+        status: str,
+        **fields
+    ) -> None:
+        """
+        Save the state of a campaign step of a wallet.
+
+        The fields which are not given keep their saved values.
+
+        Args:
+            campaign (str): the campaign name.
+            step (str): the step name.
+            address (str): the wallet address.
+            status (str): a JobStatus value.
+            **fields: `tx_hash`, `receipt_status` and/or `error` values.
+
+        """
+        fields['status'] = status
+        fields['updated_at'] = time.time()
+        columns = ['campaign', 'step', 'address', *fields]
+        updates = ', '.join(f'{column} = excluded.{column}' for column in fields)
+
+        self._connection.execute(
+            f'INSERT INTO jobs ({", ".join(columns)}) '
+            f'VALUES ({", ".join("?" * len(columns))}) '
+            f'ON CONFLICT (campaign, step, address) DO UPDATE SET {updates}',
+            (campaign, step, address, *fields.values())
+        )
+        self._connection.commit()
+
+    def add_tx(
+        self,
+        campaign: str,
+        step: str,
+        address: str,
+        tx_hash: str,
+        is_approve: bool = False
+    ) -> None:
+        """
+        Record a sent transaction of a campaign step of a wallet.
+
+        Args:
+            campaign (str): the campaign name.
+            step (str): the step name.
+            address (str): the wallet address.
+            tx_hash (str): the transaction hash.
+            is_approve (bool): whether the transaction is a token approval (default is False).
+
+        """
+        self._connection.execute(
+            'INSERT INTO txs (campaign, step, address, tx_index, tx_hash, is_approve) '
+            'SELECT ?, ?, ?, COUNT(*), ?, ? FROM txs '
+            'WHERE campaign = ? AND step = ? AND address = ?',
+            (campaign, step, address, tx_hash, int(is_approve), campaign, step, address)
+        )
+        self._connection.commit()
+
+    def get_txs(self, campaign: str, step: str, address: str) -> list[JobTx]:
+        """
+        Get the recorded transactions of a campaign step of a wallet.
+
+        Args:
+            campaign (str): the campaign name.
+            step (str): the step name.
+            address (str): the wallet address.
+
+        Returns:
+            list[JobTx]: the transactions in the order they were sent.
+
+        """
+        return [
+            JobTx(*row) for row in self._connection.execute(
+                'SELECT tx_index, tx_hash, is_approve FROM txs '
+                'WHERE campaign = ? AND step = ? AND address = ? ORDER BY tx_index',
+                (campaign, step, address)
+            )
+        ]
+
+    def clear_txs(self, campaign: str, step: str, address: str) -> None:
+        """Forget the recorded transactions of a campaign step of a wallet."""
+        self._connection.execute(
+            'DELETE FROM txs WHERE campaign = ? AND step = ? AND address = ?',
+            (campaign, step, address)
+        )
+        self._connection.commit()
+
+    def reset(self, campaign: str, step: str | None = None) -> None:
+        """Forget the progress of a campaign or of one of its steps."""
+        condition = 'WHERE campaign = ?'
+        params = [campaign]
+        if step:
+            condition += ' AND step = ?'
+            params.append(step)
+
+        for table in ('jobs', 'txs'):
+            self._connection.execute(f'DELETE FROM {table} {condition}', params)
+        self._connection.commit()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        self._connection.close()
@@ -0,0 +1,469 @@
+import asyncio
+import random
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable
+
+from eth_account import Account
+from hexbytes import HexBytes
+from web3.exceptions import TimeExhausted
+
+from async_eth_lib.models.client import Client
+from async_eth_lib.models.networks.network import Network
+from async_eth_lib.models.others.common import AutoRepr
+from async_eth_lib.models.others.constants import JobStatus, LogStatus
+from async_eth_lib.models.transactions.tx import Tx
+from .job_store import JobState, JobStore, JobTx
+
+
+class WalletJob(AutoRepr):
+    """
+    A wallet to run a task for.
+
+    Attributes:
+        account_id (int | str | None): the account id used in the logs.
+        private_key (str): the wallet private key.
+        network (Network): the network of the client.
+        proxy (str | None): the proxy of the client.
+
+    """
+
+    def __init__(
+        self,
+        private_key: str,
+        network: Network,
+        account_id: int | str | None = None,
+        proxy: str | None = None
+    ) -> None:
+        self.account_id = account_id
+        self.private_key = private_key
+        self.network = network
+        self.proxy = proxy
+        self._address = None
+
+    @property
+    def address(self) -> str:
+        if not self._address:
+            self._address = Account.from_key(self.private_key).address
+
+        return self._address
+
+    def __repr__(self) -> str:
+        # the private key must never get into the logs
+        return (
+            f'{self.__class__.__name__}(account_id={self.account_id}, '
+            f'network={self.network.name}, proxy={self.proxy})'
+        )
+
+
+class WalletResult(AutoRepr):
+    """
+    The outcome of a task for a wallet.
+
+    Attributes:
+        job (WalletJob): the wallet job.
+        result (Any): the task result (None if the task failed).
+        error (Exception | None): the task exception (None if the task succeeded).
+        elapsed (float): the task duration in seconds.
+        is_skipped (bool): whether the step was already done in a previous run.
+
+    """
+
+    def __init__(
+        self,
+        job: WalletJob,
+        result: Any = None,
+        error: Exception | None = None,
+        elapsed: float = 0.,
+        is_skipped: bool = False
+    ) -> None:
+        self.job = job
+        self.result = result
+        self.error = error
+        self.elapsed = elapsed
+        self.is_skipped = is_skipped
+
+    @property
+    def is_success(self) -> bool:
+        return self.error is None
+
+
+class WalletRunner:
+    """
+    Runs a task for many wallets with bounded concurrency.
+
+    Clients are built lazily right before their task starts, the number of
+    concurrently running tasks is limited overall and per network, and the
+    start of every task is delayed by a random jitter. The delays are drawn
+    up front and counted from the start of the run, so a waiting wallet
+    never holds a concurrency slot.
+
+    Attributes:
+        task (Callable[[Client], Awaitable[Any]]): the task coroutine function.
+        concurrency (int): the maximum number of concurrently running tasks.
+        network_limits (dict[str, int]): the maximum number of concurrently
+            running tasks per network name.
+        jitter (tuple[float, float]): the range of a random delay in seconds
+            from the start of the run before every task.
+        job_store (JobStore | None): a store of the progress, which makes the runs resumable.
+        campaign (str): the campaign name in the job store.
+        step (str): the step name in the job store.
+        client_kwargs (dict[str, Any]): extra kwargs of every Client.
+
+    With a job store, the wallets which already finished the step are skipped.
+    For the wallets with sent transactions their receipts are checked first:
+    the step is done if its final non-approval transaction succeeded, it is
+    left SENT and skipped while a transaction is unresolved, and it is run
+    again otherwise. A step whose last receipt failed or whose task returned
+    False is saved as FAILED.
+
+    Example:
+    ```python
+    async def swap(client: Client):
+        return await SyncSwap(client=client).swap(swap_info)
+
+    runner = WalletRunner(
+        task=swap,
+        concurrency=50,
+        network_limits={Networks.ZkSync.name: 20},
+        jitter=(0, 30)
+    )
+    jobs = WalletRunner.create_jobs(
+        private_keys=PRIVATE_KEYS, network=Networks.ZkSync, proxies=PROXIES
+    )
+
+    async with ProviderPool():
+        async for result in runner.run(jobs):
+            print(result.job.account_id, result.is_success)
+    ```
+    """
+    CONCURRENCY: int = 10
+    RECEIPT_TIMEOUT: float = 60
+    APPROVE_SELECTOR: str = '0x095ea7b3'
+
+    def __init__(
+        self,
+        task: Callable[[Client], Awaitable[Any]],
+        concurrency: int | None = None,
+        network_limits: dict[str, int] | None = None,
+        jitter: tuple[float, float] = (0, 0),
+        job_store: JobStore | None = None,
+        campaign: str = 'default',
+        step: str = 'task',
+        **client_kwargs
+    ) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            task (Callable[[Client], Awaitable[Any]]): the task coroutine function.
+            concurrency (int | None): the maximum number of concurrently running
+                tasks (default is WalletRunner.CONCURRENCY).
+            network_limits (dict[str, int] | None): the maximum number of concurrently
+                running tasks per network name (default is None).
+            jitter (tuple[float, float]): the range of a random delay in seconds
+                from the start of the run before every task (default is (0, 0)).
+            job_store (JobStore | None): a store of the progress (default is None).
+            campaign (str): the campaign name in the job store (default is 'default').
+            step (str): the step name in the job store (default is 'task').
+            **client_kwargs: extra kwargs of every Client, e.g. `check_proxy`.
+
+        """
+        self.task = task
+        self.concurrency = concurrency or self.CONCURRENCY
+        self.network_limits = network_limits or {}
+        self.jitter = jitter
+        self.job_store = job_store
+        self.campaign = campaign
+        self.step = step
+        self.client_kwargs = client_kwargs
+        self._network_semaphores: dict[str, asyncio.Semaphore] = {}
+
+    @staticmethod
+    def create_jobs(
+        private_keys: list[str],
+        network: Network,
+        proxies: list[str] | None = None
+    ) -> list[WalletJob]:
+        """
+        Create the jobs of the wallets, numbering the accounts from 1.
+
+        Args:
+            private_keys (list[str]): the wallet private keys.
+            network (Network): the network of the clients.
+            proxies (list[str] | None): the proxies, cycled over the wallets (default is None).
+
+        Returns:
+            list[WalletJob]: the jobs.
+
+        """
+        return [
+            WalletJob(
+                account_id=account_id,
+                private_key=private_key,
+                network=network,
+                proxy=proxies[(account_id - 1) % len(proxies)] if proxies else None
+            )
+            for account_id, private_key in enumerate(private_keys, start=1)
+        ]
+
+    async def run(self, jobs: Iterable[WalletJob]) -> AsyncIterator[WalletResult]:
+        """
+        Run the task for the jobs and yield the results as they complete.
+
+        Args:
+            jobs (Iterable[WalletJob]): the wallet jobs.
+
+        Yields:
+            WalletResult: the result of a finished job.
+
+        """
+        jobs = list(jobs)
+        job_queue: asyncio.Queue[tuple[WalletJob, JobState | None]] = asyncio.Queue()
+        result_queue: asyncio.Queue[WalletResult] = asyncio.Queue()
+
+        # the jobs wait for their start outside the workers, which only take started jobs
+        tasks = [
+            asyncio.ensure_future(self._schedule(job, job_queue, result_queue))
+            for job in jobs
+        ]
+        tasks += [
+            asyncio.ensure_future(self._work(job_queue, result_queue))
+            for _ in range(min(self.concurrency, len(jobs)))
+        ]
+
+        try:
+            for _ in range(len(jobs)):
+                yield await result_queue.get()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def run_all(self, jobs: Iterable[WalletJob]) -> list[WalletResult]:
+        """Run the task for the jobs and return all the results in completion order."""
+        return [result async for result in self.run(jobs)]
+
+    async def _schedule(
+        self,
+        job: WalletJob,
+        job_queue: asyncio.Queue[tuple[WalletJob, JobState | None]],
+        result_queue: asyncio.Queue[WalletResult]
+    ) -> None:
+        start_time = time.monotonic() + (
+            random.uniform(*self.jitter) if self.jitter[1] else 0
+        )
+
+        # finished wallets are skipped before the jitter, so a resumed run only waits for the rest
+        state = await self._get_state(job)
+        if state and state.status == JobStatus.DONE:
+            result_queue.put_nowait(
+                WalletResult(job=job, result=state.tx_hash, is_skipped=True)
+            )
+            return
+
+        delay = start_time - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        job_queue.put_nowait((job, state))
+
+    async def _work(
+        self,
+        job_queue: asyncio.Queue[tuple[WalletJob, JobState | None]],
+        result_queue: asyncio.Queue[WalletResult]
+    ) -> None:
+        while True:
+            job, state = await job_queue.get()
+
+            async with self._get_network_semaphore(job.network):
+                result_queue.put_nowait(await self._run_job(job, state))
+
+    async def _run_job(
+        self,
+        job: WalletJob,
+        state: JobState | None = None
+    ) -> WalletResult:
+        start_time = time.monotonic()
+        client = None
+        sent_txs: list[Tx] = []
+
+        try:
+            client = await Client.create(
+                account_id=job.account_id,
+                private_key=job.private_key,
+                network=job.network,
+                proxy=job.proxy,
+                **self.client_kwargs
+            )
+
+            if state and state.status == JobStatus.SENT:
+                try:
+                    if await self._is_sent_step_done(client, job, state):
+                        return WalletResult(job=job, result=state.tx_hash, is_skipped=True)
+                except TimeExhausted as err:
+                    # a transaction may still land, sending the step again could repeat it
+                    return WalletResult(
+                        job=job,
+                        error=err,
+                        elapsed=time.monotonic() - start_time,
+                        is_skipped=True
+                    )
+
+            result = await self._run_task(client, job, sent_txs)
+        except Exception as err:
+            # a sent transaction without a receipt may still land, so the step is left SENT
+            status = (
+                JobStatus.SENT if sent_txs and not sent_txs[-1].receipt
+                else JobStatus.FAILED
+            )
+            await self._set_state(job, status, error=str(err))
+            if client:
+                client.account_manager.custom_logger.log_message(
+                    status=LogStatus.ERROR, message=f'Task failed: {err}'
+                )
+
+            return WalletResult(
+                job=job, error=err, elapsed=time.monotonic() - start_time
+            )
+
+        return WalletResult(
+            job=job, result=result, elapsed=time.monotonic() - start_time
+        )
+
+    async def _run_task(
+        self,
+        client: Client,
+        job: WalletJob,
+        sent_txs: list[Tx]
+    ) -> Any:
+        if not self.job_store:
+            return await self.task(client)
+
+        writes: list[asyncio.Future] = []
+
+        def on_sent(tx: Tx) -> None:
+            # the writes keep their order on the store thread, so they are awaited later
+            sent_txs.append(tx)
+            writes.append(self.job_store.run(
+                self.job_store.add_tx,
+                campaign=self.campaign,
+                step=self.step,
+                address=job.address,
+                tx_hash=tx.hash.hex(),
+                is_approve=self._is_approve(tx)
+            ))
+            writes.append(self.job_store.run(
+                self.job_store.set_state,
+                campaign=self.campaign,
+                step=self.step,
+                address=job.address,
+                status=JobStatus.SENT,
+                tx_hash=tx.hash.hex(),
+                error=None
+            ))
+
+        await self.job_store.run(
+            self.job_store.clear_txs,
+            campaign=self.campaign,
+            step=self.step,
+            address=job.address
+        )
+        await self._set_state(job, JobStatus.PENDING, tx_hash=None, receipt_status=None)
+        client.contract.transaction.sent_callbacks.append(on_sent)
+        try:
+            result = await self.task(client)
+        finally:
+            client.contract.transaction.sent_callbacks.remove(on_sent)
+            await asyncio.gather(*writes)
+
+        receipt = sent_txs[-1].receipt if sent_txs else None
+        if result is False or (receipt and not receipt['status']):
+            await self._set_state(
+                job,
+                JobStatus.FAILED,
+                receipt_status=receipt['status'] if receipt else None
+            )
+        elif sent_txs and not receipt:
+            # the last transaction was not awaited, the next run checks its receipt
+            pass
+        else:
+            await self._set_state(
+                job,
+                JobStatus.DONE,
+                receipt_status=receipt['status'] if receipt else None
+            )
+
+        return result
+
+    async def _is_sent_step_done(
+        self,
+        client: Client,
+        job: WalletJob,
+        state: JobState
+    ) -> bool:
+        job_txs = await self.job_store.run(
+            self.job_store.get_txs,
+            campaign=self.campaign,
+            step=self.step,
+            address=job.address
+        )
+        if not job_txs and state.tx_hash:
+            job_txs = [JobTx(tx_index=0, tx_hash=state.tx_hash)]
+
+        # raises TimeExhausted while a transaction is still unresolved
+        receipts = await asyncio.gather(*[
+            Tx(tx_hash=job_tx.tx_hash).wait_for_tx_receipt(
+                web3=client.account_manager.w3, timeout=self.RECEIPT_TIMEOUT
+            )
+            for job_tx in job_txs
+        ])
+
+        if any(not receipt['status'] for receipt in receipts):
+            await self._set_state(job, JobStatus.FAILED, receipt_status=0)
+            return False
+
+        # only approvals landed, the step has to send its final transaction
+        if not job_txs or job_txs[-1].is_approve:
+            return False
+
+        await self._set_state(job, JobStatus.DONE, receipt_status=1)
+
+        return True
+
+    async def _get_state(self, job: WalletJob) -> JobState | None:
+        if not self.job_store:
+            return None
+
+        return await self.job_store.run(
+            self.job_store.get_state,
+            campaign=self.campaign,
+            step=self.step,
+            address=job.address
+        )
+
+    async def _set_state(self, job: WalletJob, status: str, **fields) -> None:
+        if not self.job_store:
+            return
+
+        await self.job_store.run(
+            self.job_store.set_state,
+            campaign=self.campaign,
+            step=self.step,
+            address=job.address,
+            status=status,
+            **fields
+        )
+
+    @classmethod
+    def _is_approve(cls, tx: Tx) -> bool:
+        data = (tx.params or {}).get('data')
+
+        return bool(data) and HexBytes(data)[:4] == HexBytes(cls.APPROVE_SELECTOR)
+
+    def _get_network_semaphore(self, network: Network) -> asyncio.Semaphore:
+        if network.name not in self._network_semaphores:
+            self._network_semaphores[network.name] = asyncio.Semaphore(
+                self.network_limits.get(network.name, self.concurrency)
+            )
+
+        return self._network_semaphores[network.name]
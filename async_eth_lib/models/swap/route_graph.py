@@ -0,0 +1,318 @@
+import heapq
+import itertools
+import os
+
+from web3 import Web3
+
+from async_eth_lib.models.others.common import AutoRepr
+from async_eth_lib.utils.helpers import join_path, read_json
+
+
+class Pool(AutoRepr):
+    """
+    A liquidity pool between two tokens.
+
+    Attributes:
+        token_a (str): the checksum address of the first token.
+        token_b (str): the checksum address of the second token.
+        address (str | None): the pool address, None if the DEX addresses pools by tokens.
+        is_stable (bool): whether the pool is a stable one.
+        weight (float): the cost of a hop through the pool for the route search.
+
+    """
+
+    def __init__(
+        self,
+        token_a: str,
+        token_b: str,
+        address: str | None = None,
+        is_stable: bool = False,
+        weight: float = 1.
+    ) -> None:
+        self.token_a = Web3.to_checksum_address(token_a)
+        self.token_b = Web3.to_checksum_address(token_b)
+        self.address = Web3.to_checksum_address(address) if address else None
+        self.is_stable = is_stable
+        self.weight = weight
+
+    def get_other_token(self, token: str) -> str:
+        return self.token_b if token == self.token_a else self.token_a
+
+
+class RouteGraph:
+    """
+    An index of the pools of a DEX as a graph of tokens.
+
+    Routes are found by Yen's k-shortest paths search over the pools and
+    cached until a pool is added. The graphs are loaded from the pool
+    files of `data/pools/<network>/<dex>.json`:
+
+    ```json
+    {
+        "tokens": {"SYMBOL": "0x..."},
+        "pools": [
+            {"token_a": "0x...", "token_b": "0x...", "address": "0x...", "is_stable": false}
+        ]
+    }
+    ```
+
+    or from the pool creation events of a DEX factory.
+
+    Attributes:
+        tokens (dict[str, str]): the token addresses by symbols, in addition
+            to the token contracts of the network.
+        pools (list[Pool]): the pools.
+
+    """
+    FOLDER_PATH: tuple[str, ...] = ('data', 'pools')
+    GRAPHS: dict[tuple[str, str], 'RouteGraph'] = {}
+
+    def __init__(self) -> None:
+        self.tokens: dict[str, str] = {}
+        self.pools: list[Pool] = []
+        self._pools_by_token: dict[str, list[Pool]] = {}
+        self._routes: dict[tuple[str, str, int, int], list[list[Pool]]] = {}
+
+    @classmethod
+    def get_graph(cls, network_name: str, dex_name: str) -> 'RouteGraph':
+        """
+        Get the graph of a DEX, loading its pool file on the first call.
+
+        Args:
+            network_name (str): the network name.
+            dex_name (str): the DEX name, the pool file name without the extension.
+
+        Returns:
+            RouteGraph: the graph, empty if the DEX has no pool file.
+
+        """
+        key = (network_name.lower(), dex_name.lower())
+
+        if key not in cls.GRAPHS:
+            graph = cls()
+            path = join_path((*cls.FOLDER_PATH, key[0], f'{key[1]}.json'))
+            if os.path.exists(path):
+                graph.load(path)
+            cls.GRAPHS[key] = graph
+
+        return cls.GRAPHS[key]
+
+    def load(self, path: str | tuple | list) -> None:
+        """
+        Add the tokens and the pools of a pool file.
+
+        Args:
+            path (str | tuple | list): the file path.
+
+        """
+        data = read_json(path)
+
+        for symbol, address in data.get('tokens', {}).items():
+            self.tokens[symbol.upper()] = Web3.to_checksum_address(address)
+
+        for pool in data.get('pools', []):
+            self.add_pool(Pool(**pool))
+
+    async def load_pool_created_events(
+        self,
+        web3: Web3,
+        factory_address: str,
+        event_signature: str = 'PairCreated(address,address,address,uint256)',
+        from_block: int = 0,
+        to_block: int | str = 'latest'
+    ) -> None:
+        """
+        Add the pools created by a DEX factory.
+
+        The events must have the indexed token addresses as the first topics
+        and the pool address as the first data word, like the Uniswap V2
+        `PairCreated` and the SyncSwap `PoolCreated` events.
+
+        Args:
+            web3 (Web3): the Web3 instance.
+            factory_address (str): the factory address.
+            event_signature (str): the event signature
+                (default is 'PairCreated(address,address,address,uint256)').
+            from_block (int): the first block (default is 0).
+            to_block (int | str): the last block (default is 'latest').
+
+        """
+        logs = await web3.eth.get_logs({
+            'address': Web3.to_checksum_address(factory_address),
+            'topics': [Web3.keccak(text=event_signature).hex()],
+            'fromBlock': from_block,
+            'toBlock': to_block,
+        })
+
+        for log in logs:
+            self.add_pool(Pool(
+                token_a=self._topic_to_address(log['topics'][1]),
+                token_b=self._topic_to_address(log['topics'][2]),
+                address=self._topic_to_address(bytes(log['data'])[:32])
+            ))
+
+    def add_pool(self, pool: Pool) -> None:
+        self.pools.append(pool)
+        self._pools_by_token.setdefault(pool.token_a, []).append(pool)
+        self._pools_by_token.setdefault(pool.token_b, []).append(pool)
+        self._routes.clear()
+
+    def get_token_address(self, token_symbol: str) -> str | None:
+        return self.tokens.get(token_symbol.upper())
+
+    def get_routes(
+        self,
+        from_token: str,
+        to_token: str,
+        count: int = 3,
+        max_hops: int = 3
+    ) -> list[list[Pool]]:
+        """
+        Get the cheapest routes between the tokens.
+
+        Args:
+            from_token (str): the address of the token to swap from.
+            to_token (str): the address of the token to swap to.
+            count (int): the max number of routes (default is 3).
+            max_hops (int): the max number of pools in a route (default is 3).
+
+        Returns:
+            list[list[Pool]]: the routes from the cheapest one.
+
+        """
+        from_token = Web3.to_checksum_address(from_token)
+        to_token = Web3.to_checksum_address(to_token)
+        key = (from_token, to_token, count, max_hops)
+
+        if key not in self._routes:
+            self._routes[key] = self._find_routes(
+                from_token, to_token, count, max_hops
+            )
+
+        return self._routes[key]
+
+    def _find_routes(
+        self,
+        from_token: str,
+        to_token: str,
+        count: int,
+        max_hops: int
+    ) -> list[list[Pool]]:
+        # Yen's algorithm: every next route deviates from a found one at some token,
+        # the spur routes only get the hops left after their root routes
+        shortest_route = self._find_shortest_route(from_token, to_token, max_hops)
+        if shortest_route is None:
+            return []
+
+        routes = [shortest_route]
+        candidates = []
+        seen_routes = {tuple(map(id, shortest_route))}
+        counter = itertools.count()
+
+        while len(routes) < count:
+            last_route = routes[-1]
+            last_tokens = self.get_route_tokens(from_token, last_route)
+
+            for i, spur_token in enumerate(last_tokens[:-1]):
+                if i >= max_hops:
+                    break
+
+                root_route = last_route[:i]
+                excluded_pools = {
+                    id(route[i]) for route in routes
+                    if len(route) > i and route[:i] == root_route
+                }
+                spur_route = self._find_shortest_route(
+                    spur_token,
+                    to_token,
+                    max_hops - i,
+                    excluded_tokens=set(last_tokens[:i]),
+                    excluded_pools=excluded_pools
+                )
+                if spur_route is None:
+                    continue
+
+                route = root_route + spur_route
+                route_key = tuple(map(id, route))
+                if route_key not in seen_routes:
+                    seen_routes.add(route_key)
+                    heapq.heappush(
+                        candidates, (self._get_cost(route), next(counter), route)
+                    )
+
+            if not candidates:
+                break
+
+            routes.append(heapq.heappop(candidates)[2])
+
+        return routes
+
+    def _find_shortest_route(
+        self,
+        from_token: str,
+        to_token: str,
+        max_hops: int,
+        excluded_tokens: set[str] | None = None,
+        excluded_pools: set[int] | None = None
+    ) -> list[Pool] | None:
+        # Dijkstra over (token, hops) states, so a cheaper route with too many
+        # hops never hides a longer one within the limit
+        if from_token == to_token:
+            return None
+
+        excluded_tokens = excluded_tokens or set()
+        excluded_pools = excluded_pools or set()
+        start = (from_token, 0)
+        costs = {start: 0.}
+        previous: dict[tuple[str, int], tuple[tuple[str, int], Pool]] = {}
+        counter = itertools.count()
+        queue = [(0., next(counter), start)]
+        end = None
+
+        while queue:
+            cost, _, state = heapq.heappop(queue)
+            token, hops = state
+            if token == to_token:
+                end = state
+                break
+            if cost > costs[state] or hops >= max_hops:
+                continue
+
+            for pool in self._pools_by_token.get(token, []):
+                next_token = pool.get_other_token(token)
+                if id(pool) in excluded_pools or next_token in excluded_tokens:
+                    continue
+
+                next_state = (next_token, hops + 1)
+                next_cost = cost + pool.weight
+                if next_cost < costs.get(next_state, float('inf')):
+                    costs[next_state] = next_cost
+                    previous[next_state] = (state, pool)
+                    heapq.heappush(queue, (next_cost, next(counter), next_state))
+
+        if end is None:
+            return None
+
+        route = []
+        state = end
+        while state != start:
+            state, pool = previous[state]
+            route.append(pool)
+
+        return route[::-1]
+
+    @staticmethod
+    def get_route_tokens(from_token: str, route: list[Pool]) -> list[str]:
+        tokens = [from_token]
+        for pool in route:
+            tokens.append(pool.get_other_token(tokens[-1]))
+
+        return tokens
+
+    @staticmethod
+    def _get_cost(route: list[Pool]) -> float:
+        return sum(pool.weight for pool in route)
+
+    @staticmethod
+    def _topic_to_address(topic: bytes) -> str:
+        return Web3.to_checksum_address(bytes(topic)[-20:])
@@ -1,8 +1,15 @@
+from abc import ABC, abstractmethod
+
 import async_eth_lib.models.others.exceptions as exceptions
+from async_eth_lib.models.contracts.contracts import TokenContractData
+from async_eth_lib.models.swap.route_graph import Pool, RouteGraph
 from async_eth_lib.models.swap.tx_payload_details import TxPayloadDetails
 
 
 class TxPayloadDetailsFetcher:
+    """
+    Gets the swap payload details of the token pairs of a DEX from fixed PATHS.
+    """
     PATHS: dict[str, dict[str: TxPayloadDetails]] = {}
 
     @classmethod
@@ -11,9 +18,23 @@ class TxPayloadDetailsFetcher:
         first_token: str,
         second_token: str
     ) -> TxPayloadDetails:
-        first_token = first_token.upper()
-        second_token = second_token.upper()
+        return cls._get_path(first_token.upper(), second_token.upper())
+
+    @classmethod
+    def get_candidate_tx_payload_details(
+        cls,
+        first_token: str,
+        second_token: str,
+        count: int | None = None
+    ) -> list[TxPayloadDetails]:
+        return [cls.get_tx_payload_details(first_token, second_token)]
 
+    @classmethod
+    def _get_path(
+        cls,
+        first_token: str,
+        second_token: str
+    ) -> TxPayloadDetails:
         if first_token not in cls.PATHS:
             raise exceptions.TxPayloadDetailsNotAdded(
                 f"The '{first_token}' token has not been "
@@ -29,3 +50,158 @@ class TxPayloadDetailsFetcher:
             )
 
         return available_token_routes[second_token]
+
+
+class RouteGraphFetcher(TxPayloadDetailsFetcher, ABC):
+    """
+    Builds the swap payload details of the token pairs of a DEX from its pools.
+
+    A fetcher with NETWORK_NAME and DEX_NAME finds the routes in the
+    RouteGraph of the DEX pool file and builds the details of every route
+    with its `build_tx_payload_details`. A fixed PATHS entry of a pair
+    comes first, with its own method and flags, and the graph adds the
+    other routes of the pair.
+    """
+    NETWORK_NAME: str | None = None
+    DEX_NAME: str | None = None
+    TOKEN_CONTRACTS: type[TokenContractData] | None = None
+    ROUTES_COUNT: int = 3
+    MAX_HOPS: int = 3
+
+    @classmethod
+    def get_route_graph(cls) -> RouteGraph | None:
+        if not cls.NETWORK_NAME or not cls.DEX_NAME:
+            return None
+
+        return RouteGraph.get_graph(
+            network_name=cls.NETWORK_NAME, dex_name=cls.DEX_NAME
+        )
+
+    @classmethod
+    def get_tx_payload_details(
+        cls,
+        first_token: str,
+        second_token: str
+    ) -> TxPayloadDetails:
+        return cls.get_candidate_tx_payload_details(
+            first_token=first_token,
+            second_token=second_token,
+            count=1
+        )[0]
+
+    @classmethod
+    def get_candidate_tx_payload_details(
+        cls,
+        first_token: str,
+        second_token: str,
+        count: int | None = None
+    ) -> list[TxPayloadDetails]:
+        """
+        Get the payload details of the cheapest routes between the tokens.
+
+        Args:
+            first_token (str): the symbol of the token to swap from.
+            second_token (str): the symbol of the token to swap to.
+            count (int | None): the max number of routes (default is ROUTES_COUNT).
+
+        Returns:
+            list[TxPayloadDetails]: the details from the cheapest route.
+
+        Raises:
+            TxPayloadDetailsNotAdded: if there is no route between the tokens.
+
+        """
+        first_token = first_token.upper()
+        second_token = second_token.upper()
+        count = count or cls.ROUTES_COUNT
+        path = cls.PATHS.get(first_token, {}).get(second_token)
+        candidates = [path] if path else []
+
+        route_graph = cls.get_route_graph()
+        if route_graph and route_graph.pools and len(candidates) < count:
+            from_token_address = cls.get_token_address(first_token, route_graph)
+            routes = route_graph.get_routes(
+                from_token=from_token_address,
+                to_token=cls.get_token_address(second_token, route_graph),
+                count=count,
+                max_hops=cls.MAX_HOPS
+            )
+            for route in routes:
+                tx_payload_details = cls.build_tx_payload_details(
+                    first_token=first_token,
+                    second_token=second_token,
+                    tokens=RouteGraph.get_route_tokens(from_token_address, route),
+                    route=route
+                )
+                if path and cls._is_same_path(
+                    tx_payload_details.swap_path, path.swap_path
+                ):
+                    continue
+
+                candidates.append(tx_payload_details)
+
+        if not candidates:
+            return [cls._get_path(first_token, second_token)]
+
+        return candidates[:count]
+
+    @classmethod
+    def get_token_address(cls, token_symbol: str, route_graph: RouteGraph) -> str:
+        """
+        Get the address of the token in the pools, wrapped if the token is native.
+
+        Args:
+            token_symbol (str): the token symbol.
+            route_graph (RouteGraph): the graph of the DEX.
+
+        Returns:
+            str: the token address.
+
+        Raises:
+            TxPayloadDetailsNotAdded: if the token is unknown.
+
+        """
+        address = route_graph.get_token_address(token_symbol)
+        if address:
+            return address
+
+        try:
+            token_contract = cls.TOKEN_CONTRACTS.get_token(token_symbol)
+            if token_contract.is_native_token:
+                token_contract = cls.TOKEN_CONTRACTS.get_token(f'W{token_symbol}')
+        except (AttributeError, exceptions.ContractNotExists):
+            raise exceptions.TxPayloadDetailsNotAdded(
+                f"The '{token_symbol}' token has not been "
+                f"added to {cls.__name__} pools tokens"
+            )
+
+        return token_contract.address
+
+    @classmethod
+    @abstractmethod
+    def build_tx_payload_details(
+        cls,
+        first_token: str,
+        second_token: str,
+        tokens: list[str],
+        route: list[Pool]
+    ) -> TxPayloadDetails:
+        """
+        Build the payload details of a route.
+
+        Args:
+            first_token (str): the symbol of the token to swap from.
+            second_token (str): the symbol of the token to swap to.
+            tokens (list[str]): the token addresses along the route.
+            route (list[Pool]): the pools of the route.
+
+        Returns:
+            TxPayloadDetails: the payload details.
+
+        """
+
+    @staticmethod
+    def _is_same_path(first_path: list[str], second_path: list[str]) -> bool:
+        return [address.lower() for address in first_path] == [
+            address.lower() for address in second_path
+        ]
@@ -0,0 +1,122 @@
+import asyncio
+import time
+
+from async_eth_lib.models.account.account_manager import AccountManager
+from async_eth_lib.models.others.common import AutoRepr
+
+
+class FeeSnapshot(AutoRepr):
+    """
+    Fee values of a network at some block.
+
+    Attributes:
+        block_number (int): the block the values were read at.
+        gas_price (int): the legacy gas price in Wei.
+        base_fee (int | None): the base fee of the next block in Wei (None for legacy networks).
+        max_priority_fee (int | None): the suggested priority fee in Wei (None for legacy networks).
+        timestamp (float): the monotonic time of the refresh.
+
+    """
+
+    def __init__(
+        self,
+        block_number: int,
+        gas_price: int,
+        base_fee: int | None = None,
+        max_priority_fee: int | None = None
+    ) -> None:
+        self.block_number = block_number
+        self.gas_price = gas_price
+        self.base_fee = base_fee
+        self.max_priority_fee = max_priority_fee
+        self.timestamp = time.monotonic()
+
+
+class FeeOracle:
+    """
+    A per-network fee service shared by all clients of the network.
+
+    A snapshot is refreshed at most once per block time of the network, and
+    concurrent requests for a stale snapshot wait for one shared refresh,
+    so many wallets on one chain make one fee request per block.
+    """
+    BLOCK_TIME: float = 3.
+    BLOCK_TIMES: dict[int, float] = {
+        1: 12.,
+        10: 2.,
+        56: 3.,
+        137: 2.,
+        324: 1.,
+        42161: 1.,
+        43114: 2.,
+    }
+    SNAPSHOTS: dict[int, FeeSnapshot] = {}
+    REFRESHES: dict[int, asyncio.Future] = {}
+
+    @classmethod
+    def get_max_age(cls, chain_id: int) -> float:
+        """Get the time in seconds a fee value of the network stays fresh."""
+        return cls.BLOCK_TIMES.get(chain_id, cls.BLOCK_TIME)
+
+    @classmethod
+    async def get_snapshot(cls, account_manager: AccountManager) -> FeeSnapshot:
+        """
+        Get the fee snapshot of the account manager network.
+
+        Args:
+            account_manager (AccountManager): the account manager of the network.
+
+        Returns:
+            FeeSnapshot: a snapshot not older than the block time of the network.
+
+        """
+        # the snapshots are keyed by the resolved chain id, never by None
+        await account_manager.network.resolve()
+        chain_id = account_manager.network.chain_id
+        max_age = cls.get_max_age(chain_id)
+
+        snapshot = cls.SNAPSHOTS.get(chain_id)
+        if snapshot and time.monotonic() - snapshot.timestamp < max_age:
+            return snapshot
+
+        refresh = cls.REFRESHES.get(chain_id)
+        if not refresh:
+            refresh = asyncio.ensure_future(cls._refresh(account_manager))
+            cls.REFRESHES[chain_id] = refresh
+            refresh.add_done_callback(
+                lambda _: cls.REFRESHES.pop(chain_id, None)
+            )
+
+        # shielded, so a cancelled waiter does not cancel the shared refresh
+        return await asyncio.shield(refresh)
+
+    @classmethod
+    async def _refresh(cls, account_manager: AccountManager) -> FeeSnapshot:
+        w3 = account_manager.w3
+
+        async with w3.provider.batcher.batch():
+            if account_manager.network.tx_type == 2:
+                fee_history, gas_price, max_priority_fee = await asyncio.gather(
+                    w3.eth.fee_history(1, 'latest', []),
+                    w3.eth.gas_price,
+                    w3.eth.max_priority_fee
+                )
+                snapshot = FeeSnapshot(
+                    block_number=fee_history['oldestBlock'],
+                    gas_price=gas_price,
+                    base_fee=fee_history['baseFeePerGas'][-1],
+                    max_priority_fee=max_priority_fee
+                )
+            else:
+                block_number, gas_price = await asyncio.gather(
+                    w3.eth.block_number,
+                    w3.eth.gas_price
+                )
+                snapshot = FeeSnapshot(
+                    block_number=block_number,
+                    gas_price=gas_price
+                )
+
+        cls.SNAPSHOTS[account_manager.network.chain_id] = snapshot
+
+        return snapshot
@@ -0,0 +1,105 @@
+import asyncio
+
+from eth_typing import ChecksumAddress
+
+from async_eth_lib.models.account.account_manager import AccountManager
+
+
+class NonceManager:
+    """
+    Hands out nonces per (chain id, address) without asking the RPC for every transaction.
+
+    The pending nonce is fetched once, then nonces are reserved locally under
+    a lock, so concurrent sends from one wallet never get the same nonce.
+    """
+    NONCES: dict[tuple[int, ChecksumAddress], int] = {}
+    LOCKS: dict[tuple[int, ChecksumAddress], asyncio.Lock] = {}
+    RESYNC_ERRORS: tuple[str, ...] = (
+        'nonce too low',
+        'nonce too high',
+        'invalid nonce',
+        'already known',
+    )
+
+    @staticmethod
+    def _get_key(
+        account_manager: AccountManager,
+        address: ChecksumAddress | None = None
+    ) -> tuple[int, ChecksumAddress]:
+        return (
+            account_manager.network.chain_id,
+            address or account_manager.account.address
+        )
+
+    @classmethod
+    async def reserve_nonce(
+        cls,
+        account_manager: AccountManager,
+        address: ChecksumAddress | None = None
+    ) -> int:
+        """
+        Reserve the next nonce of the address.
+
+        Args:
+            account_manager (AccountManager): the account manager of the network.
+            address (ChecksumAddress | None): the address (default is the account address).
+
+        Returns:
+            int: the reserved nonce.
+
+        """
+        await account_manager.network.resolve()
+        key = cls._get_key(account_manager, address)
+        lock = cls.LOCKS.setdefault(key, asyncio.Lock())
+
+        async with lock:
+            if key not in cls.NONCES:
+                cls.NONCES[key] = await account_manager.w3.eth.get_transaction_count(
+                    key[1], 'pending'
+                )
+
+            nonce = cls.NONCES[key]
+            cls.NONCES[key] = nonce + 1
+
+        return nonce
+
+    @classmethod
+    def release_nonce(
+        cls,
+        account_manager: AccountManager,
+        nonce: int,
+        address: ChecksumAddress | None = None
+    ) -> None:
+        """
+        Give back a reserved nonce of a transaction that was not sent.
+
+        If later nonces were already reserved, the nonce is resynchronized
+        from the RPC on the next reservation to fill the gap.
+
+        Args:
+            account_manager (AccountManager): the account manager of the network.
+            nonce (int): the unused nonce.
+            address (ChecksumAddress | None): the address (default is the account address).
+
+        """
+        key = cls._get_key(account_manager, address)
+
+        if cls.NONCES.get(key) == nonce + 1:
+            cls.NONCES[key] = nonce
+        else:
+            cls.reset(account_manager, address)
+
+    @classmethod
+    def reset(
+        cls,
+        account_manager: AccountManager,
+        address: ChecksumAddress | None = None
+    ) -> None:
+        """Forget the local nonce, so the next reservation fetches it from the RPC."""
+        cls.NONCES.pop(cls._get_key(account_manager, address), None)
+
+    @classmethod
+    def is_nonce_error(cls, error: Exception) -> bool:
+        error_message = str(error).lower()
+
+        return any(message in error_message for message in cls.RESYNC_ERRORS)
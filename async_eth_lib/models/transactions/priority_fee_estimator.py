@@ -0,0 +1,118 @@
+import statistics
+import time
+
+from async_eth_lib.models.account.account_manager import AccountManager
+from async_eth_lib.models.others.constants import FeeStrategy
+from async_eth_lib.models.others.token_amount import TokenAmount
+from .fee_oracle import FeeOracle
+
+
+class PriorityFeeEstimator:
+    """
+    Estimates the priority fee (tip) from `eth_feeHistory` reward percentiles.
+
+    One `eth_feeHistory` call returns the rewards of all strategies over the
+    block window, so the estimation costs a single request regardless of the
+    block size, and the result is reused for the block time of the network.
+    """
+    BLOCK_COUNT: int = 10
+    PERCENTILES: dict[str, float] = {
+        FeeStrategy.SLOW: 10.,
+        FeeStrategy.NORMAL: 50.,
+        FeeStrategy.FAST: 90.,
+    }
+    ESTIMATES: dict[tuple[int, int], tuple[float, dict[str, int]]] = {}
+
+    @classmethod
+    async def estimate(
+        cls,
+        account_manager: AccountManager,
+        strategy: str = FeeStrategy.NORMAL,
+        block_count: int | None = None
+    ) -> TokenAmount:
+        """
+        Estimate the max priority fee for a strategy.
+
+        Args:
+            account_manager (AccountManager): the account manager of the network.
+            strategy (str): a FeeStrategy value (default is FeeStrategy.NORMAL).
+            block_count (int | None): the number of latest blocks to take
+                into account (default is PriorityFeeEstimator.BLOCK_COUNT).
+
+        Returns:
+            TokenAmount: the estimated max priority fee.
+
+        Example:
+        ```python
+        max_priority_fee = await PriorityFeeEstimator.estimate(
+            account_manager=client.account_manager,
+            strategy=FeeStrategy.FAST
+        )
+        ```
+
+        """
+        if strategy not in cls.PERCENTILES:
+            raise ValueError(f'Unknown fee strategy: {strategy}')
+
+        estimates = await cls.estimate_all(
+            account_manager=account_manager, block_count=block_count
+        )
+
+        return TokenAmount(
+            amount=estimates[strategy],
+            decimals=account_manager.network.decimals,
+            wei=True
+        )
+
+    @classmethod
+    async def estimate_all(
+        cls,
+        account_manager: AccountManager,
+        block_count: int | None = None
+    ) -> dict[str, int]:
+        """
+        Estimate the max priority fees in Wei for all strategies.
+
+        Args:
+            account_manager (AccountManager): the account manager of the network.
+            block_count (int | None): the number of latest blocks to take
+                into account (default is PriorityFeeEstimator.BLOCK_COUNT).
+
+        Returns:
+            dict[str, int]: the max priority fees in Wei by FeeStrategy values.
+
+        """
+        block_count = block_count or cls.BLOCK_COUNT
+        await account_manager.network.resolve()
+        chain_id = account_manager.network.chain_id
+        key = (chain_id, block_count)
+
+        cached = cls.ESTIMATES.get(key)
+        if cached and time.monotonic() - cached[0] < FeeOracle.get_max_age(chain_id):
+            return cached[1]
+
+        strategies = list(cls.PERCENTILES)
+        fee_history = await account_manager.w3.eth.fee_history(
+            block_count,
+            'latest',
+            [cls.PERCENTILES[strategy] for strategy in strategies]
+        )
+
+        # empty blocks report zero rewards and would pull the estimate down
+        rewards = [
+            block_rewards for block_rewards in fee_history.get('reward', [])
+            if any(block_rewards)
+        ]
+        estimates = {
+            strategy: (
+                int(statistics.median(
+                    block_rewards[index] for block_rewards in rewards
+                ))
+                if rewards else 0
+            )
+            for index, strategy in enumerate(strategies)
+        }
+
+        cls.ESTIMATES[key] = (time.monotonic(), estimates)
+
+        return estimates
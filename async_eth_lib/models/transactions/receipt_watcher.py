@@ -0,0 +1,191 @@
+import asyncio
+import logging
+
+from hexbytes import HexBytes
+from web3 import Web3, AsyncWeb3
+from web3.exceptions import TimeExhausted, TransactionNotFound
+from web3.types import TxReceipt, _Hash32
+
+logger = logging.getLogger(__name__)
+
+
+class ReceiptWatcher:
+    """
+    Waits for the receipts of all pending transactions of an RPC endpoint at once.
+
+    The watcher polls the block number and, once per new block, asks for the
+    receipts of all pending hashes in one batched request, so the RPC load
+    does not grow with the number of waiting transactions. Hashes added
+    since the last check are checked on their own without waiting for a new
+    block. Failed polls are retried with an exponential backoff of up to
+    MAX_BACKOFF poll intervals.
+
+    Attributes:
+        web3 (Web3 | AsyncWeb3): the Web3 instance used for polling.
+        poll_interval (float): the block number polling interval in seconds.
+
+    """
+    POLL_INTERVAL: float = 1.
+    MAX_BACKOFF: int = 16
+    WATCHERS: dict[str, 'ReceiptWatcher'] = {}
+
+    def __init__(
+        self,
+        web3: Web3 | AsyncWeb3,
+        poll_interval: float | None = None
+    ) -> None:
+        """
+        Initialize the class.
+
+        Args:
+            web3 (Web3 | AsyncWeb3): the Web3 instance used for polling.
+            poll_interval (float | None): the block number polling interval
+                in seconds (default is ReceiptWatcher.POLL_INTERVAL).
+
+        """
+        self.web3 = web3
+        self.poll_interval = poll_interval or self.POLL_INTERVAL
+        self._waiters: dict[HexBytes, list[asyncio.Future]] = {}
+        self._new_hashes: set[HexBytes] = set()
+        self._new_hash_event: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+
+    @classmethod
+    def get_watcher(
+        cls,
+        web3: Web3 | AsyncWeb3,
+        poll_interval: float | None = None
+    ) -> 'ReceiptWatcher':
+        """
+        Get the watcher of the Web3 instance endpoint.
+
+        Args:
+            web3 (Web3 | AsyncWeb3): the Web3 instance.
+            poll_interval (float | None): the block number polling interval
+                in seconds of a new watcher (default is ReceiptWatcher.POLL_INTERVAL).
+
+        Returns:
+            ReceiptWatcher: the watcher shared by all Web3 instances of the endpoint.
+
+        """
+        key = getattr(web3.provider, 'endpoint_uri', None) or str(id(web3))
+
+        if key not in cls.WATCHERS:
+            cls.WATCHERS[key] = cls(web3=web3, poll_interval=poll_interval)
+
+        return cls.WATCHERS[key]
+
+    async def wait_for_receipt(
+        self,
+        tx_hash: _Hash32,
+        timeout: int | float = 120
+    ) -> TxReceipt:
+        """
+        Wait for the transaction receipt.
+
+        Args:
+            tx_hash (_Hash32): the transaction hash.
+            timeout (int | float): the receipt waiting timeout (default is 120 sec).
+
+        Returns:
+            TxReceipt: the transaction receipt.
+
+        """
+        tx_hash = HexBytes(tx_hash)
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(tx_hash, []).append(future)
+        self._new_hashes.add(tx_hash)
+
+        if not self._task or self._task.done():
+            self._new_hash_event = asyncio.Event()
+            self._task = asyncio.ensure_future(self._watch())
+        else:
+            self._new_hash_event.set()
+
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            raise TimeExhausted(
+                f'Transaction {tx_hash.hex()} is not in the chain after {timeout} seconds'
+            )
+        finally:
+            self._discard(tx_hash, future)
+
+    def _discard(self, tx_hash: HexBytes, future: asyncio.Future) -> None:
+        futures = self._waiters.get(tx_hash, [])
+        if future in futures:
+            futures.remove(future)
+
+        if not futures:
+            self._waiters.pop(tx_hash, None)
+            self._new_hashes.discard(tx_hash)
+
+    async def _watch(self) -> None:
+        last_block_number = None
+        failures = 0
+
+        while self._waiters:
+            try:
+                block_number = await self.web3.eth.block_number
+                if block_number != last_block_number:
+                    await self._check_receipts(list(self._waiters))
+                    last_block_number = block_number
+                elif self._new_hashes:
+                    await self._check_receipts(list(self._new_hashes))
+                failures = 0
+            except Exception as e:
+                # a failed poll is retried, the waiters are bounded by their timeouts
+                failures += 1
+                logger.debug(f'Receipt poll #{failures} failed: {e}')
+
+            if not self._waiters:
+                break
+
+            if failures:
+                await asyncio.sleep(
+                    self.poll_interval * min(2 ** (failures - 1), self.MAX_BACKOFF)
+                )
+            else:
+                await self._sleep()
+
+    async def _sleep(self) -> None:
+        # a new hash ends the sleep, so it does not wait for the next poll
+        try:
+            await asyncio.wait_for(
+                self._new_hash_event.wait(), timeout=self.poll_interval
+            )
+        except asyncio.TimeoutError:
+            pass
+
+        self._new_hash_event.clear()
+
+    async def _check_receipts(self, tx_hashes: list[HexBytes]) -> None:
+        batcher = getattr(self.web3.provider, 'batcher', None)
+
+        if batcher:
+            async with batcher.batch():
+                receipts = await self._get_receipts(tx_hashes)
+        else:
+            receipts = await self._get_receipts(tx_hashes)
+
+        self._new_hashes.difference_update(tx_hashes)
+
+        for tx_hash, receipt in zip(tx_hashes, receipts):
+            if isinstance(receipt, BaseException) or receipt is None:
+                continue
+
+            for future in self._waiters.get(tx_hash, []):
+                if not future.done():
+                    future.set_result(receipt)
+
+    async def _get_receipts(
+        self,
+        tx_hashes: list[HexBytes]
+    ) -> list[TxReceipt | TransactionNotFound | Exception]:
+        return await asyncio.gather(
+            *[
+                self.web3.eth.get_transaction_receipt(tx_hash)
+                for tx_hash in tx_hashes
+            ],
+            return_exceptions=True
+        )
@@ -1,3 +1,6 @@
+import time
+from typing import Callable
+
 from web3 import Web3
 from web3.types import (
     TxParams
@@ -8,13 +11,20 @@ from eth_account.datastructures import (
 )
 
 from async_eth_lib.models.account.account_manager import AccountManager
+from async_eth_lib.models.logger.tx_event_log import TxEventLog
+from async_eth_lib.models.metrics.metrics import Metrics
+from async_eth_lib.models.others.constants import FeeStrategy, TxEventType
 from async_eth_lib.models.others.token_amount import TokenAmount
+from .fee_oracle import FeeOracle
+from .nonce_manager import NonceManager
+from .priority_fee_estimator import PriorityFeeEstimator
 from .tx import Tx
 
 
 class Transaction:
     def __init__(self, account_manager: AccountManager) -> None:
         self.account_manager = account_manager
+        self.sent_callbacks: list[Callable[[Tx], None]] = []
 
     @staticmethod
     async def decode_input_data():
@@ -40,13 +50,15 @@ class Transaction:
 
     async def get_gas_price(self) -> TokenAmount:
         """
-        Get the current gas price
+        Get the current gas price from the FeeOracle snapshot of the network
 
         Return:
             Wei 
 
         """
-        amount = await self.account_manager.w3.eth.gas_price
+        await self.account_manager.network.resolve()
+        snapshot = await FeeOracle.get_snapshot(self.account_manager)
+        amount = snapshot.gas_price
 
         return TokenAmount(
             amount=amount,
@@ -55,66 +67,51 @@ class Transaction:
         )
         
     async def get_base_fee(self, increase_gas: float = 1.):
+        snapshot = await FeeOracle.get_snapshot(self.account_manager)
+        if snapshot.base_fee is not None:
+            return int(snapshot.base_fee * increase_gas)
+
         last_block = await self.account_manager.w3.eth.get_block('latest')
         return int(last_block['baseFeePerGas'] * increase_gas)
 
-    async def get_max_priority_fee_(
+    async def estimate_max_priority_fee(
         self,
-        block: dict | None = None
+        strategy: str = FeeStrategy.NORMAL,
+        block_count: int | None = None
     ) -> TokenAmount:
         """
-        Get the current max priority fee
+        Estimate the max priority fee from the rewards of the latest blocks
+
+        Args:
+            strategy (str): a FeeStrategy value (default is FeeStrategy.NORMAL).
+            block_count (int | None): the number of latest blocks to take
+                into account (default is PriorityFeeEstimator.BLOCK_COUNT).
 
         Returns:
-            Wei: the current max priority fee
+            Wei: the estimated max priority fee
 
         """
-        if not block:
-            block = await self.account_manager.w3.eth.get_block('latest')
-
-        block_number = block['number']
-        latest_block_transaction_count = (
-            await self.account_manager.w3.eth.get_block_transaction_count(
-                block_number)
-        )
-        max_priority_fee_per_gas_lst = []
-
-        for i in range(latest_block_transaction_count):
-            try:
-                transaction = (
-                    await self.account_manager.w3.eth.get_transaction_by_block(
-                        block_number, i
-                    )
-                )
-                if 'maxPriorityFeePerGas' in transaction:
-                    max_priority_fee_per_gas_lst.append(
-                        transaction['maxPriorityFeePerGas']
-                    )
-            except Exception:
-                continue
-
-        if not max_priority_fee_per_gas_lst:
-            # max_priority_fee_per_gas = w3.eth.max_priority_fee
-            max_priority_fee_per_gas = 0
-        else:
-            max_priority_fee_per_gas_lst.sort()
-            max_priority_fee_per_gas = max_priority_fee_per_gas_lst[len(
-                max_priority_fee_per_gas_lst) // 2]
-        return TokenAmount(
-            amount=max_priority_fee_per_gas,
-            decimals=self.account_manager.network.decimals,
-            wei=True
+        return await PriorityFeeEstimator.estimate(
+            account_manager=self.account_manager,
+            strategy=strategy,
+            block_count=block_count
         )
 
     async def get_max_priority_fee(self) -> TokenAmount:
         """
-        Get the current max priority fee
+        Get the current max priority fee from the FeeOracle snapshot of the network
 
         Returns:
             Wei: the current max priority fee
 
         """
-        max_priority_fee = await self.account_manager.w3.eth.max_priority_fee
+        snapshot = await FeeOracle.get_snapshot(self.account_manager)
+        max_priority_fee = snapshot.max_priority_fee
+
+        if max_priority_fee is None:
+            max_priority_fee = await self.account_manager.w3.eth.max_priority_fee
+
+        await self.account_manager.network.resolve()
 
         return TokenAmount(
             max_priority_fee,
@@ -134,6 +131,7 @@ class Transaction:
 
         """
         gas_price = await self.account_manager.w3.eth.estimate_gas(transaction=tx_params)
+        await self.account_manager.network.resolve()
 
         return TokenAmount(
             gas_price,
@@ -144,7 +142,7 @@ class Transaction:
     async def auto_add_params(self, tx_params: TxParams | dict) -> TxParams:
         """
         Add 'chainId', 'nonce', 'from', 'gasPrice' or 'maxFeePerGas' + 'maxPriorityFeePerGas' and 'gas' parameters to
-            transaction parameters if they are missing.
+            transaction parameters if they are missing. The nonce is reserved by the NonceManager.
 
         Args:
             tx_params (TxParams): parameters of the transaction.
@@ -153,17 +151,20 @@ class Transaction:
             TxParams: parameters of the transaction with added values.
 
         """
+        await self.account_manager.network.resolve()
+
         if 'chainId' not in tx_params:
             tx_params['chainId'] = self.account_manager.network.chain_id
 
-        if not tx_params.get('nonce'):
-            tx_params['nonce'] = await self.get_nonce()
+        if tx_params.get('nonce') is None:
+            tx_params.pop('nonce', None)
 
         if 'from' not in tx_params:
             tx_params['from'] = self.account_manager.account.address
 
         is_eip_1559_tx_type = self.account_manager.network.tx_type == 2
-        current_gas_price = await self.get_gas_price()
+        with self._span('gas_price'):
+            current_gas_price = await self.get_gas_price()
 
         if is_eip_1559_tx_type:
             tx_params['maxFeePerGas'] = tx_params.pop('gasPrice', current_gas_price.Wei)
@@ -172,15 +173,24 @@ class Transaction:
             tx_params['gasPrice'] = current_gas_price.Wei
 
         if 'maxFeePerGas' in tx_params and 'maxPriorityFeePerGas' not in tx_params:
-            tx_params['maxPriorityFeePerGas'] = (await self.get_max_priority_fee()).Wei
+            with self._span('priority_fee'):
+                tx_params['maxPriorityFeePerGas'] = (await self.get_max_priority_fee()).Wei
             tx_params['maxFeePerGas'] += tx_params['maxPriorityFeePerGas']
 
         multiplier_of_gas = tx_params.pop('multiplier', 1)
 
         if not tx_params.get('gas') or not int(tx_params['gas']):
-            gas = await self.get_estimate_gas(tx_params=tx_params)
+            with self._span('estimate_gas'):
+                gas = await self.get_estimate_gas(tx_params=tx_params)
             tx_params['gas'] = int(gas.Wei * multiplier_of_gas)
 
+        # reserved last, so a failed estimation does not leave a nonce gap
+        if 'nonce' not in tx_params:
+            with self._span('nonce'):
+                tx_params['nonce'] = await NonceManager.reserve_nonce(
+                    account_manager=self.account_manager
+                )
+
         return tx_params
 
     async def sign_transaction(self, tx_params: TxParams) -> SignedTransaction:
@@ -206,6 +216,7 @@ class Transaction:
         """
         Sign and send a transaction. Additionally, add 'chainId', 'nonce', 'from', 'gasPrice' or
             'maxFeePerGas' + 'maxPriorityFeePerGas' and 'gas' parameters to transaction parameters if they are missing.
+            If the reserved nonce is rejected as stale, the nonce is resynchronized and the transaction is sent once more.
 
         Args:
             tx_params (TxParams): parameters of the transaction.
@@ -214,8 +225,113 @@ class Transaction:
             Tx: the instance of the sent transaction.
 
         """
+        is_nonce_reserved = tx_params.get('nonce') is None
+
+        start_time = time.monotonic()
         tx_params = await self.auto_add_params(tx_params)
-        signed_tx = await self.sign_transaction(tx_params)
-        tx_hash = await self.account_manager.w3.eth.send_raw_transaction(transaction=signed_tx.rawTransaction)
+        self._emit_event(
+            TxEventType.PARAMS_BUILT, 'auto_add_params', tx_params, start_time,
+            gas=tx_params.get('gas'),
+            gas_price=tx_params.get('gasPrice'),
+            max_fee_per_gas=tx_params.get('maxFeePerGas'),
+            max_priority_fee_per_gas=tx_params.get('maxPriorityFeePerGas'),
+            value=tx_params.get('value')
+        )
+
+        start_time = time.monotonic()
+        try:
+            signed_tx = await self.sign_transaction(tx_params)
+        except Exception:
+            if is_nonce_reserved:
+                self._release_nonce(tx_params)
+            raise
+        self._emit_event(TxEventType.SIGNED, 'sign', tx_params, start_time)
+
+        start_time = time.monotonic()
+        try:
+            tx_hash = await self.account_manager.w3.eth.send_raw_transaction(
+                transaction=signed_tx.rawTransaction
+            )
+        except Exception as err:
+            self._emit_event(
+                TxEventType.SEND_FAILED, 'send', tx_params, start_time, error=str(err)
+            )
+
+            if not is_nonce_reserved:
+                raise
+
+            if not NonceManager.is_nonce_error(err):
+                self._release_nonce(tx_params)
+                raise
+
+            if 'already known' in str(err).lower():
+                self._emit_event(
+                    TxEventType.SENT, 'send', tx_params, start_time,
+                    tx_hash=signed_tx.hash
+                )
+
+                return self._on_sent(Tx(tx_hash=signed_tx.hash, params=tx_params))
+
+            NonceManager.reset(account_manager=self.account_manager)
+            tx_params['nonce'] = await NonceManager.reserve_nonce(
+                account_manager=self.account_manager
+            )
+
+            start_time = time.monotonic()
+            try:
+                signed_tx = await self.sign_transaction(tx_params)
+                tx_hash = await self.account_manager.w3.eth.send_raw_transaction(
+                    transaction=signed_tx.rawTransaction
+                )
+            except Exception as err:
+                self._emit_event(
+                    TxEventType.SEND_FAILED, 'send', tx_params, start_time, error=str(err)
+                )
+                self._release_nonce(tx_params)
+                raise
+
+        self._emit_event(TxEventType.SENT, 'send', tx_params, start_time, tx_hash=tx_hash)
+
+        return self._on_sent(Tx(tx_hash=tx_hash, params=tx_params))
+
+    def _release_nonce(self, tx_params: TxParams) -> None:
+        # a reserved nonce of an unsent transaction would leave a gap stalling the next ones
+        NonceManager.release_nonce(
+            account_manager=self.account_manager,
+            nonce=tx_params['nonce']
+        )
+
+    def _span(self, phase: str):
+        return Metrics.span(
+            Metrics.TX_PHASE, phase=phase, chain_id=self.account_manager.network.chain_id
+        )
+
+    def _emit_event(
+        self,
+        event: str,
+        phase: str,
+        tx_params: TxParams,
+        start_time: float,
+        **fields
+    ) -> None:
+        latency = time.monotonic() - start_time
+        Metrics.observe(
+            Metrics.TX_PHASE, latency,
+            phase=phase, chain_id=tx_params.get('chainId')
+        )
+        TxEventLog.emit(
+            event,
+            network=self.account_manager.network.name,
+            chain_id=tx_params.get('chainId'),
+            account_id=self.account_manager.account_id,
+            address=tx_params.get('from'),
+            nonce=tx_params.get('nonce'),
+            latency=latency,
+            **fields
+        )
+
+    def _on_sent(self, tx: Tx) -> Tx:
+        for callback in self.sent_callbacks:
+            callback(tx)
 
-        return Tx(tx_hash=tx_hash, params=tx_params)
+        return tx
@@ -1,14 +1,20 @@
+import time
 from typing import Any
 from hexbytes import HexBytes
 
 from web3 import Web3, AsyncWeb3
+from web3.exceptions import TimeExhausted
 from web3.types import (
     TxReceipt,
     _Hash32,
 )
 
 from async_eth_lib.models.account.account_manager import AccountManager
+from async_eth_lib.models.logger.tx_event_log import TxEventLog
+from async_eth_lib.models.metrics.metrics import Metrics
 from async_eth_lib.models.others.common import AutoRepr
+from async_eth_lib.models.others.constants import TxEventType
+from .receipt_watcher import ReceiptWatcher
 
 import async_eth_lib.models.others.exceptions as exceptions
 
@@ -23,6 +29,7 @@ class Tx(AutoRepr):
         receipt (Optional[TxReceipt]): a transaction receipt.
         function_identifier (Optional[str]): a function identifier.
         input_data (Optional[Dict[str, Any]]): an input data.
+        created_at (float): the monotonic time the instance was created (e.g. sent) at.
 
     """
     hash: _Hash32 | None
@@ -30,6 +37,7 @@ class Tx(AutoRepr):
     receipt: TxReceipt | None
     function_identifier: str | None
     input_data: dict[str, Any] | None
+    created_at: float
 
     def __init__(
         self,
@@ -56,6 +64,7 @@ class Tx(AutoRepr):
         self.receipt = None
         self.function_identifier = None
         self.input_data = None
+        self.created_at = time.monotonic()
 
     async def parse_params(self, account_manager: AccountManager) -> dict[str, Any]:
         """
@@ -69,6 +78,7 @@ class Tx(AutoRepr):
 
         """
         tx_data = await account_manager.w3.eth.get_transaction(transaction_hash=self.hash)
+        await account_manager.network.resolve()
         self.params = {
             'chainId': account_manager.network.chain_id,
             'nonce': int(tx_data.get('nonce')),
@@ -86,26 +96,70 @@ class Tx(AutoRepr):
         self,
         web3: Web3 | AsyncWeb3,
         timeout: int | float = 120,
-        poll_latency: float = 0.1
+        poll_latency: float | None = None
     ) -> TxReceipt:
         """
         Wait for the transaction receipt.
 
+        The receipt is awaited through the ReceiptWatcher of the RPC endpoint,
+        which checks all pending transactions once per block.
+
         Args:
             web3 (Union[Web3, AsyncWeb3]): the Web3 instance.
             timeout (Union[int, float]): the receipt waiting timeout. (120 sec)
-            poll_latency (float): the poll latency. (0.1 sec)
+            poll_latency (Optional[float]): the block polling interval of a new
+                watcher. (ReceiptWatcher.POLL_INTERVAL)
 
         Returns:
             Dict[str, Any]: the transaction receipt.
 
         """
-        self.receipt = await web3.eth.wait_for_transaction_receipt(
-            transaction_hash=self.hash, timeout=timeout, poll_latency=poll_latency
+        watcher = ReceiptWatcher.get_watcher(web3=web3, poll_interval=poll_latency)
+        start_time = time.monotonic()
+
+        try:
+            self.receipt = await watcher.wait_for_receipt(
+                tx_hash=self.hash, timeout=timeout
+            )
+        except TimeExhausted:
+            self._emit_event(TxEventType.RECEIPT_TIMEOUT, start_time)
+            raise
+
+        gas_used = self.receipt.get('gasUsed')
+        effective_gas_price = self.receipt.get('effectiveGasPrice')
+        self._emit_event(
+            TxEventType.RECEIPT, start_time,
+            status=self.receipt.get('status'),
+            block_number=self.receipt.get('blockNumber'),
+            gas_used=gas_used,
+            effective_gas_price=effective_gas_price,
+            fee=(
+                gas_used * effective_gas_price
+                if gas_used is not None and effective_gas_price is not None
+                else None
+            ),
+            confirmation_time=time.monotonic() - self.created_at
         )
 
         return self.receipt
 
+    def _emit_event(self, event: str, start_time: float, **fields) -> None:
+        params = self.params or {}
+        latency = time.monotonic() - start_time
+        Metrics.observe(
+            Metrics.TX_PHASE, latency,
+            phase='receipt', chain_id=params.get('chainId')
+        )
+        TxEventLog.emit(
+            event,
+            chain_id=params.get('chainId'),
+            address=params.get('from'),
+            nonce=params.get('nonce'),
+            tx_hash=self.hash,
+            latency=latency,
+            **fields
+        )
+
     async def decode_input_data(self):
         pass
 
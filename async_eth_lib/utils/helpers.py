@@ -25,7 +25,8 @@ def read_txt(path: str | tuple | list) -> List[str]:
 
 def read_json(path: str | tuple | list, encoding: str | None = None) -> list | dict:
     path = join_path(path)
-    return json.load(open(path, encoding=encoding))
+    with open(path, encoding=encoding) as file:
+        return json.load(file)
 
 
 async def sleep(sleep_from: int, sleep_to: int):
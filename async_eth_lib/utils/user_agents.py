@@ -0,0 +1,31 @@
+import random
+
+from fake_useragent import UserAgent
+
+
+class UserAgentPool:
+    """
+    A process-wide pool of random user agents.
+
+    `UserAgent()` loads the fake_useragent data file on every call, so the
+    pool is filled once with POOL_SIZE agents and sampled afterwards.
+    """
+    POOL_SIZE: int = 50
+    USER_AGENTS: list[str] = []
+
+    @classmethod
+    def load(cls) -> None:
+        """Fill the pool, if it is not filled yet."""
+        if cls.USER_AGENTS:
+            return
+
+        user_agent = UserAgent()
+        cls.USER_AGENTS = list({
+            user_agent.random for _ in range(cls.POOL_SIZE)
+        })
+
+    @classmethod
+    def get_random(cls) -> str:
+        cls.load()
+
+        return random.choice(cls.USER_AGENTS)
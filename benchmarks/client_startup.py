@@ -0,0 +1,51 @@
+"""
+Measure the time and memory needed to construct many Client objects.
+
+Usage:
+    python -m benchmarks.client_startup [count]
+"""
+import secrets
+import sys
+import time
+import tracemalloc
+
+from async_eth_lib.models.client import Client
+from async_eth_lib.models.networks.networks import Networks
+
+
+TARGET_MS_PER_CLIENT = 1.
+
+
+def create_clients(private_keys: list[str]) -> list[Client]:
+    return [
+        Client(account_id=i, private_key=private_key, network=Networks.ZkSync)
+        for i, private_key in enumerate(private_keys)
+    ]
+
+
+def main(count: int = 1000) -> None:
+    private_keys = [secrets.token_hex(32) for _ in range(count)]
+
+    # the one-time setup (user agent pool, ABIs) is not a per-client cost
+    Client(private_key=secrets.token_hex(32), network=Networks.ZkSync)
+
+    start_time = time.perf_counter()
+    clients = create_clients(private_keys)
+    elapsed = time.perf_counter() - start_time
+    del clients
+
+    # tracing slows the allocations down, so the memory is measured in a separate run
+    tracemalloc.start()
+    clients = create_clients(private_keys)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    ms_per_client = elapsed * 1000 / len(clients)
+    print(f'Clients:    {len(clients)}')
+    print(f'Total time: {elapsed:.3f} s')
+    print(f'Per client: {ms_per_client:.3f} ms (target < {TARGET_MS_PER_CLIENT} ms)')
+    print(f'Memory:     {memory / 1024 / 1024:.1f} MiB ({memory / len(clients) / 1024:.1f} KiB per client)')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
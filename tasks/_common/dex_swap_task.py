@@ -0,0 +1,152 @@
+from abc import ABCMeta, abstractmethod
+
+from async_eth_lib.models.others.constants import LogStatus
+from async_eth_lib.models.swap.swap_info import SwapInfo
+from async_eth_lib.models.swap.swap_query import SwapQuery
+from async_eth_lib.models.swap.tx_payload_details import TxPayloadDetails
+from tasks._common.quote_engine import QuoteCall, QuoteEngine
+from tasks._common.swap_task import SwapTask
+
+
+class DexSwapTask(SwapTask, metaclass=ABCMeta):
+    """
+    A swap task of a DEX which quotes its candidate routes on-chain.
+
+    A DEX gives the payload details of its candidate routes and the view
+    call quoting each of them, and `compute_best_route` swaps through the
+    route with the best quote.
+    """
+
+    @abstractmethod
+    def get_candidate_routes(
+        self,
+        from_token: str,
+        to_token: str
+    ) -> list[TxPayloadDetails]:
+        """
+        Get the payload details of the candidate routes of the swap, from the cheapest one.
+
+        Args:
+            from_token (str): The symbol of the token to swap from.
+            to_token (str): The symbol of the token to swap to.
+
+        Returns:
+            list[TxPayloadDetails]: The payload details of the routes.
+
+        """
+
+    @abstractmethod
+    def get_quote_call(
+        self,
+        from_token: str,
+        to_token: str,
+        amount_in: int,
+        tx_payload_details: TxPayloadDetails | None = None
+    ) -> QuoteCall:
+        """
+        Get the call which quotes the output amount of the swap route.
+
+        Args:
+            from_token (str): The symbol of the token to swap from.
+            to_token (str): The symbol of the token to swap to.
+            amount_in (int): The input amount in wei.
+            tx_payload_details (TxPayloadDetails | None): The payload details of the
+                route (default is the cheapest route).
+
+        Returns:
+            QuoteCall: The quote call.
+
+        """
+
+    def apply_quote(
+        self,
+        tx_payload_details: TxPayloadDetails,
+        quote: tuple
+    ) -> TxPayloadDetails:
+        """
+        Get the payload details of the route updated with the values returned by its quote call.
+
+        Args:
+            tx_payload_details (TxPayloadDetails): The payload details of the route.
+            quote (tuple): The decoded return values of the quote call.
+
+        Returns:
+            TxPayloadDetails: The payload details to swap with (default is the
+                unchanged details).
+
+        """
+        return tx_payload_details
+
+    async def compute_best_route(
+        self,
+        swap_query: SwapQuery,
+        swap_info: SwapInfo,
+        candidate_routes: list[TxPayloadDetails] | None = None,
+        quote: tuple | None = None
+    ) -> tuple[TxPayloadDetails, SwapQuery] | None:
+        """
+        Quote the candidate routes in one multicall and compute the minimum destination amount of the best one.
+
+        A route which can not be quoted on-chain, e.g. one without liquidity,
+        is never used, so if no route can be quoted the swap is aborted.
+
+        Args:
+            swap_query (SwapQuery): The query for the swap.
+            swap_info (SwapInfo): Information about the swap.
+            candidate_routes (list[TxPayloadDetails] | None): The routes to choose
+                from (default is all the candidate routes of the swap).
+            quote (tuple | None): The quote of the only candidate route for the
+                source amount of the query, which is then not quoted again
+                (default is quoting the routes on-chain).
+
+        Returns:
+            tuple[TxPayloadDetails, SwapQuery] | None: The best route and the updated
+                query with the minimum destination amount, or None if no route can be quoted.
+
+        """
+        candidate_routes = candidate_routes or self.get_candidate_routes(
+            from_token=swap_info.from_token,
+            to_token=swap_info.to_token
+        )
+        quote_calls = [
+            self.get_quote_call(
+                from_token=swap_info.from_token,
+                to_token=swap_info.to_token,
+                amount_in=swap_query.amount_from.Wei,
+                tx_payload_details=tx_payload_details
+            )
+            for tx_payload_details in candidate_routes
+        ]
+        quotes = (
+            [quote] if quote
+            else await QuoteEngine(self.client).get_quotes(quote_calls)
+        )
+
+        route_quotes = [
+            (quote_call.get_amount(quote), quote, tx_payload_details)
+            for quote_call, quote, tx_payload_details in zip(
+                quote_calls, quotes, candidate_routes
+            )
+            if quote and quote_call.get_amount(quote)
+        ]
+        if not route_quotes:
+            self.client.account_manager.custom_logger.log_message(
+                status=LogStatus.ERROR,
+                message=(
+                    f'{swap_info.from_token} -> {swap_info.to_token}: '
+                    f'no route can be quoted, the swap is aborted'
+                )
+            )
+
+            return None
+
+        amount_out, quote, tx_payload_details = max(
+            route_quotes, key=lambda route_quote: route_quote[0]
+        )
+
+        return self.apply_quote(tx_payload_details, quote), await self.compute_min_destination_amount(
+            swap_query=swap_query,
+            min_to_amount=amount_out,
+            swap_info=swap_info,
+            is_to_token_price_wei=True
+        )
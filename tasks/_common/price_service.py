@@ -0,0 +1,228 @@
+import asyncio
+import json
+import time
+from typing import Awaitable, Callable
+
+from aiohttp import ClientTimeout
+
+from async_eth_lib.models.others.constants import TokenSymbol
+from async_eth_lib.models.providers.provider_pool import ProviderPool
+from tasks._common.price_stream import BinancePriceStream
+
+
+class BinancePriceService:
+    """
+    A shared cache of Binance ticker prices.
+
+    The prices are requested through the pooled session and kept for TTL
+    seconds. Concurrent lookups share a single request. Every looked up
+    symbol is tracked, and all the stale tracked symbols are refreshed by
+    one request with the `symbols` parameter. With `is_bulk` set, all the
+    Binance tickers are fetched by one request instead, which only pays off
+    when most of them are used. Prices of BinancePriceStream, if it is
+    running, are used without any requests.
+
+    Example:
+    ```python
+    async with ProviderPool():
+        eth_price = await BinancePriceService.get_pair_price(TokenSymbol.ETH, TokenSymbol.USDT)
+    ```
+    """
+    TICKER_URL: str = 'https://api.binance.com/api/v3/ticker/price'
+    TTL: float = 10
+    TIMEOUT: float = 10
+    RETRIES: int = 5
+    RETRY_DELAY: float = 3
+    STABLECOINS: tuple[str, ...] = (
+        TokenSymbol.USDT,
+        TokenSymbol.USDC,
+        TokenSymbol.USDV,
+        TokenSymbol.USDC_E,
+    )
+    PRICES: dict[str, tuple[float, float | None]] = {}
+    FETCHES: dict[str, asyncio.Future] = {}
+    TRACKED_SYMBOLS: set[str] = set()
+    is_bulk: bool = False
+    bulk_updated_at: float = 0.
+
+    @classmethod
+    async def get_pair_price(
+        cls,
+        first_token: str = TokenSymbol.ETH,
+        second_token: str = TokenSymbol.USDT
+    ) -> float:
+        """
+        Get the price of the first token in the second token.
+
+        Wrapped tokens are priced as their native tokens, stablecoins are
+        priced as 1, and a pair missing on Binance is priced by its reversed pair.
+
+        Args:
+            first_token (str): the token to price (default is ETH).
+            second_token (str): the quote token (default is USDT).
+
+        Returns:
+            float: the price.
+
+        Raises:
+            ValueError: if the price can not be received.
+
+        """
+        first_token = cls.unwrap(first_token)
+        second_token = cls.unwrap(second_token)
+
+        if first_token in cls.STABLECOINS:
+            return 1
+
+        price = await cls.get_price(f'{first_token}{second_token}')
+        if price is not None:
+            return price
+
+        reversed_price = await cls.get_price(f'{second_token}{first_token}')
+        if not reversed_price:
+            raise ValueError(
+                f'Can not get {first_token}{second_token} price from Binance'
+            )
+
+        return 1 / reversed_price
+
+    @classmethod
+    async def get_price(cls, symbol: str) -> float | None:
+        """
+        Get the price of a Binance symbol.
+
+        Args:
+            symbol (str): the symbol, e.g. 'ETHUSDT'.
+
+        Returns:
+            float | None: the price or None if Binance has no such symbol.
+
+        Raises:
+            ValueError: if the price can not be received.
+
+        """
+        symbol = symbol.upper()
+
+        price = BinancePriceStream.get_price(symbol)
+        if price is not None:
+            return price
+
+        if cls.is_bulk:
+            if time.monotonic() - cls.bulk_updated_at >= cls.TTL:
+                await cls._fetch_once('', cls._fetch_all_prices)
+
+            _, price = cls.PRICES.get(symbol, (0., None))
+            return price
+
+        if not cls._get_cached(symbol):
+            cls.TRACKED_SYMBOLS.add(symbol)
+            await cls._fetch_once('*', cls._fetch_tracked_prices)
+
+        # a symbol tracked while a refresh was already running is fetched alone
+        if not cls._get_cached(symbol):
+            await cls._fetch_once(symbol, lambda: cls._fetch_price(symbol))
+
+        _, price = cls.PRICES[symbol]
+
+        return price
+
+    @classmethod
+    def _get_cached(cls, symbol: str) -> tuple[float, float | None] | None:
+        cached = cls.PRICES.get(symbol)
+        if cached and time.monotonic() - cached[0] < cls.TTL:
+            return cached
+
+        return None
+
+    @classmethod
+    async def _fetch_once(
+        cls,
+        key: str,
+        fetch: Callable[[], Awaitable[None]]
+    ) -> None:
+        future = cls.FETCHES.get(key)
+        if not future:
+            future = asyncio.ensure_future(fetch())
+            cls.FETCHES[key] = future
+            future.add_done_callback(lambda _: cls.FETCHES.pop(key, None))
+
+        await asyncio.shield(future)
+
+    @classmethod
+    async def _fetch_all_prices(cls) -> None:
+        tickers = await cls._request()
+        updated_at = time.monotonic()
+
+        for ticker in tickers:
+            cls.PRICES[ticker['symbol']] = (updated_at, float(ticker['price']))
+
+        cls.bulk_updated_at = updated_at
+
+    @classmethod
+    async def _fetch_tracked_prices(cls) -> None:
+        symbols = sorted(
+            symbol for symbol in cls.TRACKED_SYMBOLS if not cls._get_cached(symbol)
+        )
+        if not symbols:
+            return
+
+        tickers = await cls._request(symbols=symbols)
+        if tickers is None:
+            # one of the symbols is unknown to Binance, which rejects the whole request
+            await asyncio.gather(*(cls._fetch_price(symbol) for symbol in symbols))
+            return
+
+        updated_at = time.monotonic()
+        for ticker in tickers:
+            cls.PRICES[ticker['symbol']] = (updated_at, float(ticker['price']))
+
+    @classmethod
+    async def _fetch_price(cls, symbol: str) -> None:
+        ticker = await cls._request(symbol)
+        price = float(ticker['price']) if ticker else None
+        cls.PRICES[symbol] = (time.monotonic(), price)
+
+        if price is None:
+            cls.TRACKED_SYMBOLS.discard(symbol)
+
+    @classmethod
+    async def _request(
+        cls,
+        symbol: str | None = None,
+        symbols: list[str] | None = None
+    ) -> list | dict | None:
+        session = ProviderPool.get_session(rpc=cls.TICKER_URL)
+        if symbol:
+            params = {'symbol': symbol}
+        elif symbols:
+            params = {'symbols': json.dumps(symbols, separators=(',', ':'))}
+        else:
+            params = None
+
+        for _ in range(cls.RETRIES):
+            try:
+                async with session.get(
+                    cls.TICKER_URL,
+                    params=params,
+                    timeout=ClientTimeout(cls.TIMEOUT)
+                ) as response:
+                    # Binance answers 400 to an unknown symbol
+                    if response.status == 400 and (symbol or symbols):
+                        return None
+
+                    response.raise_for_status()
+                    return await response.json(content_type=None)
+            except Exception:
+                await asyncio.sleep(cls.RETRY_DELAY)
+
+        raise ValueError(
+            f'Can not get {symbol or "ticker"} price from Binance'
+        )
+
+    @staticmethod
+    def unwrap(token: str) -> str:
+        token = token.upper()
+        if token.startswith('W'):
+            token = token[1:]
+
+        return token
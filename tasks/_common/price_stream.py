@@ -0,0 +1,142 @@
+import asyncio
+import json
+import time
+
+from aiohttp import WSMsgType
+
+from async_eth_lib.models.providers.provider_pool import ProviderPool
+
+
+class BinancePriceStream:
+    """
+    An in-memory table of the last Binance prices kept up to date by a websocket.
+
+    The stream subscribes to the combined `@bookTicker` and `@miniTicker`
+    streams of the symbols, so a price is a local lookup instead of
+    a request. The best bid and ask midpoint is used when it is known,
+    otherwise the last trade price. A price older than MAX_AGE seconds is
+    considered stale, and the connection is reopened after any failure.
+
+    Example:
+    ```python
+    async with ProviderPool():
+        BinancePriceStream.start(['ETHUSDT', 'BTCUSDT'])
+        ...
+        await BinancePriceStream.stop()
+    ```
+    """
+    STREAM_URL: str = 'wss://stream.binance.com:9443/stream'
+    CHANNELS: tuple[str, ...] = ('bookTicker', 'miniTicker')
+    MAX_AGE: float = 30
+    HEARTBEAT: float = 30
+    RECONNECT_DELAY: float = 3
+    MIDPOINTS: dict[str, tuple[float, float]] = {}
+    LAST_PRICES: dict[str, tuple[float, float]] = {}
+    SYMBOLS: tuple[str, ...] = ()
+    _task: asyncio.Task | None = None
+
+    @classmethod
+    def is_running(cls) -> bool:
+        return bool(cls._task and not cls._task.done())
+
+    @classmethod
+    def start(cls, symbols: list[str]) -> None:
+        """
+        Start streaming the prices of the symbols, restarting the stream if the symbols changed.
+
+        Args:
+            symbols (list[str]): Binance symbols, e.g. 'ETHUSDT'.
+
+        """
+        symbols = tuple(sorted({symbol.upper() for symbol in symbols}))
+
+        if cls.is_running():
+            if symbols == cls.SYMBOLS:
+                return
+            cls._task.cancel()
+
+        cls.SYMBOLS = symbols
+        if symbols:
+            cls._task = asyncio.ensure_future(cls._run())
+
+    @classmethod
+    async def stop(cls) -> None:
+        """Close the stream."""
+        task, cls._task = cls._task, None
+        if not task:
+            return
+
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    @classmethod
+    def get_price(cls, symbol: str) -> float | None:
+        """
+        Get the last price of the symbol.
+
+        Args:
+            symbol (str): a Binance symbol, e.g. 'ETHUSDT'.
+
+        Returns:
+            float | None: the price or None if it is not streamed or is stale.
+
+        """
+        for prices in (cls.MIDPOINTS, cls.LAST_PRICES):
+            cached = prices.get(symbol)
+            if cached and time.monotonic() - cached[0] < cls.MAX_AGE:
+                return cached[1]
+
+        return None
+
+    @classmethod
+    def get_stream_url(cls) -> str:
+        streams = '/'.join(
+            f'{symbol.lower()}@{channel}'
+            for symbol in cls.SYMBOLS
+            for channel in cls.CHANNELS
+        )
+
+        return f'{cls.STREAM_URL}?streams={streams}'
+
+    @classmethod
+    async def _run(cls) -> None:
+        while True:
+            try:
+                await cls._listen()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # the prices become stale by themselves while reconnecting
+                pass
+
+            await asyncio.sleep(cls.RECONNECT_DELAY)
+
+    @classmethod
+    async def _listen(cls) -> None:
+        session = ProviderPool.get_session(rpc=cls.STREAM_URL)
+
+        async with session.ws_connect(
+            cls.get_stream_url(), heartbeat=cls.HEARTBEAT
+        ) as websocket:
+            async for message in websocket:
+                if message.type != WSMsgType.TEXT:
+                    break
+
+                cls._on_message(json.loads(message.data))
+
+    @classmethod
+    def _on_message(cls, message: dict) -> None:
+        data = message.get('data', message)
+        symbol = data.get('s')
+        if not symbol:
+            return
+
+        if 'b' in data and 'a' in data:
+            cls.MIDPOINTS[symbol] = (
+                time.monotonic(), (float(data['b']) + float(data['a'])) / 2
+            )
+        elif 'c' in data:
+            cls.LAST_PRICES[symbol] = (time.monotonic(), float(data['c']))
@@ -0,0 +1,213 @@
+from eth_abi import abi
+from eth_utils.abi import collapse_if_tuple
+from web3 import Web3
+import web3.exceptions as web3_exceptions
+
+from async_eth_lib.models.client import Client
+from async_eth_lib.models.contracts.raw_contract import RawContract
+from async_eth_lib.models.others.common import AutoRepr
+
+
+class QuoteCall(AutoRepr):
+    """
+    A view call of a DEX contract which returns the output amount of a route.
+
+    Attributes:
+        target (str): the address of the called contract.
+        function_signature (str): the function signature, e.g. 'getAmountsOut(uint256,address[])'.
+        args (list): the function arguments.
+        output_types (list[str]): the ABI types of the return data, the amount
+            is the first value or the last item of the first value if it is an array.
+
+    A route can be quoted in several calls, e.g. hop by hop, with a call
+    returning the next one from `get_next_call`.
+
+    """
+
+    def __init__(
+        self,
+        target: str,
+        function_signature: str,
+        args: list,
+        output_types: list[str]
+    ) -> None:
+        self.target = Web3.to_checksum_address(target)
+        self.function_signature = function_signature
+        self.args = args
+        self.output_types = output_types
+
+    @classmethod
+    def from_contract(
+        cls,
+        contract: RawContract,
+        function_name: str,
+        args: list
+    ) -> 'QuoteCall':
+        """
+        Build the quote call of a contract function from the contract ABI.
+
+        Args:
+            contract (RawContract): the called contract.
+            function_name (str): the function name.
+            args (list): the function arguments.
+
+        Returns:
+            QuoteCall: the quote call.
+
+        Raises:
+            ABIFunctionNotFound: if the ABI has no such function with that many arguments.
+
+        """
+        for function_abi in contract.abi or []:
+            if (
+                function_abi.get('type') == 'function'
+                and function_abi.get('name') == function_name
+                and len(function_abi.get('inputs', [])) == len(args)
+            ):
+                break
+        else:
+            raise web3_exceptions.ABIFunctionNotFound(
+                f"The '{function_name}' function with {len(args)} arguments "
+                f"has not been added to {contract.title} ABI"
+            )
+
+        input_types = [
+            collapse_if_tuple(abi_input) for abi_input in function_abi['inputs']
+        ]
+
+        return cls(
+            target=contract.address,
+            function_signature=f"{function_name}({','.join(input_types)})",
+            args=args,
+            output_types=[
+                collapse_if_tuple(output) for output in function_abi['outputs']
+            ]
+        )
+
+    @property
+    def call_data(self) -> bytes:
+        arg_types = self.function_signature[
+            self.function_signature.index('(') + 1:-1
+        ].split(',')
+
+        return Web3.keccak(text=self.function_signature)[:4] + abi.encode(
+            arg_types, self.args
+        )
+
+    def decode(self, return_data: bytes) -> tuple:
+        return abi.decode(self.output_types, return_data)
+
+    def get_amount(self, quote: tuple) -> int:
+        amount = quote[0]
+        if isinstance(amount, (list, tuple)):
+            amount = amount[-1]
+
+        return amount
+
+    def decode_amount(self, return_data: bytes) -> int:
+        return self.get_amount(self.decode(return_data))
+
+    def get_next_call(self, quote: tuple) -> 'QuoteCall | None':
+        """
+        Get the call which continues the quote of the route.
+
+        Args:
+            quote (tuple): the decoded return values of this call.
+
+        Returns:
+            QuoteCall | None: the next call, None if this call quotes the whole route.
+
+        """
+        return None
+
+
+class QuoteEngine:
+    """
+    Quotes swap routes with the DEX contracts in one multicall per quote step.
+
+    The quotes are the exact output amounts of the routes at the latest
+    block, so the slippage bounds do not depend on external prices.
+
+    Attributes:
+        client (Client): the client whose multicall is used.
+
+    Example:
+    ```python
+    amounts_out = await QuoteEngine(client).get_amounts_out([
+        Mute(client).get_quote_call(TokenSymbol.ETH, TokenSymbol.USDC, amount_in),
+        SpaceFi(client).get_quote_call(TokenSymbol.ETH, TokenSymbol.USDC, amount_in),
+    ])
+    ```
+    """
+
+    def __init__(self, client: Client) -> None:
+        self.client = client
+
+    async def get_amounts_out(
+        self,
+        quote_calls: list[QuoteCall]
+    ) -> list[int | None]:
+        """
+        Get the output amounts of the quote calls.
+
+        Args:
+            quote_calls (list[QuoteCall]): the quote calls.
+
+        Returns:
+            list[int | None]: the output amounts in wei in the order of the calls,
+                None if a call failed.
+
+        """
+        quotes = await self.get_quotes(quote_calls)
+
+        return [
+            quote_call.get_amount(quote) or None if quote else None
+            for quote_call, quote in zip(quote_calls, quotes)
+        ]
+
+    async def get_quotes(
+        self,
+        quote_calls: list[QuoteCall]
+    ) -> list[tuple | None]:
+        """
+        Get all the values returned by the quote calls.
+
+        Args:
+            quote_calls (list[QuoteCall]): the quote calls.
+
+        Returns:
+            list[tuple | None]: the decoded return values in the order of the calls,
+                None if a call failed.
+
+        """
+        quotes: list[tuple | None] = [None] * len(quote_calls)
+        pending_calls = list(enumerate(quote_calls))
+
+        # the calls continuing a quote, e.g. its next hops, go to the next multicall
+        while pending_calls:
+            results = await self.client.multicall.aggregate([
+                (quote_call.target, quote_call.call_data)
+                for _, quote_call in pending_calls
+            ])
+
+            next_calls = []
+            for (index, quote_call), (success, return_data) in zip(
+                pending_calls, results
+            ):
+                try:
+                    quote = (
+                        quote_call.decode(return_data)
+                        if success and return_data else None
+                    )
+                except Exception:
+                    quote = None
+
+                next_call = quote_call.get_next_call(quote) if quote else None
+                if next_call:
+                    next_calls.append((index, next_call))
+                else:
+                    quotes[index] = quote
+
+            pending_calls = next_calls
+
+        return quotes
@@ -1,6 +1,3 @@
-import asyncio
-import aiohttp
-
 from eth_typing import HexStr
 from web3.types import (
     TxParams,
@@ -15,6 +12,8 @@ from async_eth_lib.models.others.params_types import ParamsTypes
 from async_eth_lib.models.others.token_amount import TokenAmount
 from async_eth_lib.models.swap.swap_info import SwapInfo
 from async_eth_lib.models.swap.swap_query import SwapQuery
+from tasks._common.price_service import BinancePriceService
+from tasks._common.price_stream import BinancePriceStream
 
 
 class SwapTask:
@@ -205,6 +204,7 @@ class SwapTask:
             if not swap_info.amount:
                 token_amount = balance
             else:
+                await self.client.account_manager.network.resolve()
                 token_amount = TokenAmount(
                     amount=swap_info.amount,
                     decimals=self.client.account_manager.network.decimals
@@ -295,40 +295,55 @@ class SwapTask:
             min_to_amount=min_amount_out
         )
 
+    @staticmethod
+    def start_price_stream(
+        swap_infos: list[SwapInfo],
+        quote_token: str = TokenSymbol.USDT
+    ) -> None:
+        """
+        Stream the Binance prices of the swap tokens, so the swaps read them locally.
+
+        Until the first prices arrive, and whenever the stream is down,
+        the prices are requested from the Binance REST API.
+
+        Args:
+            swap_infos (list[SwapInfo]): the swaps the prices are needed for.
+            quote_token (str): the token the prices are quoted in (default is USDT).
+
+        Example:
+        ```python
+        async with ProviderPool():
+            SwapTask.start_price_stream(swap_infos=[SwapInfo('ETH', 'USDC'), SwapInfo('USDC', 'WBTC')])
+        ```
+        """
+        quote_token = BinancePriceService.unwrap(quote_token)
+        symbols = []
+
+        for swap_info in swap_infos:
+            for token in (swap_info.from_token, swap_info.to_token):
+                token = BinancePriceService.unwrap(token)
+                if token not in BinancePriceService.STABLECOINS and token != quote_token:
+                    symbols.append(f'{token}{quote_token}')
+
+        BinancePriceStream.start(symbols)
+
     async def get_binance_ticker_price(
         self,
         first_token: str = TokenSymbol.ETH,
         second_token: str = TokenSymbol.USDT
-    ) -> float | None:
-        if first_token.startswith('W'):
-            first_token = first_token[1:]
-
-        if second_token.startswith('W'):
-            second_token = second_token[1:]
-
-        match first_token:
-            case TokenSymbol.USDT:
-                return 1
-            case TokenSymbol.USDC:
-                return 1
-            case TokenSymbol.USDV:
-                return 1
-            case TokenSymbol.USDC_E:
-                return 1
-
-        async with aiohttp.ClientSession() as session:
-            price = await self._get_price_from_binance(session, first_token, second_token)
-            if price is None:
-                price = await self._get_price_from_binance(session, first_token, second_token)
-                return 1 / price
-
-            return price
+    ) -> float:
+        return await BinancePriceService.get_pair_price(
+            first_token=first_token,
+            second_token=second_token
+        )
 
     async def get_token_info(self, token_address):
-        contract = await self.client.contract.get_token_contract(token=token_address)
-        print('name:', await contract.functions.name().call())
-        print('symbol:', await contract.functions.symbol().call())
-        print('decimals:', await contract.functions.decimals().call())
+        metadata = await self.client.contract.get_token_metadata(
+            token_contract=token_address
+        )
+        print('name:', metadata.name)
+        print('symbol:', metadata.symbol)
+        print('decimals:', metadata.decimals)
         
     async def perform_swap(
         self,
@@ -427,27 +442,6 @@ class SwapTask:
 
         return receipt['status'], log_status, message
 
-    async def _get_price_from_binance(
-        self,
-        session: aiohttp.ClientSession,
-        first_token: str,
-        second_token: str
-    ) -> float | None:
-        first_token, second_token = first_token.upper(), second_token.upper()
-        for _ in range(5):
-            try:
-                response = await session.get(
-                    f'https://api.binance.com/api/v3/ticker/price?symbol={first_token}{second_token}')
-                if response.status != 200:
-                    return None
-                result_dict = await response.json()
-                if 'price' in result_dict:
-                    return float(result_dict['price'])
-            except Exception as e:
-                await asyncio.sleep(3)
-        raise ValueError(
-            f'Can not get {first_token}{second_token} price from Binance')
-
     async def perform_tx(
         self,
         tx_params: TxParams | dict
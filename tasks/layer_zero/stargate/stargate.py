@@ -3,6 +3,7 @@ from typing import Tuple
 from web3.types import TxParams
 from eth_abi import abi
 
+from async_eth_lib.models.contracts.abi_registry import AbiRegistry
 from async_eth_lib.models.contracts.contracts import TokenContractData
 from async_eth_lib.models.networks.networks import Networks
 from async_eth_lib.models.others.constants import LogStatus, TokenSymbol
@@ -52,9 +53,9 @@ class Stargate(SwapTask):
         )
 
         if dst_fee and isinstance(dst_fee, float):
-            dst_network = Networks.get_network(
+            dst_network = await Networks.get_network(
                 network_name=swap_info.to_network
-            )
+            ).resolve()
             dst_fee = TokenAmount(
                 amount=dst_fee,
                 decimals=dst_network.decimals
@@ -88,6 +89,7 @@ class Stargate(SwapTask):
 
             return False
 
+        await self.client.account_manager.network.resolve()
         token_price = await self.get_binance_ticker_price(
             first_token=self.client.account_manager.network.coin_symbol
         )
@@ -301,7 +303,9 @@ class Stargate(SwapTask):
                 )
                 router = await self.client.contract.get(
                     contract=router_eth_address,
-                    abi=StargateContracts.STARGATE_ROUTER_ETH_ABI
+                    abi=AbiRegistry.get_abi(
+                        path=StargateContracts.STARGATE_ROUTER_ETH_ABI_PATH
+                    )
                 )
 
         result = await router_contract.functions.quoteLayerZeroFee(
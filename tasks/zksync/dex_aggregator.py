@@ -0,0 +1,246 @@
+import asyncio
+import random
+
+from async_eth_lib.models.contracts.contracts import ZkSyncTokenContracts
+from async_eth_lib.models.others.common import AutoRepr
+from async_eth_lib.models.others.constants import LogStatus, TokenSymbol
+import async_eth_lib.models.others.exceptions as exceptions
+from async_eth_lib.models.swap.swap_info import SwapInfo
+from async_eth_lib.models.swap.swap_query import SwapQuery
+from async_eth_lib.models.swap.tx_payload_details import TxPayloadDetails
+from tasks._common.dex_swap_task import DexSwapTask
+from tasks._common.price_service import BinancePriceService
+from tasks._common.quote_engine import QuoteCall, QuoteEngine
+from tasks._common.swap_task import SwapTask
+from tasks.zksync.maverick import Maverick
+from tasks.zksync.mute import Mute
+from tasks.zksync.space_fi import SpaceFi
+from tasks.zksync.sync_swap import SyncSwap
+
+
+class RouteQuote(AutoRepr):
+    """
+    A quote of a swap route of a DEX.
+
+    Attributes:
+        dex (type[DexSwapTask]): the DEX task class.
+        tx_payload_details (TxPayloadDetails): the payload details of the route.
+        swap_query (SwapQuery): the query with the source amount of the quote.
+        quote (tuple): the decoded return values of the quote call.
+        amount_out (int): the output amount in wei.
+        gas_cost (int): the estimated gas cost in wei of the output token.
+        net_amount_out (int): the output amount after the gas cost.
+
+    """
+
+    def __init__(
+        self,
+        dex: type[DexSwapTask],
+        tx_payload_details: TxPayloadDetails,
+        swap_query: SwapQuery,
+        quote: tuple,
+        amount_out: int,
+        gas_cost: int = 0
+    ) -> None:
+        self.dex = dex
+        self.tx_payload_details = tx_payload_details
+        self.swap_query = swap_query
+        self.quote = quote
+        self.amount_out = amount_out
+        self.gas_cost = gas_cost
+        self.net_amount_out = amount_out - gas_cost
+
+
+class ZkSyncDexAggregator(SwapTask):
+    """
+    Swaps on the zkSync DEX which gives the best output after the gas cost.
+
+    The candidate routes of all the DEXes are quoted in one multicall. Routes within
+    SPREAD_TOLERANCE percent of the best one are chosen at random to spread
+    the volume among the DEXes.
+
+    Example:
+    ```python
+    aggregator = ZkSyncDexAggregator(client)
+    await aggregator.swap(SwapInfo(TokenSymbol.ETH, TokenSymbol.USDC, amount=0.01))
+    ```
+    """
+    DEXES: dict[type[DexSwapTask], int] = {
+        SyncSwap: 800_000,
+        Mute: 1_000_000,
+        SpaceFi: 1_000_000,
+        Maverick: 1_500_000,
+    }
+    SPREAD_TOLERANCE: float = 0.1
+
+    async def get_route_quotes(self, swap_info: SwapInfo) -> list[RouteQuote]:
+        """
+        Quote the candidate routes of the swap on every DEX.
+
+        Args:
+            swap_info (SwapInfo): Information about the swap.
+
+        Returns:
+            list[RouteQuote]: the quotes from the best net output.
+
+        """
+        swap_query = await self.compute_source_token_amount(swap_info=swap_info)
+        amount_in = swap_query.amount_from.Wei
+
+        routes = []
+        quote_calls = []
+        for dex in self.DEXES:
+            for tx_payload_details, quote_call in self._get_quote_calls(
+                dex, swap_info, amount_in
+            ):
+                routes.append((dex, tx_payload_details))
+                quote_calls.append(quote_call)
+
+        quotes, gas_cost_rate = await asyncio.gather(
+            QuoteEngine(self.client).get_quotes(quote_calls),
+            self._get_gas_cost_rate(swap_info)
+        )
+
+        route_quotes = [
+            RouteQuote(
+                dex=dex,
+                tx_payload_details=tx_payload_details,
+                swap_query=swap_query,
+                quote=quote,
+                amount_out=quote_call.get_amount(quote),
+                gas_cost=int(self.DEXES[dex] * gas_cost_rate)
+            )
+            for (dex, tx_payload_details), quote_call, quote in zip(
+                routes, quote_calls, quotes
+            )
+            if quote and quote_call.get_amount(quote)
+        ]
+
+        return sorted(
+            route_quotes,
+            key=lambda route_quote: route_quote.net_amount_out,
+            reverse=True
+        )
+
+    async def choose_route(self, swap_info: SwapInfo) -> RouteQuote | None:
+        """
+        Choose the route of the swap.
+
+        Args:
+            swap_info (SwapInfo): Information about the swap.
+
+        Returns:
+            RouteQuote | None: the chosen route or None if no DEX can quote the swap.
+
+        """
+        route_quotes = await self.get_route_quotes(swap_info)
+        if not route_quotes:
+            return None
+
+        best_net_amount_out = route_quotes[0].net_amount_out
+        min_net_amount_out = (
+            best_net_amount_out - abs(best_net_amount_out) * self.SPREAD_TOLERANCE / 100
+        )
+
+        return random.choice([
+            route_quote
+            for route_quote in route_quotes
+            if route_quote.net_amount_out >= min_net_amount_out
+        ])
+
+    async def swap(self, swap_info: SwapInfo) -> bool:
+        check_message = self.validate_swap_inputs(
+            first_arg=swap_info.from_token,
+            second_arg=swap_info.to_token,
+            param_type='tokens'
+        )
+        if check_message:
+            self.client.account_manager.custom_logger.log_message(
+                status=LogStatus.ERROR, message=check_message
+            )
+
+            return False
+
+        route_quote = await self.choose_route(swap_info)
+        if not route_quote:
+            self.client.account_manager.custom_logger.log_message(
+                status=LogStatus.ERROR,
+                message=f'{swap_info.from_token} -> {swap_info.to_token}: no DEX can quote the swap'
+            )
+
+            return False
+
+        self.client.account_manager.custom_logger.log_message(
+            status=LogStatus.INFO,
+            message=(
+                f'{swap_info.from_token} -> {swap_info.to_token}: '
+                f'swapping on {route_quote.dex.__name__}'
+            )
+        )
+
+        # the DEX swaps with the chosen quote instead of quoting the route again
+        return await route_quote.dex(self.client).swap(
+            swap_info,
+            tx_payload_details=route_quote.tx_payload_details,
+            swap_query=route_quote.swap_query,
+            quote=route_quote.quote
+        )
+
+    def _get_quote_calls(
+        self,
+        dex: type[DexSwapTask],
+        swap_info: SwapInfo,
+        amount_in: int
+    ) -> list[tuple[TxPayloadDetails, QuoteCall]]:
+        dex_task = dex(self.client)
+        try:
+            candidate_routes = dex_task.get_candidate_routes(
+                from_token=swap_info.from_token,
+                to_token=swap_info.to_token
+            )
+        except exceptions.TxPayloadDetailsNotAdded:
+            return []
+
+        return [
+            (
+                tx_payload_details,
+                dex_task.get_quote_call(
+                    from_token=swap_info.from_token,
+                    to_token=swap_info.to_token,
+                    amount_in=amount_in,
+                    tx_payload_details=tx_payload_details
+                )
+            )
+            for tx_payload_details in candidate_routes
+        ]
+
+    async def _get_gas_cost_rate(self, swap_info: SwapInfo) -> float:
+        # the cost of one gas unit in wei of the output token
+        to_token = (
+            ZkSyncTokenContracts.WETH
+            if swap_info.to_token.upper() == TokenSymbol.ETH
+            else ZkSyncTokenContracts.get_token(token_symbol=swap_info.to_token)
+        )
+
+        try:
+            gas_price, decimals, to_token_price = await asyncio.gather(
+                self.client.contract.transaction.get_gas_price(),
+                self.client.contract.get_decimals(token_contract=to_token),
+                self._get_coin_price(swap_info.to_token)
+            )
+        except Exception:
+            # without the prices the routes are compared by the gross output
+            return 0.
+
+        return float(gas_price.Ether) * to_token_price * 10 ** decimals
+
+    async def _get_coin_price(self, token: str) -> float:
+        await self.client.account_manager.network.resolve()
+        coin_symbol = self.client.account_manager.network.coin_symbol
+        if BinancePriceService.unwrap(token) == BinancePriceService.unwrap(coin_symbol):
+            return 1
+
+        return await self.get_binance_ticker_price(
+            first_token=coin_symbol,
+            second_token=token
+        )
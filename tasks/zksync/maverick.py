@@ -7,27 +7,37 @@ import web3.exceptions as web3_exceptions
 
 from async_eth_lib.models.contracts.contracts import TokenContractData, ZkSyncTokenContracts
 from async_eth_lib.models.contracts.raw_contract import RawContract
+from async_eth_lib.models.networks.networks import Networks
 from async_eth_lib.models.others.constants import LogStatus, TokenSymbol
+from async_eth_lib.models.swap.route_graph import Pool
 from async_eth_lib.models.swap.swap_info import SwapInfo
+from async_eth_lib.models.swap.swap_query import SwapQuery
 from async_eth_lib.models.swap.tx_payload_details import TxPayloadDetails
-from async_eth_lib.models.swap.tx_payload_details_fetcher import TxPayloadDetailsFetcher
+from async_eth_lib.models.swap.tx_payload_details_fetcher import RouteGraphFetcher
 from async_eth_lib.models.transactions.tx_args import TxArgs
-from async_eth_lib.utils.helpers import read_json, sleep
-from tasks._common.swap_task import SwapTask
+from async_eth_lib.utils.helpers import sleep
+from tasks._common.dex_swap_task import DexSwapTask
+from tasks._common.quote_engine import QuoteCall
 
 
-class Maverick(SwapTask):
+class Maverick(DexSwapTask):
     MAVERICK_ROUTER = RawContract(
         title="Maverick Router",
         address="0x39E098A153Ad69834a9Dac32f0FCa92066aD03f4",
-        abi=read_json(
-            path=("data", "abis", "zksync", "maverick", "router_abi.json")
-        ),
+        abi_path=("data", "abis", "zksync", "maverick", "router_abi.json"),
+    )
+    MAVERICK_POOL_INFORMATION = RawContract(
+        title="Maverick Pool Information",
+        address="0x57D47F505EdaA8Ae1eFD807A860A79A28bE06449",
+        abi_path=("data", "abis", "zksync", "maverick", "pool_information_abi.json"),
     )
 
     async def swap(
         self,
-        swap_info: SwapInfo
+        swap_info: SwapInfo,
+        tx_payload_details: TxPayloadDetails | None = None,
+        swap_query: SwapQuery | None = None,
+        quote: tuple | None = None
     ) -> bool:
         check_message = self.validate_swap_inputs(
             first_arg=swap_info.from_token,
@@ -41,32 +51,25 @@ class Maverick(SwapTask):
 
             return False
         is_from_token_eth = swap_info.from_token == TokenSymbol.ETH
-        swap_query = await self.compute_source_token_amount(
+        swap_query = swap_query or await self.compute_source_token_amount(
             swap_info=swap_info
         )
         swap_query.to_token = ZkSyncTokenContracts.get_token(
             swap_info.to_token
         )
 
-        from_token_price = await self.get_binance_ticker_price(swap_info.from_token)
-        second_token_price = await self.get_binance_ticker_price(swap_info.to_token)
-
-        min_to_amount = float(swap_query.amount_from.Ether) * from_token_price \
-            / second_token_price
-
-        swap_query = await self.compute_min_destination_amount(
+        best_route = await self.compute_best_route(
             swap_query=swap_query,
-            min_to_amount=min_to_amount,
-            swap_info=swap_info
+            swap_info=swap_info,
+            candidate_routes=[tx_payload_details] if tx_payload_details else None,
+            quote=quote
         )
+        if not best_route:
+            return False
 
-        tx_payload_details = MaverickData.get_tx_payload_details(
-            first_token=swap_info.from_token,
-            second_token=swap_info.to_token
-        )
-        encoded_path_payload = b''
-        for address in tx_payload_details.swap_path:
-            encoded_path_payload += Web3.to_bytes(hexstr=HexStr(address))
+        tx_payload_details, swap_query = best_route
+
+        encoded_path_payload = self._encode_path(tx_payload_details)
 
         account_address = self.client.account_manager.account.address
         contract = await self.client.contract.get(
@@ -160,8 +163,49 @@ class Maverick(SwapTask):
                 )
         return False
 
+    def get_candidate_routes(
+        self,
+        from_token: str,
+        to_token: str
+    ) -> list[TxPayloadDetails]:
+        return MaverickData.get_candidate_tx_payload_details(
+            first_token=from_token,
+            second_token=to_token
+        )
+
+    def get_quote_call(
+        self,
+        from_token: str,
+        to_token: str,
+        amount_in: int,
+        tx_payload_details: TxPayloadDetails | None = None
+    ) -> QuoteCall:
+        tx_payload_details = tx_payload_details or MaverickData.get_tx_payload_details(
+            first_token=from_token,
+            second_token=to_token
+        )
+
+        # the pool information contract quotes by simulating the swap through the pools
+        return QuoteCall.from_contract(
+            contract=self.MAVERICK_POOL_INFORMATION,
+            function_name='calculateMultihopSwap',
+            args=[self._encode_path(tx_payload_details), amount_in, False]
+        )
+
+    @staticmethod
+    def _encode_path(tx_payload_details: TxPayloadDetails) -> bytes:
+        encoded_path_payload = b''
+        for address in tx_payload_details.swap_path:
+            encoded_path_payload += Web3.to_bytes(hexstr=HexStr(address))
+
+        return encoded_path_payload
+
+
+class MaverickData(RouteGraphFetcher):
+    NETWORK_NAME = Networks.ZkSync.name
+    DEX_NAME = 'maverick'
+    TOKEN_CONTRACTS = ZkSyncTokenContracts
 
-class MaverickData(TxPayloadDetailsFetcher):
     LIQUIDITY_POOLS = {
         (TokenSymbol.ETH, TokenSymbol.USDC):
             "0x41c8cf74c27554a8972d3bf3d2bd4a14d8b604ab",            
@@ -219,3 +263,22 @@ class MaverickData(TxPayloadDetailsFetcher):
             )
         }
     }
+
+    @classmethod
+    def build_tx_payload_details(
+        cls,
+        first_token: str,
+        second_token: str,
+        tokens: list[str],
+        route: list[Pool]
+    ) -> TxPayloadDetails:
+        # the path interleaves the tokens with the pools between them
+        addresses = [tokens[0]]
+        for pool, token in zip(route, tokens[1:]):
+            addresses += [pool.address, token]
+
+        return TxPayloadDetails(
+            method_name='exactInput',
+            addresses=addresses,
+            function_signature='0xc04b8d59'
+        )
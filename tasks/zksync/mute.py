@@ -5,29 +5,32 @@ import web3.exceptions as web3_exceptions
 
 from async_eth_lib.models.contracts.contracts import ZkSyncTokenContracts
 from async_eth_lib.models.contracts.raw_contract import RawContract
+from async_eth_lib.models.networks.networks import Networks
 from async_eth_lib.models.others.constants import LogStatus, TokenSymbol
-from async_eth_lib.models.others.params_types import ParamsTypes
+from async_eth_lib.models.swap.route_graph import Pool
 from async_eth_lib.models.swap.swap_info import SwapInfo
 from async_eth_lib.models.swap.swap_query import SwapQuery
 from async_eth_lib.models.swap.tx_payload_details import TxPayloadDetails
-from async_eth_lib.models.swap.tx_payload_details_fetcher import TxPayloadDetailsFetcher
+from async_eth_lib.models.swap.tx_payload_details_fetcher import RouteGraphFetcher
 from async_eth_lib.models.transactions.tx_args import TxArgs
-from async_eth_lib.utils.helpers import read_json, sleep
-from tasks._common.swap_task import SwapTask
+from async_eth_lib.utils.helpers import sleep
+from tasks._common.dex_swap_task import DexSwapTask
+from tasks._common.quote_engine import QuoteCall
 
 
-class Mute(SwapTask):
+class Mute(DexSwapTask):
     MUTE_UNIVERSAL = RawContract(
         title='Mute',
         address='0x8b791913eb07c32779a16750e3868aa8495f5964',
-        abi=read_json(
-            path=('data', 'abis', 'zksync', 'mute', 'abi.json')
-        )
+        abi_path=('data', 'abis', 'zksync', 'mute', 'abi.json')
     )
 
     async def swap(
         self,
-        swap_info: SwapInfo
+        swap_info: SwapInfo,
+        tx_payload_details: TxPayloadDetails | None = None,
+        swap_query: SwapQuery | None = None,
+        quote: tuple | None = None
     ) -> bool:
         check_message = self.validate_swap_inputs(
             first_arg=swap_info.from_token,
@@ -45,15 +48,16 @@ class Mute(SwapTask):
             contract=self.MUTE_UNIVERSAL
         )
 
-        swap_query = await self._create_swap_query(
-            contract=contract,
-            swap_info=swap_info
+        best_route = await self._create_swap_query(
+            swap_info=swap_info,
+            candidate_routes=[tx_payload_details] if tx_payload_details else None,
+            swap_query=swap_query,
+            quote=quote
         )
+        if not best_route:
+            return False
 
-        tx_payload_details = MuteRoutes.get_tx_payload_details(
-            first_token=swap_info.from_token,
-            second_token=swap_info.to_token
-        )
+        tx_payload_details, swap_query = best_route
 
         params = TxArgs(
             amountOutMin=swap_query.min_to_amount.Wei,
@@ -122,19 +126,59 @@ class Mute(SwapTask):
                 )
         return False
 
-    async def _create_swap_query(
+    def get_candidate_routes(
         self,
-        contract: ParamsTypes.Contract,
-        swap_info: SwapInfo
-    ) -> SwapQuery:
-        swap_query = await self.compute_source_token_amount(swap_info=swap_info)
+        from_token: str,
+        to_token: str
+    ) -> list[TxPayloadDetails]:
+        return MuteRoutes.get_candidate_tx_payload_details(
+            first_token=from_token,
+            second_token=to_token
+        )
 
-        if swap_info.from_token == TokenSymbol.ETH:
-            from_token = ZkSyncTokenContracts.WETH
-        else:
-            from_token = ZkSyncTokenContracts.get_token(
-                swap_info.from_token
-            )
+    def get_quote_call(
+        self,
+        from_token: str,
+        to_token: str,
+        amount_in: int,
+        tx_payload_details: TxPayloadDetails | None = None
+    ) -> QuoteCall:
+        tx_payload_details = tx_payload_details or MuteRoutes.get_tx_payload_details(
+            first_token=from_token,
+            second_token=to_token
+        )
+
+        return MuteQuoteCall(
+            contract=self.MUTE_UNIVERSAL,
+            swap_path=tx_payload_details.swap_path,
+            amount_in=amount_in
+        )
+
+    def apply_quote(
+        self,
+        tx_payload_details: TxPayloadDetails,
+        quote: tuple
+    ) -> TxPayloadDetails:
+        # getAmountOut quotes the better of the stable and volatile pools
+        # of every hop and returns which one, so the swap goes through them
+        _, stable_flags = quote
+
+        return TxPayloadDetails(
+            method_name=tx_payload_details.method_name,
+            addresses=tx_payload_details.swap_path,
+            bool_list=[*stable_flags, False]
+        )
+
+    async def _create_swap_query(
+        self,
+        swap_info: SwapInfo,
+        candidate_routes: list[TxPayloadDetails] | None = None,
+        swap_query: SwapQuery | None = None,
+        quote: tuple | None = None
+    ) -> tuple[TxPayloadDetails, SwapQuery] | None:
+        swap_query = swap_query or await self.compute_source_token_amount(
+            swap_info=swap_info
+        )
 
         if swap_info.to_token == TokenSymbol.ETH:
             swap_query.to_token = ZkSyncTokenContracts.WETH
@@ -143,21 +187,78 @@ class Mute(SwapTask):
                 swap_info.to_token
             )
 
-        min_amount_out = await contract.functions.getAmountOut(
-            swap_query.amount_from.Wei,
-            from_token.address,
-            swap_query.to_token.address
-        ).call()
-
-        return await self.compute_min_destination_amount(
+        return await self.compute_best_route(
             swap_query=swap_query,
-            min_to_amount=min_amount_out[0],
             swap_info=swap_info,
-            is_to_token_price_wei=True
+            candidate_routes=candidate_routes,
+            quote=quote
+        )
+
+
+class MuteQuoteCall(QuoteCall):
+    """
+    A quote of a Mute route, hop by hop with the router `getAmountOut`.
+
+    Every hop quotes the output amount of the previous one, and the quote of
+    the last hop returns the output amount of the route and the stable flags
+    of all the hops.
+
+    Attributes:
+        contract (RawContract): the Mute router.
+        swap_path (list[str]): the token addresses of the route.
+        hop (int): the index of the quoted hop.
+        stable_flags (list[bool]): the stable flags of the previous hops.
+
+    """
+
+    def __init__(
+        self,
+        contract: RawContract,
+        swap_path: list[str],
+        amount_in: int,
+        hop: int = 0,
+        stable_flags: list[bool] | None = None
+    ) -> None:
+        quote_call = QuoteCall.from_contract(
+            contract=contract,
+            function_name='getAmountOut',
+            args=[amount_in, swap_path[hop], swap_path[hop + 1]]
         )
+        super().__init__(
+            target=quote_call.target,
+            function_signature=quote_call.function_signature,
+            args=quote_call.args,
+            output_types=quote_call.output_types
+        )
+        self.contract = contract
+        self.swap_path = swap_path
+        self.hop = hop
+        self.stable_flags = stable_flags or []
+
+    def decode(self, return_data: bytes) -> tuple:
+        amount_out, is_stable, _ = super().decode(return_data)
+
+        return amount_out, [*self.stable_flags, is_stable]
 
+    def get_next_call(self, quote: tuple) -> 'MuteQuoteCall | None':
+        if self.hop + 2 >= len(self.swap_path):
+            return None
+
+        amount_out, stable_flags = quote
+
+        return MuteQuoteCall(
+            contract=self.contract,
+            swap_path=self.swap_path,
+            amount_in=amount_out,
+            hop=self.hop + 1,
+            stable_flags=stable_flags
+        )
 
-class MuteRoutes(TxPayloadDetailsFetcher):
+
+class MuteRoutes(RouteGraphFetcher):
+    NETWORK_NAME = Networks.ZkSync.name
+    DEX_NAME = 'mute'
+    TOKEN_CONTRACTS = ZkSyncTokenContracts
     PATHS = {
         TokenSymbol.ETH: {
             TokenSymbol.USDC: TxPayloadDetails(
@@ -275,3 +376,28 @@ class MuteRoutes(TxPayloadDetailsFetcher):
             )
         }
     }
+
+    @classmethod
+    def build_tx_payload_details(
+        cls,
+        first_token: str,
+        second_token: str,
+        tokens: list[str],
+        route: list[Pool]
+    ) -> TxPayloadDetails:
+        path = cls.PATHS.get(first_token, {}).get(second_token)
+        if path:
+            # every route of a pair swaps with the router method of its pinned path
+            method_name = path.method_name
+        elif first_token == TokenSymbol.ETH:
+            method_name = 'swapExactETHForTokens'
+        elif second_token == TokenSymbol.ETH:
+            method_name = 'swapExactTokensForETH'
+        else:
+            method_name = 'swapExactTokensForTokens'
+
+        return TxPayloadDetails(
+            method_name=method_name,
+            addresses=tokens,
+            bool_list=[pool.is_stable for pool in route] + [False]
+        )
@@ -10,7 +10,6 @@ from async_eth_lib.models.others.constants import LogStatus
 from async_eth_lib.models.others.token_amount import TokenAmount
 from async_eth_lib.models.swap.swap_info import SwapInfo
 from async_eth_lib.models.transactions.tx_args import TxArgs
-from async_eth_lib.utils.helpers import read_json
 from tasks._common.swap_task import SwapTask
 
 ZKSYNC_OFFICIAL_BRIDGE = [
@@ -35,9 +34,7 @@ class OfficialBridge(SwapTask):
     ETH_OFFICIAL_BRIDGE = RawContract(
         title='ETH_OFFICIAL_BRIDGE',
         address='0x32400084c286cf3e17e7b677ea9583e60a000324',
-        abi=read_json(
-            path=('data', 'abis', 'zksync', 'official_bridge.json')
-        )
+        abi_path=('data', 'abis', 'zksync', 'official_bridge.json')
     )
     
     ZKSYNC_OFFICIAL_BRIDGE = RawContract(
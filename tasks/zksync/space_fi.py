@@ -5,27 +5,32 @@ import web3.exceptions as web3_exceptions
 
 from async_eth_lib.models.contracts.contracts import ZkSyncTokenContracts
 from async_eth_lib.models.contracts.raw_contract import RawContract
+from async_eth_lib.models.networks.networks import Networks
 from async_eth_lib.models.others.constants import LogStatus, TokenSymbol
 from async_eth_lib.models.others.token_amount import TokenAmount
+from async_eth_lib.models.swap.route_graph import Pool
 from async_eth_lib.models.swap.swap_info import SwapInfo
+from async_eth_lib.models.swap.swap_query import SwapQuery
 from async_eth_lib.models.swap.tx_payload_details import TxPayloadDetails
-from async_eth_lib.models.swap.tx_payload_details_fetcher import TxPayloadDetailsFetcher
-from async_eth_lib.utils.helpers import read_json, sleep
-from tasks._common.swap_task import SwapTask
+from async_eth_lib.models.swap.tx_payload_details_fetcher import RouteGraphFetcher
+from async_eth_lib.utils.helpers import sleep
+from tasks._common.dex_swap_task import DexSwapTask
+from tasks._common.quote_engine import QuoteCall
 
 
-class SpaceFi(SwapTask):
+class SpaceFi(DexSwapTask):
     SPACE_FI_ROUTER = RawContract(
         title='SpaceFiRouter',
         address='0xbE7D1FD1f6748bbDefC4fbaCafBb11C6Fc506d1d',
-        abi=read_json(
-            path=('data', 'abis', 'zksync', 'space_fi', 'abi.json')
-        )
+        abi_path=('data', 'abis', 'zksync', 'space_fi', 'abi.json')
     )
 
     async def swap(
         self,
-        swap_info: SwapInfo
+        swap_info: SwapInfo,
+        tx_payload_details: TxPayloadDetails | None = None,
+        swap_query: SwapQuery | None = None,
+        quote: tuple | None = None
     ) -> bool:
         check_message = self.validate_swap_inputs(
             first_arg=swap_info.from_token,
@@ -44,7 +49,7 @@ class SpaceFi(SwapTask):
             contract=self.SPACE_FI_ROUTER
         )
 
-        swap_query = await self.compute_source_token_amount(
+        swap_query = swap_query or await self.compute_source_token_amount(
             swap_info=swap_info
         )
 
@@ -52,22 +57,16 @@ class SpaceFi(SwapTask):
             token_symbol=swap_info.to_token
         )
 
-        from_token_price = await self.get_binance_ticker_price(swap_info.from_token)
-        second_token_price = await self.get_binance_ticker_price(swap_info.to_token)
-
-        min_to_amount = float(swap_query.amount_from.Ether) * from_token_price \
-            / second_token_price
-
-        swap_query = await self.compute_min_destination_amount(
+        best_route = await self.compute_best_route(
             swap_query=swap_query,
-            min_to_amount=min_to_amount,
-            swap_info=swap_info
+            swap_info=swap_info,
+            candidate_routes=[tx_payload_details] if tx_payload_details else None,
+            quote=quote
         )
+        if not best_route:
+            return False
 
-        tx_payload_details = SpaceFiRoutes.get_tx_payload_details(
-            first_token=swap_info.from_token,
-            second_token=swap_info.to_token
-        )
+        tx_payload_details, swap_query = best_route
 
         if swap_info.from_token != TokenSymbol.ETH:
             memory_address = 128 + 32
@@ -150,8 +149,39 @@ class SpaceFi(SwapTask):
                 )
         return False
 
+    def get_candidate_routes(
+        self,
+        from_token: str,
+        to_token: str
+    ) -> list[TxPayloadDetails]:
+        return SpaceFiRoutes.get_candidate_tx_payload_details(
+            first_token=from_token,
+            second_token=to_token
+        )
+
+    def get_quote_call(
+        self,
+        from_token: str,
+        to_token: str,
+        amount_in: int,
+        tx_payload_details: TxPayloadDetails | None = None
+    ) -> QuoteCall:
+        tx_payload_details = tx_payload_details or SpaceFiRoutes.get_tx_payload_details(
+            first_token=from_token,
+            second_token=to_token
+        )
+
+        return QuoteCall.from_contract(
+            contract=self.SPACE_FI_ROUTER,
+            function_name='getAmountsOut',
+            args=[amount_in, tx_payload_details.swap_path]
+        )
+
 
-class SpaceFiRoutes(TxPayloadDetailsFetcher):
+class SpaceFiRoutes(RouteGraphFetcher):
+    NETWORK_NAME = Networks.ZkSync.name
+    DEX_NAME = 'space_fi'
+    TOKEN_CONTRACTS = ZkSyncTokenContracts
     PATHS = {
         TokenSymbol.ETH: {
             TokenSymbol.USDC: TxPayloadDetails(
@@ -230,3 +260,24 @@ class SpaceFiRoutes(TxPayloadDetailsFetcher):
             )
         }
     }
+
+    @classmethod
+    def build_tx_payload_details(
+        cls,
+        first_token: str,
+        second_token: str,
+        tokens: list[str],
+        route: list[Pool]
+    ) -> TxPayloadDetails:
+        if first_token == TokenSymbol.ETH:
+            method_name, function_signature = 'swapExactETHForTokens', '0x7ff36ab5'
+        elif second_token == TokenSymbol.ETH:
+            method_name, function_signature = 'swapExactTokensForETH', '0x18cbafe5'
+        else:
+            method_name, function_signature = 'swapExactTokensForTokens', '0x38ed1739'
+
+        return TxPayloadDetails(
+            method_name=method_name,
+            addresses=tokens,
+            function_signature=function_signature
+        )
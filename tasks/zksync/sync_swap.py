@@ -6,34 +6,78 @@ from web3.types import TxParams
 
 from async_eth_lib.models.contracts.contracts import TokenContractData, ZkSyncTokenContracts
 from async_eth_lib.models.contracts.raw_contract import RawContract
+import async_eth_lib.models.others.exceptions as exceptions
+from async_eth_lib.models.networks.networks import Networks
 from async_eth_lib.models.others.constants import LogStatus, TokenSymbol
+from async_eth_lib.models.swap.route_graph import Pool
 from async_eth_lib.models.swap.swap_info import SwapInfo
+from async_eth_lib.models.swap.swap_query import SwapQuery
+from async_eth_lib.models.swap.tx_payload_details import TxPayloadDetails
+from async_eth_lib.models.swap.tx_payload_details_fetcher import RouteGraphFetcher
 from async_eth_lib.models.transactions.tx_args import TxArgs
-from async_eth_lib.utils.helpers import read_json, sleep
-from tasks._common.swap_task import SwapTask
+from async_eth_lib.utils.helpers import sleep
+from tasks._common.dex_swap_task import DexSwapTask
+from tasks._common.quote_engine import QuoteCall
 
 
-class SyncSwap(SwapTask):
+class SyncSwap(DexSwapTask):
     SYNC_SWAP_ROUTER = RawContract(
         title="SyncSwap Router",
         address="0x2da10A1e27bF85cEdD8FFb1AbBe97e53391C0295",
-        abi=read_json(
-            path=("data", "abis", "zksync", "sync_swap", "abi.json")
-        ),
+        abi_path=("data", "abis", "zksync", "sync_swap", "abi.json"),
     )
+    SYNC_SWAP_POOL_ABI_PATH = ("data", "abis", "zksync", "sync_swap", "pool_abi.json")
+
+    def get_candidate_routes(
+        self,
+        from_token: str,
+        to_token: str
+    ) -> list[TxPayloadDetails]:
+        return SyncSwapRoutes.get_candidate_tx_payload_details(
+            first_token=from_token,
+            second_token=to_token
+        )
+
+    def get_quote_call(
+        self,
+        from_token: str,
+        to_token: str,
+        amount_in: int,
+        tx_payload_details: TxPayloadDetails | None = None
+    ) -> QuoteCall:
+        tx_payload_details = tx_payload_details or SyncSwapRoutes.get_tx_payload_details(
+            first_token=from_token,
+            second_token=to_token
+        )
+        token_in = (
+            ZkSyncTokenContracts.WETH
+            if from_token.upper() == TokenSymbol.ETH
+            else ZkSyncTokenContracts.get_token(token_symbol=from_token)
+        )
+
+        pool_contract = RawContract(
+            title='SyncSwap Pool',
+            address=tx_payload_details.swap_path[0],
+            abi_path=self.SYNC_SWAP_POOL_ABI_PATH
+        )
+
+        return QuoteCall.from_contract(
+            contract=pool_contract,
+            function_name='getAmountOut',
+            args=[
+                token_in.address,
+                amount_in,
+                self.client.account_manager.account.address
+            ]
+        )
 
-    LIQUIDITY_POOLS = {
-        (TokenSymbol.ETH, TokenSymbol.USDC):
-            "0x80115c708e12edd42e504c1cd52aea96c547c05c",
-        (TokenSymbol.ETH, TokenSymbol.USDT):
-            "0xd3D91634Cf4C04aD1B76cE2c06F7385A897F54D3",
-        (TokenSymbol.ETH, TokenSymbol.BUSD):
-            "0xad86486f1d225d624443e5df4b2301d03bbe70f6",
-        (TokenSymbol.ETH, TokenSymbol.WBTC):
-            "0xb3479139e07568ba954c8a14d5a8b3466e35533d",
-    }
-
-    async def swap(self, swap_info: SwapInfo) -> bool:
+    async def swap(
+        self,
+        swap_info: SwapInfo,
+        tx_payload_details: TxPayloadDetails | None = None,
+        swap_query: SwapQuery | None = None,
+        quote: tuple | None = None
+    ) -> bool:
         check_message = self.validate_swap_inputs(
             first_arg=swap_info.from_token,
             second_arg=swap_info.to_token,
@@ -47,7 +91,9 @@ class SyncSwap(SwapTask):
             return False
         
         contract = await self.client.contract.get(contract=self.SYNC_SWAP_ROUTER)
-        swap_query = await self.compute_source_token_amount(swap_info=swap_info)
+        swap_query = swap_query or await self.compute_source_token_amount(
+            swap_info=swap_info
+        )
         
         is_from_token_eth = swap_info.from_token == TokenSymbol.ETH
 
@@ -61,30 +107,33 @@ class SyncSwap(SwapTask):
                 token_symbol=swap_info.to_token
             )
 
-        from_token_price = await self.get_binance_ticker_price(swap_info.from_token)
-        second_token_price = await self.get_binance_ticker_price(swap_info.to_token)
-
-        min_to_amount = float(swap_query.amount_from.Ether) * from_token_price \
-            / second_token_price 
-
-        swap_query = await self.compute_min_destination_amount(
-            swap_query=swap_query,
-            min_to_amount=min_to_amount,
-            swap_info=swap_info
-        )
-        
-        pool = self.LIQUIDITY_POOLS.get(
-            (swap_info.to_token.upper(), swap_info.from_token.upper())
-        ) or self.LIQUIDITY_POOLS.get(
-            (swap_info.from_token.upper(), swap_info.to_token.upper())
-        )
-        if not pool:
+        try:
+            candidate_routes = (
+                [tx_payload_details] if tx_payload_details
+                else self.get_candidate_routes(
+                    from_token=swap_info.from_token,
+                    to_token=swap_info.to_token
+                )
+            )
+        except exceptions.TxPayloadDetailsNotAdded:
             self.client.account_manager.custom_logger.log_message(
                 status=LogStatus.ERROR,
                 message=f"{swap_info.from_token} -> {swap_info.to_token}: not existed pool"
             )
             return False
 
+        best_route = await self.compute_best_route(
+            swap_query=swap_query,
+            swap_info=swap_info,
+            candidate_routes=candidate_routes,
+            quote=quote
+        )
+        if not best_route:
+            return False
+
+        tx_payload_details, swap_query = best_route
+        pool = tx_payload_details.swap_path[0]
+
         zfilled_from_token = self.to_cut_hex_prefix_and_zfill(
             swap_query.from_token.address
         )
@@ -180,3 +229,24 @@ class SyncSwap(SwapTask):
                     status=LogStatus.ERROR, message=error
                 )
         return False    
+
+
+class SyncSwapRoutes(RouteGraphFetcher):
+    NETWORK_NAME = Networks.ZkSync.name
+    DEX_NAME = 'sync_swap'
+    TOKEN_CONTRACTS = ZkSyncTokenContracts
+    # the swap steps are built for a single pool
+    MAX_HOPS = 1
+
+    @classmethod
+    def build_tx_payload_details(
+        cls,
+        first_token: str,
+        second_token: str,
+        tokens: list[str],
+        route: list[Pool]
+    ) -> TxPayloadDetails:
+        return TxPayloadDetails(
+            method_name='swap',
+            addresses=[pool.address for pool in route]
+        )
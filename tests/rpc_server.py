@@ -0,0 +1,218 @@
+from typing import Callable
+
+from aiohttp import web
+from eth_abi import abi
+from web3 import Web3
+
+from async_eth_lib.models.networks.network import Network
+
+
+class RpcServer:
+    """
+    A local JSON-RPC server of a chain, recording every request.
+
+    `eth_call` is answered by the handler of the called selector, and the
+    Multicall3 `aggregate3` calls are answered call by call with the same
+    handlers, so the multicall reads are tested without a node.
+
+    Attributes:
+        requests (list[list[str]]): the methods of every HTTP request, one
+            list per request, so a JSON-RPC batch is one item.
+        call_handlers (dict[bytes, Callable[[str, bytes], bytes]]): the handlers
+            of the eth_call selectors, called with the target and the encoded
+            arguments, a raising handler fails the call.
+        send_errors (list[str]): the errors of the next sent transactions.
+        pending_tx_hashes (set[str]): the hashes of the transactions without receipts.
+        error_status (int | None): the HTTP status to answer every request with instead.
+        nonce (int): the pending nonce of every address.
+        fee_rewards (list[list[int]] | None): the priority fee rewards of the
+            fee history blocks, by default every percentile pays its value in 0.01 gwei.
+        block_number (int): the latest block.
+
+    Example:
+    ```python
+    async with RpcServer() as rpc_server, ProviderPool():
+        client = await Client.create(private_key=private_key, network=rpc_server.network)
+    ```
+    """
+    AGGREGATE3_SELECTOR = Web3.keccak(text='aggregate3((address,bool,bytes)[])')[:4]
+    TX_HASH = '0x' + 'ab' * 32
+
+    def __init__(self, chain_id: int = 324) -> None:
+        self.chain_id = chain_id
+        self.requests: list[list[str]] = []
+        self.call_handlers: dict[bytes, Callable[[str, bytes], bytes]] = {}
+        self.send_errors: list[str] = []
+        self.pending_tx_hashes: set[str] = set()
+        self.error_status: int | None = None
+        self.nonce = 5
+        self.fee_rewards: list[list[int]] | None = None
+        self.block_number = 100
+        self.url: str | None = None
+        self._runner: web.AppRunner | None = None
+
+    async def __aenter__(self) -> 'RpcServer':
+        app = web.Application()
+        app.router.add_post('/', self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        self.url = f'http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/'
+
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self._runner.cleanup()
+
+    @property
+    def network(self) -> Network:
+        return Network(
+            name='local',
+            rpc=self.url,
+            chain_id=self.chain_id,
+            tx_type=2,
+            coin_symbol='ETH',
+            decimals=18,
+            explorer='http://127.0.0.1'
+        )
+
+    def get_method_count(self, method: str) -> int:
+        return sum(methods.count(method) for methods in self.requests)
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        if self.error_status:
+            self.requests.append([])
+            return web.Response(status=self.error_status, headers={'Retry-After': '60'})
+
+        if isinstance(body, list):
+            self.requests.append([item['method'] for item in body])
+            return web.json_response([self._answer(item) for item in body])
+
+        self.requests.append([body['method']])
+        return web.json_response(self._answer(body))
+
+    def _answer(self, request: dict) -> dict:
+        try:
+            result = self._get_result(request['method'], request['params'])
+        except Exception as error:
+            return {
+                'jsonrpc': '2.0',
+                'id': request['id'],
+                'error': {'code': -32000, 'message': str(error)}
+            }
+
+        return {'jsonrpc': '2.0', 'id': request['id'], 'result': result}
+
+    def _get_result(self, method: str, params: list):
+        if method == 'eth_chainId':
+            return hex(self.chain_id)
+        if method == 'eth_blockNumber':
+            return hex(self.block_number)
+        if method == 'eth_gasPrice':
+            return hex(2 * 10 ** 9)
+        if method == 'eth_maxPriorityFeePerGas':
+            return hex(10 ** 8)
+        if method == 'eth_getTransactionCount':
+            return hex(self.nonce)
+        if method == 'eth_getBalance':
+            return hex(10 ** 18)
+        if method == 'eth_estimateGas':
+            return hex(21000)
+        if method == 'eth_call':
+            return '0x' + self._call(
+                Web3.to_checksum_address(params[0]['to']),
+                bytes.fromhex(params[0]['data'][2:])
+            ).hex()
+        if method == 'eth_feeHistory':
+            return self._get_fee_history(int(params[0], 16), params[2])
+        if method == 'eth_getBlockByNumber':
+            return self._get_block()
+        if method == 'eth_getTransactionReceipt':
+            if params[0] in self.pending_tx_hashes:
+                return None
+            return self._get_receipt(params[0])
+        if method == 'eth_sendRawTransaction':
+            if self.send_errors:
+                raise ValueError(self.send_errors.pop(0))
+            return self.TX_HASH
+
+        raise ValueError(f'{method} is not supported')
+
+    def _call(self, target: str, call_data: bytes) -> bytes:
+        if call_data[:4] != self.AGGREGATE3_SELECTOR:
+            return self.call_handlers[call_data[:4]](target, call_data[4:])
+
+        (calls,) = abi.decode(['(address,bool,bytes)[]'], call_data[4:])
+        results = []
+        for call_target, _, data in calls:
+            try:
+                results.append((True, self._call(Web3.to_checksum_address(call_target), data)))
+            except Exception:
+                results.append((False, b''))
+
+        return abi.encode(['(bool,bytes)[]'], [results])
+
+    def _get_fee_history(self, block_count: int, percentiles: list[float]) -> dict:
+        return {
+            'oldestBlock': hex(self.block_number - block_count + 1),
+            'baseFeePerGas': [hex(10 ** 9)] * (block_count + 1),
+            'gasUsedRatio': [0.5] * block_count,
+            'reward': [
+                [hex(reward) for reward in rewards]
+                for rewards in self.fee_rewards or [
+                    [int(percentile * 10 ** 7) for percentile in percentiles]
+                ] * block_count
+            ],
+        }
+
+    def _get_block(self) -> dict:
+        zero_hash = '0x' + '00' * 32
+
+        return {
+            'number': hex(self.block_number),
+            'hash': '0x' + '11' * 32,
+            'parentHash': zero_hash,
+            'baseFeePerGas': hex(10 ** 9),
+            'timestamp': hex(1),
+            'gasLimit': hex(30_000_000),
+            'gasUsed': hex(15_000_000),
+            'miner': '0x' + '00' * 20,
+            'extraData': '0x',
+            'difficulty': '0x0',
+            'totalDifficulty': '0x0',
+            'logsBloom': '0x' + '00' * 256,
+            'nonce': '0x0000000000000000',
+            'mixHash': zero_hash,
+            'receiptsRoot': zero_hash,
+            'sha3Uncles': zero_hash,
+            'stateRoot': zero_hash,
+            'transactionsRoot': zero_hash,
+            'size': '0x1',
+            'transactions': [],
+            'uncles': [],
+        }
+
+    def _get_receipt(self, tx_hash: str) -> dict:
+        return {
+            'transactionHash': tx_hash,
+            'transactionIndex': '0x0',
+            'blockHash': '0x' + '11' * 32,
+            'blockNumber': hex(self.block_number),
+            'from': '0x' + '00' * 20,
+            'to': '0x' + '00' * 20,
+            'status': '0x1',
+            'type': '0x2',
+            'gasUsed': hex(21000),
+            'cumulativeGasUsed': hex(21000),
+            'effectiveGasPrice': hex(10 ** 9),
+            'contractAddress': None,
+            'logs': [],
+            'logsBloom': '0x' + '00' * 256,
+        }
+
+
+def encode_uint(value: int) -> bytes:
+    return abi.encode(['uint256'], [value])
+
@@ -0,0 +1,60 @@
+import pytest
+from eth_account import Account
+
+from async_eth_lib.models.client import Client
+from async_eth_lib.models.networks.network import Network
+import async_eth_lib.utils.user_agents as user_agents
+from async_eth_lib.utils.user_agents import UserAgentPool
+
+NETWORK = Network(
+    name='local',
+    rpc='http://127.0.0.1:8545/',
+    chain_id=324,
+    tx_type=2,
+    coin_symbol='ETH',
+    decimals=18,
+    explorer='http://127.0.0.1'
+)
+
+
+def test_user_agents_are_loaded_once(monkeypatch):
+    loads = []
+
+    class UserAgent:
+        def __init__(self) -> None:
+            loads.append(self)
+            self.agents = iter(range(1000))
+
+        @property
+        def random(self) -> str:
+            return f'agent {next(self.agents)}'
+
+    monkeypatch.setattr(user_agents, 'UserAgent', UserAgent)
+    monkeypatch.setattr(UserAgentPool, 'USER_AGENTS', [])
+
+    clients = [Client(network=NETWORK, check_proxy=False) for _ in range(20)]
+
+    assert len(loads) == 1
+    assert len(UserAgentPool.USER_AGENTS) == UserAgentPool.POOL_SIZE
+    assert all(
+        client.account_manager.headers['User-Agent'] in UserAgentPool.USER_AGENTS
+        for client in clients
+    )
+
+
+def test_account_and_logger_are_created_on_first_use():
+    account = Account.create()
+    client = Client(private_key=account.key.hex(), network=NETWORK, check_proxy=False)
+    account_manager = client.account_manager
+
+    assert not account_manager._is_account_initialized
+    assert account_manager._custom_logger is None
+
+    assert account_manager.account.address == account.address
+    assert account_manager.custom_logger is account_manager.custom_logger
+
+
+@pytest.mark.parametrize('private_key', ['0x1234', '0x' + 'zz' * 32, '0x' + '00' * 32])
+def test_invalid_private_key_is_rejected_at_once(private_key):
+    with pytest.raises(ValueError):
+        Client(private_key=private_key, network=NETWORK, check_proxy=False)
@@ -0,0 +1,59 @@
+from web3 import AsyncHTTPProvider, AsyncWeb3
+
+from async_eth_lib.models.contracts.abi_registry import AbiRegistry
+from async_eth_lib.models.contracts.contract_cache import ContractCache
+from async_eth_lib.models.contracts.contracts import ZkSyncTokenContracts
+from async_eth_lib.models.contracts.raw_contract import RawContract
+from async_eth_lib.models.others.dataclasses import DefaultAbis
+
+ADDRESS = ZkSyncTokenContracts.USDC.address
+ABI_PATH = ('data', 'abis', 'zksync', 'mute', 'abi.json')
+
+
+def create_web3() -> AsyncWeb3:
+    return AsyncWeb3(AsyncHTTPProvider('http://127.0.0.1:8545/'))
+
+
+def test_registered_abis_are_keyed_by_identity():
+    first_contract = RawContract(title='First', address=ADDRESS, abi_path=ABI_PATH)
+    second_contract = RawContract(title='Second', address=ADDRESS, abi_path=ABI_PATH)
+
+    assert first_contract.abi is second_contract.abi
+    assert ContractCache.get_abi_key(first_contract.abi) == id(first_contract.abi)
+    assert ContractCache.get_abi_key(DefaultAbis.Token) == id(DefaultAbis.Token)
+
+
+def test_unregistered_abis_are_keyed_by_content():
+    abi = [dict(function_abi) for function_abi in DefaultAbis.Token]
+
+    assert not AbiRegistry.is_registered(abi)
+    assert ContractCache.get_abi_key(abi) == ContractCache.get_abi_key(list(abi))
+    assert AbiRegistry.register(abi) is DefaultAbis.Token
+
+
+def test_contracts_are_cached_per_web3():
+    w3 = create_web3()
+    contract = ContractCache.get_contract(w3, ADDRESS, DefaultAbis.Token)
+
+    assert ContractCache.get_contract(w3, ADDRESS, DefaultAbis.Token) is contract
+    assert ContractCache.get_contract(create_web3(), ADDRESS, DefaultAbis.Token) is not contract
+
+
+def test_least_recently_used_contract_is_evicted(monkeypatch):
+    monkeypatch.setattr(ContractCache, 'MAX_SIZE', 2)
+    w3 = create_web3()
+    addresses = [
+        ZkSyncTokenContracts.USDC.address,
+        ZkSyncTokenContracts.USDT.address,
+        ZkSyncTokenContracts.WETH.address,
+    ]
+
+    first_contract = ContractCache.get_contract(w3, addresses[0], DefaultAbis.Token)
+    ContractCache.get_contract(w3, addresses[1], DefaultAbis.Token)
+    ContractCache.get_contract(w3, addresses[0], DefaultAbis.Token)
+    ContractCache.get_contract(w3, addresses[2], DefaultAbis.Token)
+
+    assert ContractCache.get_contract(w3, addresses[0], DefaultAbis.Token) is first_contract
+    assert [address for address, _ in ContractCache._get_contracts(w3)] == [
+        addresses[2], addresses[0]
+    ]
@@ -0,0 +1,76 @@
+import asyncio
+
+from async_eth_lib.models.contracts.contracts import ZkSyncTokenContracts
+from async_eth_lib.models.others.constants import TokenSymbol
+from async_eth_lib.models.others.token_amount import TokenAmount
+from async_eth_lib.models.swap.swap_info import SwapInfo
+from async_eth_lib.models.swap.swap_query import SwapQuery
+from async_eth_lib.models.swap.tx_payload_details import TxPayloadDetails
+from tasks._common.quote_engine import QuoteEngine
+from tasks.zksync.mute import Mute
+
+
+def create_mute(monkeypatch, quotes: list[tuple]):
+    """
+    Create Mute without a client, quoting the routes with the given quotes.
+    """
+    requested_quotes = []
+
+    async def get_quotes(self, quote_calls):
+        requested_quotes.append(quote_calls)
+        return quotes
+
+    async def compute_min_destination_amount(swap_query, min_to_amount, swap_info, **kwargs):
+        swap_query.min_to_amount = min_to_amount
+        return swap_query
+
+    monkeypatch.setattr(QuoteEngine, 'get_quotes', get_quotes)
+    mute = Mute(client=None)
+    monkeypatch.setattr(mute, 'compute_min_destination_amount', compute_min_destination_amount)
+
+    return mute, requested_quotes
+
+
+def get_route() -> TxPayloadDetails:
+    return TxPayloadDetails(
+        method_name='swapExactETHForTokens',
+        addresses=[ZkSyncTokenContracts.WETH.address, ZkSyncTokenContracts.USDC.address],
+        bool_list=[False, False]
+    )
+
+
+def get_swap_query() -> SwapQuery:
+    return SwapQuery(
+        from_token=ZkSyncTokenContracts.WETH,
+        amount_from=TokenAmount(1000, wei=True),
+        to_token=ZkSyncTokenContracts.USDC
+    )
+
+
+def test_routes_are_quoted_on_chain(monkeypatch):
+    mute, requested_quotes = create_mute(monkeypatch, quotes=[(2000, [True])])
+
+    tx_payload_details, swap_query = asyncio.run(mute.compute_best_route(
+        swap_query=get_swap_query(),
+        swap_info=SwapInfo(TokenSymbol.ETH, TokenSymbol.USDC),
+        candidate_routes=[get_route()]
+    ))
+
+    assert len(requested_quotes) == 1
+    assert swap_query.min_to_amount == 2000
+    assert tx_payload_details.bool_list == [True, False]
+
+
+def test_given_quote_is_not_requested_again(monkeypatch):
+    mute, requested_quotes = create_mute(monkeypatch, quotes=[])
+
+    tx_payload_details, swap_query = asyncio.run(mute.compute_best_route(
+        swap_query=get_swap_query(),
+        swap_info=SwapInfo(TokenSymbol.ETH, TokenSymbol.USDC),
+        candidate_routes=[get_route()],
+        quote=(3000, [True])
+    ))
+
+    assert requested_quotes == []
+    assert swap_query.min_to_amount == 3000
+    assert tx_payload_details.bool_list == [True, False]
@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+from async_eth_lib.models.client import Client
+from async_eth_lib.models.providers.provider_pool import ProviderPool
+from async_eth_lib.models.transactions.fee_oracle import FeeOracle
+from tests.rpc_server import RpcServer
+
+
+@pytest.fixture(autouse=True)
+def clear_snapshots(monkeypatch):
+    monkeypatch.setattr(FeeOracle, 'SNAPSHOTS', {})
+    monkeypatch.setattr(FeeOracle, 'REFRESHES', {})
+
+
+def test_clients_of_a_network_share_one_refresh_per_block():
+    async def main():
+        async with RpcServer() as rpc_server, ProviderPool():
+            network = rpc_server.network
+            clients = [
+                await Client.create(network=network, check_proxy=False) for _ in range(10)
+            ]
+            gas_prices = await asyncio.gather(*(
+                client.contract.transaction.get_gas_price() for client in clients
+            ))
+            priority_fee = await clients[0].contract.transaction.get_max_priority_fee()
+            base_fee = await clients[1].contract.transaction.get_base_fee()
+
+        return rpc_server, gas_prices, priority_fee, base_fee
+
+    rpc_server, gas_prices, priority_fee, base_fee = asyncio.run(main())
+
+    assert rpc_server.requests == [
+        ['eth_feeHistory', 'eth_gasPrice', 'eth_maxPriorityFeePerGas']
+    ]
+    assert {gas_price.Wei for gas_price in gas_prices} == {2 * 10 ** 9}
+    assert priority_fee.Wei == 10 ** 8
+    assert base_fee == 10 ** 9
+
+
+def test_stale_snapshot_is_refreshed(monkeypatch):
+    monkeypatch.setattr(FeeOracle, 'BLOCK_TIMES', {})
+    monkeypatch.setattr(FeeOracle, 'BLOCK_TIME', 0)
+
+    async def main():
+        async with RpcServer() as rpc_server, ProviderPool():
+            client = await Client.create(network=rpc_server.network, check_proxy=False)
+            first_snapshot = await FeeOracle.get_snapshot(client.account_manager)
+            rpc_server.block_number += 1
+            second_snapshot = await FeeOracle.get_snapshot(client.account_manager)
+
+        return first_snapshot, second_snapshot
+
+    first_snapshot, second_snapshot = asyncio.run(main())
+
+    assert (first_snapshot.block_number, second_snapshot.block_number) == (100, 101)
@@ -0,0 +1,109 @@
+import asyncio
+
+from eth_account import Account
+
+from async_eth_lib.models.others.constants import JobStatus
+from async_eth_lib.models.providers.provider_pool import ProviderPool
+from async_eth_lib.models.runner.job_store import JobStore
+from async_eth_lib.models.runner.wallet_runner import WalletRunner
+from tests.rpc_server import RpcServer
+
+ADDRESS = '0x' + '12' * 20
+
+
+def test_state_survives_reopening(tmp_path):
+    path = str(tmp_path / 'jobs.db')
+    job_store = JobStore(path)
+    job_store.set_state('campaign', 'swap', ADDRESS, JobStatus.SENT, tx_hash='0x01')
+    job_store.set_state('campaign', 'swap', ADDRESS, JobStatus.DONE, receipt_status=1)
+    job_store.add_tx('campaign', 'swap', ADDRESS, tx_hash='0x00', is_approve=True)
+    job_store.add_tx('campaign', 'swap', ADDRESS, tx_hash='0x01')
+    job_store.close()
+
+    job_store = JobStore(path)
+    state = job_store.get_state('campaign', 'swap', ADDRESS)
+    txs = job_store.get_txs('campaign', 'swap', ADDRESS)
+
+    # the fields which are not given keep their saved values
+    assert (state.status, state.tx_hash, state.receipt_status) == (JobStatus.DONE, '0x01', 1)
+    assert [(tx.tx_index, tx.tx_hash, tx.is_approve) for tx in txs] == [
+        (0, '0x00', True), (1, '0x01', False)
+    ]
+
+    job_store.reset('campaign')
+
+    assert job_store.get_states('campaign') == []
+    assert job_store.get_txs('campaign', 'swap', ADDRESS) == []
+    job_store.close()
+
+
+def run_campaign(job_store: JobStore, task, private_keys: list[str]):
+    async def main():
+        async with RpcServer() as rpc_server, ProviderPool():
+            runner = WalletRunner(
+                task, job_store=job_store, campaign='campaign', step='swap',
+                check_proxy=False
+            )
+            jobs = WalletRunner.create_jobs(private_keys, rpc_server.network)
+
+            return await runner.run_all(jobs)
+
+    return {result.job.account_id: result for result in asyncio.run(main())}
+
+
+def test_resumed_run_only_does_the_rest(tmp_path):
+    job_store = JobStore(str(tmp_path / 'jobs.db'))
+    private_keys = [Account.create().key.hex() for _ in range(3)]
+    failing_account_ids = {2}
+    run_account_ids = []
+
+    async def task(client):
+        account_id = client.account_manager.account_id
+        run_account_ids.append(account_id)
+        if account_id in failing_account_ids:
+            raise RuntimeError('the RPC is down')
+
+        tx = await client.contract.transaction.sign_and_send({'to': ADDRESS, 'value': 1})
+        await tx.wait_for_tx_receipt(web3=client.account_manager.w3, timeout=5)
+
+        return True
+
+    first_results = run_campaign(job_store, task, private_keys)
+    failing_account_ids.clear()
+    second_results = run_campaign(job_store, task, private_keys)
+
+    assert [first_results[account_id].is_success for account_id in (1, 2, 3)] == [
+        True, False, True
+    ]
+    assert [second_results[account_id].is_skipped for account_id in (1, 2, 3)] == [
+        True, False, True
+    ]
+    assert sorted(run_account_ids) == [1, 2, 2, 3]
+    assert {
+        state.status for state in job_store.get_states('campaign', 'swap')
+    } == {JobStatus.DONE}
+    job_store.close()
+
+
+def test_sent_step_is_resolved_by_its_receipt(tmp_path):
+    job_store = JobStore(str(tmp_path / 'jobs.db'))
+    private_keys = [Account.create().key.hex()]
+    run_count = 0
+
+    async def task(client):
+        nonlocal run_count
+        run_count += 1
+
+        # the run stops before the receipt of the sent transaction
+        await client.contract.transaction.sign_and_send({'to': ADDRESS, 'value': 1})
+
+    run_campaign(job_store, task, private_keys)
+    [sent_state] = job_store.get_states('campaign', 'swap')
+    results = run_campaign(job_store, task, private_keys)
+    [done_state] = job_store.get_states('campaign', 'swap')
+
+    assert sent_state.status == JobStatus.SENT
+    assert results[1].is_skipped
+    assert run_count == 1
+    assert (done_state.status, done_state.receipt_status) == (JobStatus.DONE, 1)
+    job_store.close()
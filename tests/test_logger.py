@@ -0,0 +1,71 @@
+import queue
+import threading
+import time
+
+from async_eth_lib.models.logger.logger import BufferedFileHandler, CustomLogger
+from async_eth_lib.models.others.constants import LogStatus
+
+ADDRESS = '0x' + '12' * 20
+
+
+def wait_for(condition, timeout: float = 5) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def start_logging(monkeypatch, tmp_path) -> None:
+    CustomLogger.stop_listener()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(CustomLogger, 'FOLDER_NAME', str(tmp_path / 'logs'))
+    monkeypatch.setattr(CustomLogger, 'QUEUE', queue.SimpleQueue())
+
+
+def test_records_are_written_by_the_listener_thread(monkeypatch, tmp_path):
+    start_logging(monkeypatch, tmp_path)
+    writing_threads = set()
+    emit = BufferedFileHandler.emit
+
+    def record_thread(self, record):
+        writing_threads.add(threading.current_thread())
+        emit(self, record)
+
+    monkeypatch.setattr(BufferedFileHandler, 'emit', record_thread)
+
+    logger = CustomLogger(account_id=7, address=ADDRESS, network='zkSync')
+    try:
+        for index in range(100):
+            logger.log_message(LogStatus.INFO, f'message {index}')
+
+        # the buffer is flushed once the queue is drained
+        main_log = tmp_path / 'main.log'
+        wait_for(lambda: main_log.exists() and 'message 99' in main_log.read_text())
+    finally:
+        CustomLogger.stop_listener()
+
+    lines = main_log.read_text().splitlines()
+    assert len(lines) == 100
+    assert '0x1212...1212 | zkSync' in lines[0]
+    assert threading.current_thread() not in writing_threads
+
+
+def test_account_records_go_to_their_own_file(monkeypatch, tmp_path):
+    start_logging(monkeypatch, tmp_path)
+
+    logger = CustomLogger(
+        account_id=7, address=ADDRESS, network='zkSync', create_log_file_per_account=True
+    )
+    other_logger = CustomLogger(account_id=8, address=ADDRESS, network='zkSync')
+    try:
+        logger.log_message(LogStatus.SWAPPED, 'swapped')
+        other_logger.log_message(LogStatus.INFO, 'not swapped')
+    finally:
+        # stopping the listener writes the queued records
+        CustomLogger.stop_listener()
+
+    account_log = (tmp_path / 'logs' / 'log_7.log').read_text()
+    assert 'swapped' in account_log
+    assert 'not swapped' not in account_log
+    assert not (tmp_path / 'logs' / 'log_8.log').exists()
+    assert 'not swapped' in (tmp_path / 'main.log').read_text()
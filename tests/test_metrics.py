@@ -0,0 +1,71 @@
+import asyncio
+
+import aiohttp
+import pytest
+
+from async_eth_lib.models.client import Client
+from async_eth_lib.models.metrics.metrics import Histogram, Metrics
+from async_eth_lib.models.providers.provider_pool import ProviderPool
+from async_eth_lib.models.transactions.nonce_manager import NonceManager
+from tests.rpc_server import RpcServer
+
+
+@pytest.fixture(autouse=True)
+def clear_state(monkeypatch):
+    monkeypatch.setattr(Metrics, 'HISTOGRAMS', {})
+    monkeypatch.setattr(NonceManager, 'NONCES', {})
+    monkeypatch.setattr(NonceManager, 'LOCKS', {})
+
+
+def test_histogram_quantiles_stay_within_the_observations():
+    histogram = Histogram()
+    for value in range(1, 101):
+        histogram.observe(value / 1000)
+
+    snapshot = histogram.get_snapshot()
+
+    assert snapshot['count'] == 100
+    assert (snapshot['min'], snapshot['max']) == (0.001, 0.1)
+    assert 0.025 <= snapshot['p50'] <= 0.05
+    assert 0.05 <= snapshot['p95'] <= snapshot['p99'] <= 0.1
+    assert Histogram().get_quantile(0.5) is None
+
+
+def test_failed_spans_are_observed():
+    with pytest.raises(RuntimeError):
+        with Metrics.span(Metrics.TX_PHASE, phase='sign', chain_id=324):
+            raise RuntimeError
+
+    (histogram,) = Metrics.snapshot(chain_id=324)[Metrics.TX_PHASE]
+    assert histogram['labels'] == {'chain_id': '324', 'phase': 'sign'}
+    assert histogram['count'] == 1
+    assert Metrics.snapshot(chain_id=1) == {}
+
+
+def test_client_metrics_cover_the_transaction_phases_and_rpc_methods():
+    async def main():
+        async with RpcServer() as rpc_server, ProviderPool():
+            client = await Client.create(network=rpc_server.network, check_proxy=False)
+            await client.contract.transaction.sign_and_send({'to': '0x' + '12' * 20, 'value': 1})
+
+            runner = await Metrics.serve(port=0)
+            port = runner.addresses[0][1]
+            try:
+                async with aiohttp.ClientSession() as session:
+                    async with session.get(f'http://127.0.0.1:{port}/metrics') as response:
+                        exposition = await response.text()
+            finally:
+                await runner.cleanup()
+
+        return client.metrics, exposition
+
+    metrics, exposition = asyncio.run(main())
+
+    phases = {histogram['labels']['phase'] for histogram in metrics[Metrics.TX_PHASE]}
+    assert {'gas_price', 'estimate_gas', 'nonce', 'sign', 'send'} <= phases
+    methods = {histogram['labels']['method'] for histogram in metrics[Metrics.RPC_REQUEST]}
+    assert {'eth_estimateGas', 'eth_sendRawTransaction'} <= methods
+
+    assert '# TYPE tx_phase_seconds histogram' in exposition
+    assert 'rpc_request_seconds_count{method="eth_sendRawTransaction"} 1' in exposition
+    assert 'tx_phase_seconds_bucket{chain_id="324",phase="sign",le="+Inf"} 1' in exposition
@@ -0,0 +1,74 @@
+import asyncio
+
+from eth_account import Account
+from web3 import Web3
+
+from async_eth_lib.models.client import Client
+from async_eth_lib.models.contracts.multicall import Multicall
+from async_eth_lib.models.contracts.raw_contract import NativeTokenContract, TokenContract
+from async_eth_lib.models.contracts.token_metadata_cache import TokenMetadataCache
+from async_eth_lib.models.providers.provider_pool import ProviderPool
+from tests.rpc_server import RpcServer, encode_uint
+
+TOKEN_DECIMALS = {
+    Web3.to_checksum_address(f'0x{index:040x}'): decimals
+    for index, decimals in enumerate([6, 0, None], start=1)
+}
+
+
+def handle_token_calls(rpc_server: RpcServer) -> None:
+    def decimals(target, args):
+        if TOKEN_DECIMALS[target] is None:
+            raise ValueError('execution reverted')
+        return encode_uint(TOKEN_DECIMALS[target])
+
+    rpc_server.call_handlers[Multicall.DECIMALS_SELECTOR] = decimals
+    rpc_server.call_handlers[Multicall.BALANCE_OF_SELECTOR] = (
+        lambda target, args: encode_uint(int(target, 16) * 1000)
+    )
+    rpc_server.call_handlers[Multicall.GET_ETH_BALANCE_SELECTOR] = (
+        lambda target, args: encode_uint(10 ** 18)
+    )
+
+
+def test_balances_of_all_wallets_are_read_in_one_call(monkeypatch):
+    monkeypatch.setattr(TokenMetadataCache, 'METADATA', {})
+    owners = [Account.create().address for _ in range(3)]
+    token_contracts = [
+        TokenContract(title=f'T{index}', address=address)
+        for index, address in enumerate(TOKEN_DECIMALS)
+    ]
+
+    async def main():
+        async with RpcServer() as rpc_server, ProviderPool():
+            handle_token_calls(rpc_server)
+            client = await Client.create(network=rpc_server.network, check_proxy=False)
+            balances = await client.multicall.get_balances(
+                token_contracts=[NativeTokenContract(title='ETH'), *token_contracts],
+                owners=owners
+            )
+            # the decimals of the tokens are cached, only the failed one is fetched again
+            await client.multicall.get_balances(token_contracts=token_contracts, owners=owners)
+
+        return balances, rpc_server.requests
+
+    balances, requests = asyncio.run(main())
+
+    assert requests == [['eth_call']] * 4
+    first, second, third = TOKEN_DECIMALS
+    for owner in owners:
+        assert balances[owner][NativeTokenContract(title='ETH').address].Ether == 1
+        assert balances[owner][first].Wei == 1000
+        assert balances[owner][first].decimals == 6
+        # a token with 0 decimals keeps them
+        assert balances[owner][second].Ether == 2000
+        # the amount is not guessed without the decimals
+        assert balances[owner][third] is None
+
+    assert [token_contract.decimals for token_contract in token_contracts] == [6, 0, None]
+
+
+def test_failed_call_gives_no_amount():
+    assert Multicall._decode_amount((False, b''), decimals=18) is None
+    assert Multicall._decode_amount((True, encode_uint(5)), decimals=None) is None
+    assert Multicall._decode_amount((True, encode_uint(5)), decimals=0).Ether == 5
@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from async_eth_lib.models.networks.chain_registry import ChainRegistry
+from async_eth_lib.models.networks.network import Network
+from async_eth_lib.models.others import exceptions
+from async_eth_lib.models.providers.provider_pool import ProviderPool
+from tests.rpc_server import RpcServer
+
+CHAINS = [
+    {'chainId': 324, 'name': 'zkSync', 'nativeCurrency': {'symbol': 'eth', 'decimals': 18}},
+    {'chainId': 56, 'name': 'BNB Chain', 'nativeCurrency': {'symbol': 'BNB', 'decimals': 18}},
+]
+
+
+@pytest.fixture(autouse=True)
+def clear_registry(tmp_path, monkeypatch):
+    monkeypatch.setattr(ChainRegistry, 'FOLDER_NAME', str(tmp_path))
+    monkeypatch.setattr(ChainRegistry, 'CHAINS', {})
+    monkeypatch.setattr(ChainRegistry, 'is_loaded', False)
+    monkeypatch.setattr(ChainRegistry, 'is_fetched', False)
+
+
+async def start_chains_server():
+    """
+    Start a local server of the chains list, recording every download.
+    """
+    downloads = []
+
+    async def handle(request: web.Request) -> web.Response:
+        downloads.append(request.path)
+        return web.json_response(CHAINS)
+
+    app = web.Application()
+    app.router.add_get('/chains.json', handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    return runner, f'http://127.0.0.1:{port}/chains.json', downloads
+
+
+def test_networks_are_resolved_without_blocking(monkeypatch):
+    async def main():
+        runner, chains_url, downloads = await start_chains_server()
+        monkeypatch.setattr(ChainRegistry, 'CHAINS_URL', chains_url)
+
+        try:
+            async with RpcServer() as rpc_server, ProviderPool():
+                networks = [Network(name='local', rpc=rpc_server.url) for _ in range(3)]
+                # nothing is requested before the networks are resolved
+                assert rpc_server.requests == []
+                with pytest.raises(exceptions.NetworkNotResolved):
+                    networks[0].chain_id
+
+                await asyncio.gather(*(network.resolve() for network in networks))
+        finally:
+            await runner.cleanup()
+
+        return networks, rpc_server, downloads
+
+    networks, rpc_server, downloads = asyncio.run(main())
+
+    assert {
+        (network.chain_id, network.coin_symbol, network.decimals) for network in networks
+    } == {(324, 'ETH', 18)}
+    assert rpc_server.get_method_count('eth_chainId') == 3
+    assert downloads == ['/chains.json']
+
+
+def test_saved_chains_are_not_downloaded_again(monkeypatch):
+    ChainRegistry.CHAINS[56] = {'name': 'BNB Chain', 'symbol': 'BNB', 'decimals': 18}
+    ChainRegistry.save()
+    monkeypatch.setattr(ChainRegistry, 'CHAINS', {})
+    monkeypatch.setattr(ChainRegistry, 'CHAINS_URL', 'http://127.0.0.1:1/chains.json')
+
+    network = Network(name='bsc', rpc='http://127.0.0.1:1/', chain_id=56)
+
+    assert network.is_resolved
+    assert (network.coin_symbol, network.decimals) == ('BNB', 18)
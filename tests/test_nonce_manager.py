@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+
+from async_eth_lib.models.client import Client
+from async_eth_lib.models.logger.tx_event_log import TxEventLog
+from async_eth_lib.models.others.constants import TxEventType
+from async_eth_lib.models.providers.provider_pool import ProviderPool
+from async_eth_lib.models.transactions.nonce_manager import NonceManager
+from tests.rpc_server import RpcServer
+
+TX_PARAMS = {'to': '0x' + '12' * 20, 'value': 1}
+
+
+@pytest.fixture(autouse=True)
+def clear_nonces(monkeypatch):
+    monkeypatch.setattr(NonceManager, 'NONCES', {})
+    monkeypatch.setattr(NonceManager, 'LOCKS', {})
+
+
+def run_with_client(test):
+    async def main():
+        async with RpcServer() as rpc_server, ProviderPool():
+            client = await Client.create(network=rpc_server.network, check_proxy=False)
+            return await test(rpc_server, client.contract.transaction)
+
+    return asyncio.run(main())
+
+
+def test_concurrent_sends_get_consecutive_nonces():
+    async def test(rpc_server, transaction):
+        txs = await asyncio.gather(*(
+            transaction.sign_and_send(dict(TX_PARAMS)) for _ in range(5)
+        ))
+
+        return rpc_server, sorted(tx.params['nonce'] for tx in txs)
+
+    rpc_server, nonces = run_with_client(test)
+
+    assert nonces == [5, 6, 7, 8, 9]
+    assert rpc_server.get_method_count('eth_getTransactionCount') == 1
+
+
+def test_nonce_of_a_failed_sign_is_released(monkeypatch):
+    async def test(rpc_server, transaction):
+        async def sign_transaction(tx_params):
+            raise RuntimeError('the signer is down')
+
+        with monkeypatch.context() as patch:
+            patch.setattr(transaction, 'sign_transaction', sign_transaction)
+            with pytest.raises(RuntimeError):
+                await transaction.sign_and_send(dict(TX_PARAMS))
+
+        return (await transaction.sign_and_send(dict(TX_PARAMS))).params['nonce']
+
+    assert run_with_client(test) == 5
+
+
+def test_nonce_of_a_failed_retry_is_released():
+    async def test(rpc_server, transaction):
+        await transaction.sign_and_send(dict(TX_PARAMS))
+
+        # the stale nonce is resynchronized, and the retry fails too
+        rpc_server.nonce = 7
+        rpc_server.send_errors = ['nonce too low', 'nonce too low']
+        with pytest.raises(ValueError):
+            await transaction.sign_and_send(dict(TX_PARAMS))
+
+        tx = await transaction.sign_and_send(dict(TX_PARAMS))
+
+        return rpc_server, tx.params['nonce']
+
+    rpc_server, nonce = run_with_client(test)
+
+    assert nonce == 7
+    assert rpc_server.get_method_count('eth_getTransactionCount') == 2
+
+
+def test_already_known_transaction_is_sent(monkeypatch):
+    events = []
+    monkeypatch.setattr(
+        TxEventLog, 'emit', classmethod(lambda cls, event, **fields: events.append(event))
+    )
+
+    async def test(rpc_server, transaction):
+        rpc_server.send_errors = ['already known']
+        tx = await transaction.sign_and_send(dict(TX_PARAMS))
+        next_tx = await transaction.sign_and_send(dict(TX_PARAMS))
+
+        return tx, next_tx
+
+    tx, next_tx = run_with_client(test)
+
+    assert (tx.params['nonce'], next_tx.params['nonce']) == (5, 6)
+    assert tx.hash is not None
+    assert events[:4] == [
+        TxEventType.PARAMS_BUILT, TxEventType.SIGNED, TxEventType.SEND_FAILED, TxEventType.SENT
+    ]
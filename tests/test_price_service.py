@@ -0,0 +1,117 @@
+import asyncio
+import json
+
+from aiohttp import web
+
+from async_eth_lib.models.providers.provider_pool import ProviderPool
+from tasks._common.price_service import BinancePriceService
+
+
+async def start_ticker_server(prices: dict[str, str]):
+    """
+    Start a local server answering like the Binance ticker endpoint and
+    recording the query of every request.
+    """
+    queries = []
+
+    async def handle(request: web.Request) -> web.Response:
+        queries.append(dict(request.query))
+
+        if 'symbol' in request.query:
+            symbols = [request.query['symbol']]
+        elif 'symbols' in request.query:
+            symbols = json.loads(request.query['symbols'])
+        else:
+            symbols = list(prices)
+
+        if any(symbol not in prices for symbol in symbols):
+            return web.json_response({'code': -1121, 'msg': 'Invalid symbol.'}, status=400)
+
+        tickers = [{'symbol': symbol, 'price': prices[symbol]} for symbol in symbols]
+        if 'symbol' in request.query:
+            return web.json_response(tickers[0])
+
+        return web.json_response(tickers)
+
+    app = web.Application()
+    app.router.add_get('/ticker/price', handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    return runner, f'http://127.0.0.1:{port}/ticker/price', queries
+
+
+def run_with_server(monkeypatch, prices: dict[str, str], lookups):
+    monkeypatch.setattr(BinancePriceService, 'PRICES', {})
+    monkeypatch.setattr(BinancePriceService, 'FETCHES', {})
+    monkeypatch.setattr(BinancePriceService, 'TRACKED_SYMBOLS', set())
+
+    async def main():
+        runner, url, queries = await start_ticker_server(prices)
+        monkeypatch.setattr(BinancePriceService, 'TICKER_URL', url)
+
+        try:
+            async with ProviderPool():
+                results = await lookups()
+        finally:
+            await runner.cleanup()
+
+        return results, queries
+
+    return asyncio.run(main())
+
+
+def test_only_tracked_symbols_are_fetched(monkeypatch):
+    prices = {'ETHUSDT': '2000', 'BTCUSDT': '40000', 'BNBUSDT': '300'}
+
+    async def lookups():
+        first = await asyncio.gather(
+            BinancePriceService.get_price('ETHUSDT'),
+            BinancePriceService.get_price('ETHUSDT'),
+        )
+        await BinancePriceService.get_price('btcusdt')
+
+        # both tracked prices expire and are refreshed by one request
+        for symbol, (_, price) in BinancePriceService.PRICES.items():
+            BinancePriceService.PRICES[symbol] = (0., price)
+        second = await BinancePriceService.get_price('ETHUSDT')
+
+        return first, second
+
+    (first, second), queries = run_with_server(monkeypatch, prices, lookups)
+
+    assert first == [2000, 2000]
+    assert second == 2000
+    assert BinancePriceService.PRICES['BTCUSDT'][1] == 40000
+    assert 'BNBUSDT' not in BinancePriceService.PRICES
+    assert queries == [
+        {'symbols': '["ETHUSDT"]'},
+        {'symbols': '["BTCUSDT"]'},
+        {'symbols': '["BTCUSDT","ETHUSDT"]'},
+    ]
+
+
+def test_unknown_symbol_is_dropped_from_tracking(monkeypatch):
+    prices = {'ETHUSDT': '2000', 'USDCETH': '0.0005'}
+
+    async def lookups():
+        # ETHUSDC is missing, so the pair is priced by USDCETH
+        pair_price = await BinancePriceService.get_pair_price('ETH', 'USDC')
+        price = await BinancePriceService.get_price('ETHUSDT')
+
+        return pair_price, price
+
+    (pair_price, price), queries = run_with_server(monkeypatch, prices, lookups)
+
+    assert pair_price == 2000
+    assert price == 2000
+    assert BinancePriceService.TRACKED_SYMBOLS == {'USDCETH', 'ETHUSDT'}
+    assert queries == [
+        {'symbols': '["ETHUSDC"]'},
+        {'symbol': 'ETHUSDC'},
+        {'symbols': '["USDCETH"]'},
+        {'symbols': '["ETHUSDT"]'},
+    ]
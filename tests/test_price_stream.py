@@ -0,0 +1,101 @@
+import asyncio
+import json
+
+from aiohttp import web
+
+from async_eth_lib.models.providers.provider_pool import ProviderPool
+from tasks._common.price_stream import BinancePriceStream
+
+
+async def start_stream_server(messages_per_connection: list[list[dict]]):
+    """
+    Start a local websocket server which sends the next list of messages on
+    every connection and closes all of them but the last one.
+    """
+    connections = []
+
+    async def handle(request: web.Request) -> web.WebSocketResponse:
+        websocket = web.WebSocketResponse()
+        await websocket.prepare(request)
+        connections.append(request.query.get('streams'))
+
+        index = min(len(connections), len(messages_per_connection)) - 1
+        for message in messages_per_connection[index]:
+            await websocket.send_str(json.dumps(message))
+
+        if len(connections) < len(messages_per_connection):
+            await websocket.close()
+        else:
+            async for _ in websocket:
+                pass
+
+        return websocket
+
+    app = web.Application()
+    app.router.add_get('/stream', handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    return runner, f'ws://127.0.0.1:{port}/stream', connections
+
+
+async def wait_for(condition, timeout: float = 5) -> None:
+    async def poll():
+        while not condition():
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(poll(), timeout)
+
+
+def test_stream_updates_prices_and_reconnects(monkeypatch):
+    monkeypatch.setattr(BinancePriceStream, 'RECONNECT_DELAY', 0.05)
+    monkeypatch.setattr(BinancePriceStream, 'MIDPOINTS', {})
+    monkeypatch.setattr(BinancePriceStream, 'LAST_PRICES', {})
+
+    async def main():
+        runner, url, connections = await start_stream_server([
+            [{'stream': 'ethusdt@bookTicker', 'data': {'s': 'ETHUSDT', 'b': '1999', 'a': '2001'}}],
+            [
+                {'stream': 'btcusdt@miniTicker', 'data': {'s': 'BTCUSDT', 'c': '40000.5'}},
+                {'stream': 'ethusdt@bookTicker', 'data': {'s': 'ETHUSDT', 'b': '2099', 'a': '2101'}},
+            ],
+        ])
+        monkeypatch.setattr(BinancePriceStream, 'STREAM_URL', url)
+
+        try:
+            async with ProviderPool():
+                BinancePriceStream.start(['ethusdt', 'BTCUSDT'])
+                await wait_for(lambda: BinancePriceStream.get_price('ETHUSDT') == 2000)
+
+                # the server closes the first connection, so the stream reconnects
+                await wait_for(lambda: BinancePriceStream.get_price('BTCUSDT') is not None)
+                await wait_for(lambda: BinancePriceStream.get_price('ETHUSDT') == 2100)
+                assert BinancePriceStream.is_running()
+
+                await BinancePriceStream.stop()
+                assert not BinancePriceStream.is_running()
+        finally:
+            await runner.cleanup()
+
+        return connections
+
+    connections = asyncio.run(main())
+
+    assert BinancePriceStream.get_price('BTCUSDT') == 40000.5
+    assert len(connections) == 2
+    assert connections[0] == (
+        'btcusdt@bookTicker/btcusdt@miniTicker/ethusdt@bookTicker/ethusdt@miniTicker'
+    )
+
+
+def test_stale_prices_are_not_used(monkeypatch):
+    monkeypatch.setattr(BinancePriceStream, 'MAX_AGE', 0)
+    monkeypatch.setattr(BinancePriceStream, 'MIDPOINTS', {})
+    monkeypatch.setattr(BinancePriceStream, 'LAST_PRICES', {})
+
+    BinancePriceStream._on_message({'data': {'s': 'ETHUSDT', 'b': '1999', 'a': '2001'}})
+
+    assert BinancePriceStream.get_price('ETHUSDT') is None
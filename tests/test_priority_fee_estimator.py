@@ -0,0 +1,47 @@
+import asyncio
+
+import pytest
+
+from async_eth_lib.models.client import Client
+from async_eth_lib.models.others.constants import FeeStrategy
+from async_eth_lib.models.providers.provider_pool import ProviderPool
+from async_eth_lib.models.transactions.priority_fee_estimator import PriorityFeeEstimator
+from tests.rpc_server import RpcServer
+
+# the rewards of the 10th, 50th and 90th percentiles of the last blocks
+BLOCK_REWARDS = [
+    [1, 5, 30],
+    [0, 0, 0],
+    [2, 6, 10],
+    [3, 7, 20],
+]
+
+
+@pytest.fixture(autouse=True)
+def clear_estimates(monkeypatch):
+    monkeypatch.setattr(PriorityFeeEstimator, 'ESTIMATES', {})
+
+
+def test_strategies_are_estimated_by_one_fee_history_call():
+    async def main():
+        async with RpcServer() as rpc_server, ProviderPool():
+            rpc_server.fee_rewards = BLOCK_REWARDS
+            client = await Client.create(network=rpc_server.network, check_proxy=False)
+            transaction = client.contract.transaction
+            fees = [
+                await transaction.estimate_max_priority_fee(strategy=strategy, block_count=4)
+                for strategy in (FeeStrategy.SLOW, FeeStrategy.NORMAL, FeeStrategy.FAST)
+            ]
+
+        return rpc_server, fees
+
+    rpc_server, fees = asyncio.run(main())
+
+    # the empty block is skipped, the median of every percentile is taken
+    assert [fee.Wei for fee in fees] == [2, 6, 20]
+    assert rpc_server.requests == [['eth_feeHistory']]
+
+
+def test_unknown_strategy_is_rejected():
+    with pytest.raises(ValueError):
+        asyncio.run(PriorityFeeEstimator.estimate(account_manager=None, strategy='instant'))
@@ -0,0 +1,45 @@
+import asyncio
+
+from async_eth_lib.models.client import Client
+from async_eth_lib.models.providers.provider_pool import ProviderPool
+from tests.rpc_server import RpcServer
+
+
+def test_clients_of_one_endpoint_share_a_session():
+    async def main():
+        async with RpcServer() as rpc_server, ProviderPool():
+            network = rpc_server.network
+            clients = [
+                await Client.create(network=network, check_proxy=False) for _ in range(3)
+            ]
+            await asyncio.gather(*(client.contract.get_balance() for client in clients))
+
+            session = ProviderPool.get_session(rpc=rpc_server.url)
+            sessions = dict(ProviderPool.SESSIONS)
+            proxy_session = ProviderPool.get_session(
+                rpc=rpc_server.url, proxy='http://127.0.0.1:1'
+            )
+
+        return session, sessions, proxy_session
+
+    session, sessions, proxy_session = asyncio.run(main())
+
+    assert len(sessions) == 1
+    assert proxy_session is not session
+    # the sessions are closed when the pool exits
+    assert session.closed and proxy_session.closed
+    assert ProviderPool.SESSIONS == {}
+
+
+def test_closed_session_is_replaced():
+    async def main():
+        async with ProviderPool():
+            session = ProviderPool.get_session(rpc='http://127.0.0.1:8545/')
+            await session.close()
+
+            return session, ProviderPool.get_session(rpc='http://127.0.0.1:8545/')
+
+    session, new_session = asyncio.run(main())
+
+    assert new_session is not session
+    assert new_session.closed
@@ -0,0 +1,79 @@
+import asyncio
+import socket
+
+import pytest
+from aiohttp import web
+
+from async_eth_lib.models.others import exceptions
+from async_eth_lib.models.providers.provider_pool import ProviderPool
+from async_eth_lib.models.providers.proxy_checker import ProxyChecker
+
+
+@pytest.fixture(autouse=True)
+def clear_results(monkeypatch):
+    monkeypatch.setattr(ProxyChecker, 'RESULTS', {})
+    monkeypatch.setattr(ProxyChecker, 'CHECKS', {})
+
+
+async def start_proxy_server(your_ip: str):
+    """
+    Start a local server which answers the proxied check requests with the IP address.
+    """
+    requests = []
+
+    async def handle(request: web.Request) -> web.Response:
+        requests.append(request.host)
+        await asyncio.sleep(0.05)
+        return web.Response(text=f'{your_ip}\n')
+
+    # a low-level server answers the absolute URLs of the proxied requests
+    runner = web.ServerRunner(web.Server(handle))
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    return runner, f'127.0.0.1:{port}', requests
+
+
+def test_concurrent_checks_of_a_proxy_share_one_request():
+    async def main():
+        runner, proxy, requests = await start_proxy_server(your_ip='127.0.0.1')
+        try:
+            async with ProviderPool():
+                ips = await asyncio.gather(*(
+                    ProxyChecker.check_proxy(proxy) for _ in range(10)
+                ))
+                # the result is cached
+                ips.append(await ProxyChecker.check_proxy(f'http://{proxy}'))
+        finally:
+            await runner.cleanup()
+
+        return ips, requests
+
+    ips, requests = asyncio.run(main())
+
+    assert ips == ['127.0.0.1'] * 11
+    assert requests == ['eth0.me']
+
+
+def test_proxies_with_other_ip_or_down_are_invalid():
+    with socket.socket() as closed_socket:
+        closed_socket.bind(('127.0.0.1', 0))
+        closed_proxy = f'127.0.0.1:{closed_socket.getsockname()[1]}'
+
+    async def main():
+        runner, proxy, _ = await start_proxy_server(your_ip='10.0.0.1')
+        try:
+            async with ProviderPool():
+                results = await ProxyChecker.check_proxies([proxy, closed_proxy])
+                with pytest.raises(exceptions.InvalidProxy):
+                    await ProxyChecker.check_proxy(proxy)
+        finally:
+            await runner.cleanup()
+
+        return proxy, results
+
+    proxy, results = asyncio.run(main())
+
+    assert results == {proxy: False, closed_proxy: False}
@@ -0,0 +1,84 @@
+import asyncio
+
+from eth_abi import abi
+from web3 import Web3
+
+from async_eth_lib.models.client import Client
+from async_eth_lib.models.contracts.contracts import ZkSyncTokenContracts
+from async_eth_lib.models.others.constants import TokenSymbol
+from async_eth_lib.models.providers.provider_pool import ProviderPool
+from async_eth_lib.models.swap.tx_payload_details import TxPayloadDetails
+from tasks._common.quote_engine import QuoteEngine
+from tasks.zksync.mute import Mute
+from tasks.zksync.space_fi import SpaceFi
+from tests.rpc_server import RpcServer
+
+GET_AMOUNT_OUT_SELECTOR = Web3.keccak(text='getAmountOut(uint256,address,address)')[:4]
+GET_AMOUNTS_OUT_SELECTOR = Web3.keccak(text='getAmountsOut(uint256,address[])')[:4]
+
+
+def get_amount_out(target, args):
+    # the USDC pools are stable and double the amount
+    amount_in, _, token_out = abi.decode(['uint256', 'address', 'address'], args)
+    is_stable = Web3.to_checksum_address(token_out) == ZkSyncTokenContracts.USDC.address
+
+    return abi.encode(['uint256', 'bool', 'uint256'], [amount_in * 2, is_stable, 0])
+
+
+def get_amounts_out(target, args):
+    amount_in, path = abi.decode(['uint256', 'address[]'], args)
+    if ZkSyncTokenContracts.WBTC.address.lower() in path:
+        raise ValueError('execution reverted')
+
+    return abi.encode(['uint256[]'], [[amount_in, amount_in * 3]])
+
+
+def get_route(*tokens) -> TxPayloadDetails:
+    return TxPayloadDetails(
+        method_name='swapExactETHForTokens',
+        addresses=[token.address for token in tokens],
+        bool_list=[False] * len(tokens)
+    )
+
+
+def test_routes_are_quoted_in_one_multicall_per_hop():
+    mute = Mute(client=None)
+    space_fi = SpaceFi(client=None)
+    quote_calls = [
+        mute.get_quote_call(
+            TokenSymbol.ETH, TokenSymbol.USDT, 1000, get_route(
+                ZkSyncTokenContracts.WETH, ZkSyncTokenContracts.USDC, ZkSyncTokenContracts.USDT
+            )
+        ),
+        space_fi.get_quote_call(
+            TokenSymbol.ETH, TokenSymbol.USDC, 1000, get_route(
+                ZkSyncTokenContracts.WETH, ZkSyncTokenContracts.USDC
+            )
+        ),
+        space_fi.get_quote_call(
+            TokenSymbol.ETH, TokenSymbol.WBTC, 1000, get_route(
+                ZkSyncTokenContracts.WETH, ZkSyncTokenContracts.WBTC
+            )
+        ),
+    ]
+
+    async def main():
+        async with RpcServer() as rpc_server, ProviderPool():
+            rpc_server.call_handlers[GET_AMOUNT_OUT_SELECTOR] = get_amount_out
+            rpc_server.call_handlers[GET_AMOUNTS_OUT_SELECTOR] = get_amounts_out
+            client = await Client.create(network=rpc_server.network, check_proxy=False)
+
+            quote_engine = QuoteEngine(client)
+            quotes = await quote_engine.get_quotes(quote_calls)
+            amounts_out = await quote_engine.get_amounts_out(quote_calls)
+
+        return rpc_server, quotes, amounts_out
+
+    rpc_server, quotes, amounts_out = asyncio.run(main())
+
+    # the second Mute hop quotes the output of the first one
+    assert quotes[0] == (4000, [True, False])
+    assert mute.apply_quote(get_route(), quotes[0]).bool_list == [True, False, False]
+    assert amounts_out == [4000, 3000, None]
+    # two multicalls for each of the two `get_*` calls
+    assert rpc_server.get_method_count('eth_call') == 4
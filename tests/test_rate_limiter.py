@@ -0,0 +1,70 @@
+import asyncio
+import time
+
+import pytest
+
+from async_eth_lib.models.client import Client
+from async_eth_lib.models.providers.provider_pool import ProviderPool
+from async_eth_lib.models.providers.rate_limiter import RateLimiter, TokenBucket
+from tests.rpc_server import RpcServer
+
+
+@pytest.fixture(autouse=True)
+def clear_limits(monkeypatch):
+    monkeypatch.setattr(RateLimiter, 'LIMITS', {})
+    monkeypatch.setattr(RateLimiter, 'BUCKETS', {})
+    monkeypatch.setattr(RateLimiter, 'CALLS', {})
+
+
+def test_bucket_allows_the_burst_then_the_rate():
+    async def main():
+        bucket = TokenBucket(rate=20, capacity=5)
+        start_time = time.monotonic()
+        await asyncio.gather(*(bucket.acquire() for _ in range(5)))
+        burst_time = time.monotonic() - start_time
+
+        await asyncio.gather(*(bucket.acquire() for _ in range(4)))
+
+        return burst_time, time.monotonic() - start_time
+
+    burst_time, total_time = asyncio.run(main())
+
+    assert burst_time < 0.05
+    assert 0.18 <= total_time < 0.5
+
+
+def test_calls_are_counted_per_endpoint_and_share_the_host_limit():
+    async def main():
+        async with RpcServer() as rpc_server, ProviderPool():
+            RateLimiter.set_limit(RateLimiter.get_host(rpc_server.url), rate=20, burst=2)
+            client = await Client.create(network=rpc_server.network, check_proxy=False)
+            other_client = await Client.create(network=rpc_server.network, check_proxy=False)
+            w3 = client.account_manager.w3
+            other_w3 = other_client.account_manager.w3
+
+            start_time = time.monotonic()
+            await asyncio.gather(*(
+                web3.eth.get_balance('0x' + '12' * 20)
+                for web3 in [w3, other_w3] * 3
+            ))
+
+            return client.rpc_calls, time.monotonic() - start_time, rpc_server.url
+
+    rpc_calls, elapsed_time, url = asyncio.run(main())
+
+    # both clients take tokens from one bucket: 2 calls of the burst and 4 at 20 per second
+    assert 0.18 <= elapsed_time < 0.5
+    assert rpc_calls == {RateLimiter.get_endpoint_name(url): {'eth_getBalance': 6}}
+    assert RateLimiter.get_endpoint_name(url).startswith('127.0.0.1:')
+
+
+def test_removing_the_limit_drops_the_bucket():
+    url = 'https://rpc.example.com/secret-key'
+    RateLimiter.set_limit('rpc.example.com', rate=10)
+    assert RateLimiter.get_bucket(url)
+
+    RateLimiter.set_limit('rpc.example.com', rate=None)
+
+    assert RateLimiter.get_bucket(url) is None
+    assert RateLimiter.get_delay(url) == 0
+    assert 'secret-key' not in RateLimiter.get_endpoint_name(url)
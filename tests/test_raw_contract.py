@@ -0,0 +1,29 @@
+import json
+
+from async_eth_lib.models.contracts.abi_registry import AbiRegistry
+from async_eth_lib.models.contracts.raw_contract import RawContract, TokenContract
+from async_eth_lib.models.others.dataclasses import DefaultAbis
+
+ADDRESS = '0x3355df6d4c9c3035724fd0e3914de96a5a83aaf4'
+
+
+def test_abi_file_is_read_on_first_access(tmp_path, monkeypatch):
+    monkeypatch.setattr(AbiRegistry, 'ABIS_BY_PATH', {})
+    monkeypatch.setattr(AbiRegistry, 'ABIS_BY_HASH', {})
+    monkeypatch.setattr(AbiRegistry, 'REGISTERED_IDS', set())
+    path = tmp_path / 'abi.json'
+    path.write_text(json.dumps(DefaultAbis.Token))
+
+    contract = RawContract(title='Token', address=ADDRESS, abi_path=str(path))
+    path.write_text(json.dumps([]))
+
+    # the file is only read now, so the later content is used
+    assert contract.abi == []
+    assert RawContract(title='Token', address=ADDRESS, abi_path=str(path)).abi is contract.abi
+
+
+def test_identical_abis_share_one_object():
+    contract = RawContract(title='Token', address=ADDRESS, abi=json.dumps(DefaultAbis.Token))
+
+    assert contract.abi is DefaultAbis.Token
+    assert TokenContract(title='Token', address=ADDRESS).abi is DefaultAbis.Token
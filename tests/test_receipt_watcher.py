@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+from web3.exceptions import TimeExhausted
+
+from async_eth_lib.models.client import Client
+from async_eth_lib.models.providers.provider_pool import ProviderPool
+from async_eth_lib.models.transactions.receipt_watcher import ReceiptWatcher
+from tests.rpc_server import RpcServer
+
+TX_HASHES = [f'0x{index:064x}' for index in range(1, 21)]
+
+
+@pytest.fixture(autouse=True)
+def clear_watchers(monkeypatch):
+    monkeypatch.setattr(ReceiptWatcher, 'WATCHERS', {})
+
+
+def test_pending_receipts_are_checked_together_once_per_block():
+    async def main():
+        async with RpcServer() as rpc_server, ProviderPool():
+            rpc_server.pending_tx_hashes = set(TX_HASHES)
+            client = await Client.create(network=rpc_server.network, check_proxy=False)
+            watcher = ReceiptWatcher.get_watcher(client.account_manager.w3, poll_interval=0.05)
+
+            waiters = asyncio.gather(*(
+                watcher.wait_for_receipt(tx_hash, timeout=5) for tx_hash in TX_HASHES
+            ))
+            # no new block, so the pending hashes are not checked again
+            await asyncio.sleep(0.3)
+            rpc_server.pending_tx_hashes.clear()
+            rpc_server.block_number += 1
+            receipts = await waiters
+
+        return rpc_server, receipts
+
+    rpc_server, receipts = asyncio.run(main())
+
+    assert [receipt['transactionHash'].hex() for receipt in receipts] == TX_HASHES
+    receipt_requests = [
+        methods for methods in rpc_server.requests
+        if 'eth_getTransactionReceipt' in methods
+    ]
+    assert receipt_requests == [['eth_getTransactionReceipt'] * len(TX_HASHES)] * 2
+
+
+def test_missing_receipt_times_out():
+    async def main():
+        async with RpcServer() as rpc_server, ProviderPool():
+            rpc_server.pending_tx_hashes = {TX_HASHES[0]}
+            client = await Client.create(network=rpc_server.network, check_proxy=False)
+            watcher = ReceiptWatcher.get_watcher(client.account_manager.w3, poll_interval=0.05)
+
+            with pytest.raises(TimeExhausted):
+                await watcher.wait_for_receipt(TX_HASHES[0], timeout=0.2)
+
+            return watcher
+
+    watcher = asyncio.run(main())
+
+    assert watcher._waiters == {}
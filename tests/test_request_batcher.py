@@ -0,0 +1,51 @@
+import asyncio
+
+from async_eth_lib.models.client import Client
+from async_eth_lib.models.providers.provider_pool import ProviderPool
+from tests.rpc_server import RpcServer
+
+
+def test_gathered_requests_are_sent_as_one_batch():
+    async def main():
+        async with RpcServer() as rpc_server, ProviderPool():
+            client = await Client.create(network=rpc_server.network, check_proxy=False)
+
+            async with client.batch():
+                balance, nonce, block_number = await asyncio.gather(
+                    client.contract.get_balance(),
+                    client.contract.transaction.get_nonce(),
+                    client.account_manager.w3.eth.block_number
+                )
+
+        return rpc_server, balance, nonce, block_number
+
+    rpc_server, balance, nonce, block_number = asyncio.run(main())
+
+    assert rpc_server.requests == [
+        ['eth_getBalance', 'eth_getTransactionCount', 'eth_blockNumber']
+    ]
+    assert (balance.Ether, nonce, block_number) == (1, 5, 100)
+
+
+def test_error_of_one_request_does_not_fail_the_batch():
+    async def main():
+        async with RpcServer() as rpc_server, ProviderPool():
+            client = await Client.create(
+                network=rpc_server.network, check_proxy=False, batch_window=0.01
+            )
+            w3 = client.account_manager.w3
+
+            # the server does not support eth_getCode
+            code, block_number = await asyncio.gather(
+                w3.eth.get_code(client.account_manager.account.address),
+                w3.eth.block_number,
+                return_exceptions=True
+            )
+
+        return rpc_server, code, block_number
+
+    rpc_server, code, block_number = asyncio.run(main())
+
+    assert rpc_server.requests == [['eth_getCode', 'eth_blockNumber']]
+    assert isinstance(code, ValueError)
+    assert block_number == 100
@@ -0,0 +1,109 @@
+import pytest
+from web3 import Web3
+
+from async_eth_lib.models.swap.route_graph import Pool, RouteGraph
+from async_eth_lib.models.swap.tx_payload_details import TxPayloadDetails
+from async_eth_lib.models.swap.tx_payload_details_fetcher import RouteGraphFetcher
+
+TOKENS = {
+    symbol: Web3.to_checksum_address(f'0x{index:040x}')
+    for index, symbol in enumerate(['A', 'B', 'C', 'D', 'E'], start=1)
+}
+
+
+def create_graph(pools: list[tuple[str, str, float]]) -> RouteGraph:
+    graph = RouteGraph()
+    graph.tokens = dict(TOKENS)
+    for token_a, token_b, weight in pools:
+        graph.add_pool(Pool(TOKENS[token_a], TOKENS[token_b], weight=weight))
+
+    return graph
+
+
+def get_symbols(graph: RouteGraph, route: list[Pool]) -> str:
+    symbols = {address: symbol for symbol, address in graph.tokens.items()}
+
+    return ''.join(
+        symbols[token]
+        for token in RouteGraph.get_route_tokens(graph.tokens['A'], route)
+    )
+
+
+def test_routes_are_sorted_by_cost():
+    graph = create_graph([
+        ('A', 'B', 1), ('B', 'E', 1),
+        ('A', 'C', 1), ('C', 'E', 2),
+        ('A', 'E', 5),
+    ])
+
+    routes = graph.get_routes(TOKENS['A'], TOKENS['E'], count=5)
+
+    assert [get_symbols(graph, route) for route in routes] == ['ABE', 'ACE', 'AE']
+
+
+def test_routes_do_not_exceed_the_hop_limit():
+    # the cheapest routes are too long, so the search must not stop at them
+    graph = create_graph([
+        ('A', 'B', 1), ('B', 'C', 1), ('C', 'D', 1), ('D', 'E', 1),
+        ('A', 'C', 3), ('C', 'E', 3),
+        ('A', 'E', 10),
+    ])
+
+    routes = graph.get_routes(TOKENS['A'], TOKENS['E'], count=5, max_hops=2)
+
+    assert [get_symbols(graph, route) for route in routes] == ['ACE', 'AE']
+    # the spur routes only get the hops left after their roots
+    assert [
+        get_symbols(graph, route)
+        for route in graph.get_routes(TOKENS['A'], TOKENS['E'], count=5, max_hops=3)
+    ] == ['ABCE', 'ACDE', 'ACE', 'AE']
+
+
+def test_routes_are_cached_until_a_pool_is_added():
+    graph = create_graph([('A', 'B', 1)])
+
+    assert graph.get_routes(TOKENS['A'], TOKENS['C']) == []
+
+    graph.add_pool(Pool(TOKENS['B'], TOKENS['C']))
+
+    assert [
+        get_symbols(graph, route)
+        for route in graph.get_routes(TOKENS['A'], TOKENS['C'])
+    ] == ['ABC']
+
+
+class PinnedRoutes(RouteGraphFetcher):
+    PATHS = {
+        'A': {
+            'E': TxPayloadDetails(
+                method_name='pinned', addresses=[TOKENS['A'], TOKENS['B'], TOKENS['E']]
+            ),
+        },
+    }
+
+    @classmethod
+    def build_tx_payload_details(cls, first_token, second_token, tokens, route):
+        return TxPayloadDetails(method_name='graph', addresses=tokens)
+
+
+def test_pinned_path_comes_first(monkeypatch):
+    graph = create_graph([
+        ('A', 'B', 1), ('B', 'E', 1),
+        ('A', 'C', 1), ('C', 'E', 2),
+        ('A', 'E', 5),
+    ])
+    monkeypatch.setattr(PinnedRoutes, 'get_route_graph', classmethod(lambda cls: graph))
+
+    candidates = PinnedRoutes.get_candidate_tx_payload_details('A', 'E')
+
+    assert [details.method_name for details in candidates] == ['pinned', 'graph', 'graph']
+    assert [len(details.swap_path) for details in candidates] == [3, 3, 2]
+    assert candidates[1].swap_path[1] == TOKENS['C']
+
+
+def test_build_tx_payload_details_is_abstract():
+    class IncompleteRoutes(RouteGraphFetcher):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteRoutes()
@@ -0,0 +1,80 @@
+import asyncio
+import socket
+
+import pytest
+
+from async_eth_lib.models.client import Client
+from async_eth_lib.models.networks.network import Network
+from async_eth_lib.models.providers.provider_pool import ProviderPool
+from async_eth_lib.models.providers.rpc_router import RpcRouter
+from tests.rpc_server import RpcServer
+
+
+@pytest.fixture(autouse=True)
+def clear_health(monkeypatch):
+    monkeypatch.setattr(RpcRouter, 'HEALTH', {})
+
+
+def get_closed_url() -> str:
+    with socket.socket() as closed_socket:
+        closed_socket.bind(('127.0.0.1', 0))
+        port = closed_socket.getsockname()[1]
+
+    return f'http://127.0.0.1:{port}/'
+
+
+def create_network(rpcs: list[str]) -> Network:
+    return Network(
+        name='local',
+        rpc=rpcs,
+        chain_id=324,
+        tx_type=2,
+        coin_symbol='ETH',
+        decimals=18,
+        explorer='http://127.0.0.1'
+    )
+
+
+def test_requests_fail_over_to_a_live_endpoint():
+    closed_url = get_closed_url()
+
+    async def main():
+        async with RpcServer() as rpc_server, ProviderPool():
+            client = await Client.create(
+                network=create_network([closed_url, rpc_server.url]), check_proxy=False
+            )
+            block_numbers = [
+                await client.account_manager.w3.eth.block_number for _ in range(5)
+            ]
+
+        return rpc_server, block_numbers
+
+    rpc_server, block_numbers = asyncio.run(main())
+
+    assert block_numbers == [100] * 5
+    assert len(rpc_server.requests) == 5
+    # the failed endpoint is ranked last, so it is tried once at most
+    assert RpcRouter.get_health(closed_url).errors <= 1
+    assert RpcRouter.rank([closed_url, rpc_server.url])[0] == rpc_server.url
+
+
+def test_rate_limited_endpoint_is_skipped():
+    async def main():
+        async with RpcServer() as limited_server, RpcServer() as rpc_server, ProviderPool():
+            limited_server.error_status = 429
+            client = await Client.create(
+                network=create_network([limited_server.url, rpc_server.url]),
+                check_proxy=False
+            )
+            for _ in range(5):
+                await client.account_manager.w3.eth.block_number
+
+        return limited_server, rpc_server
+
+    limited_server, rpc_server = asyncio.run(main())
+
+    assert len(rpc_server.requests) == 5
+    assert len(limited_server.requests) <= 1
+    assert RpcRouter.get_health(limited_server.url).is_rate_limited == bool(
+        limited_server.requests
+    )
@@ -0,0 +1,67 @@
+import asyncio
+
+from eth_abi import abi
+from web3 import Web3
+
+from async_eth_lib.models.client import Client
+from async_eth_lib.models.contracts.raw_contract import TokenContract
+from async_eth_lib.models.contracts.token_metadata_cache import TokenMetadataCache
+from async_eth_lib.models.providers.provider_pool import ProviderPool
+from tests.rpc_server import RpcServer, encode_uint
+
+ADDRESS = Web3.to_checksum_address(f'0x{1:040x}')
+
+
+def handle_token_calls(rpc_server: RpcServer) -> None:
+    rpc_server.call_handlers.update({
+        Web3.keccak(text='decimals()')[:4]: lambda target, args: encode_uint(6),
+        Web3.keccak(text='symbol()')[:4]: lambda target, args: abi.encode(['string'], ['USDC']),
+        Web3.keccak(text='name()')[:4]: lambda target, args: abi.encode(['string'], ['USD Coin']),
+    })
+
+
+def test_metadata_is_fetched_once_per_process(monkeypatch):
+    monkeypatch.setattr(TokenMetadataCache, 'METADATA', {})
+
+    async def main():
+        async with RpcServer() as rpc_server, ProviderPool():
+            handle_token_calls(rpc_server)
+            network = rpc_server.network
+            clients = [
+                await Client.create(network=network, check_proxy=False) for _ in range(2)
+            ]
+
+            decimals = [
+                await client.contract.get_decimals(
+                    token_contract=TokenContract(title='USDC', address=ADDRESS)
+                )
+                for client in clients
+            ]
+            metadata = await clients[0].contract.get_token_metadata(ADDRESS)
+            cached_metadata = await clients[1].contract.get_token_metadata(ADDRESS)
+
+        return decimals, metadata, cached_metadata, rpc_server
+
+    decimals, metadata, cached_metadata, rpc_server = asyncio.run(main())
+
+    assert decimals == [6, 6]
+    assert (metadata.decimals, metadata.symbol, metadata.name) == (6, 'USDC', 'USD Coin')
+    assert cached_metadata is metadata
+    # decimals once, then the symbol and the name missing from the cache
+    assert rpc_server.get_method_count('eth_call') == 4
+
+
+def test_metadata_survives_restarts(tmp_path, monkeypatch):
+    path = str(tmp_path / 'token_metadata.json')
+    monkeypatch.setattr(TokenMetadataCache, 'METADATA', {})
+    monkeypatch.setattr(TokenMetadataCache, 'FILE_PATH', None)
+    monkeypatch.setattr(TokenMetadataCache, '_is_dirty', False)
+
+    TokenMetadataCache.load(path)
+    TokenMetadataCache.update(chain_id=324, address=ADDRESS, decimals=6, symbol='USDC')
+
+    monkeypatch.setattr(TokenMetadataCache, 'METADATA', {})
+    TokenMetadataCache.load(path)
+    metadata = TokenMetadataCache.get(chain_id=324, address=ADDRESS.lower())
+
+    assert (metadata.decimals, metadata.symbol, metadata.name) == (6, 'USDC', None)
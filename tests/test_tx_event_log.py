@@ -0,0 +1,86 @@
+import asyncio
+import gzip
+import json
+
+import pytest
+
+from async_eth_lib.models.client import Client
+from async_eth_lib.models.logger.tx_event_log import TxEventLog
+from async_eth_lib.models.others.constants import TxEventType
+from async_eth_lib.models.providers.provider_pool import ProviderPool
+from async_eth_lib.models.transactions.nonce_manager import NonceManager
+from async_eth_lib.models.transactions.receipt_watcher import ReceiptWatcher
+from tests.rpc_server import RpcServer
+
+
+@pytest.fixture(autouse=True)
+def clear_state(monkeypatch):
+    monkeypatch.setattr(NonceManager, 'NONCES', {})
+    monkeypatch.setattr(NonceManager, 'LOCKS', {})
+    monkeypatch.setattr(ReceiptWatcher, 'WATCHERS', {})
+    yield
+    TxEventLog.disable()
+
+
+def read_events(path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_transaction_lifecycle_is_written(tmp_path):
+    path = tmp_path / 'events' / 'tx_events.jsonl'
+    TxEventLog.enable(path=str(path))
+
+    async def main():
+        async with RpcServer() as rpc_server, ProviderPool():
+            client = await Client.create(network=rpc_server.network, check_proxy=False)
+            tx = await client.contract.transaction.sign_and_send(
+                {'to': '0x' + '12' * 20, 'value': 1}
+            )
+            await tx.wait_for_tx_receipt(client.account_manager.w3, timeout=5, poll_latency=0.05)
+
+        return client
+
+    client = asyncio.run(main())
+    TxEventLog.disable()
+
+    events = read_events(path)
+    assert [event['event'] for event in events] == [
+        TxEventType.PARAMS_BUILT, TxEventType.SIGNED, TxEventType.SENT, TxEventType.RECEIPT
+    ]
+    assert all(event['nonce'] == 5 and event['chain_id'] == 324 for event in events)
+    assert events[0]['address'] == client.account_manager.account.address
+    assert events[2]['tx_hash'] == RpcServer.TX_HASH
+    assert events[3]['fee'] == 21000 * 10 ** 9
+
+
+def test_nothing_is_written_until_enabled(tmp_path):
+    path = tmp_path / 'tx_events.jsonl'
+    TxEventLog.emit(TxEventType.SENT, tx_hash=b'\xab')
+
+    TxEventLog.enable(path=str(path))
+    TxEventLog.emit(TxEventType.SENT, tx_hash=b'\xab', error=ValueError('stale'))
+    TxEventLog.disable()
+    TxEventLog.emit(TxEventType.SENT, tx_hash=b'\xab')
+
+    events = read_events(path)
+    assert len(events) == 1
+    assert events[0]['tx_hash'] == '0xab'
+    assert events[0]['error'] == 'stale'
+
+
+def test_rotated_files_are_compressed(tmp_path):
+    path = tmp_path / 'tx_events.jsonl'
+    TxEventLog.enable(path=str(path), max_bytes=1000, backup_count=2, compress=True)
+    for index in range(60):
+        TxEventLog.emit(TxEventType.SIGNED, index=index)
+    TxEventLog.disable()
+
+    assert sorted(file.name for file in tmp_path.iterdir()) == [
+        'tx_events.jsonl', 'tx_events.jsonl.1.gz', 'tx_events.jsonl.2.gz'
+    ]
+    with gzip.open(tmp_path / 'tx_events.jsonl.1.gz', 'rt') as rotated_file:
+        rotated_events = [json.loads(line) for line in rotated_file]
+
+    # the newest backup ends right before the current file
+    assert rotated_events[-1]['index'] + 1 == read_events(path)[0]['index']
+    assert read_events(path)[-1]['index'] == 59
@@ -0,0 +1,55 @@
+import asyncio
+import time
+
+from eth_account import Account
+
+from async_eth_lib.models.networks.network import Network
+from async_eth_lib.models.providers.provider_pool import ProviderPool
+from async_eth_lib.models.runner.wallet_runner import WalletRunner
+
+
+def create_jobs(count: int):
+    network = Network(
+        name='local',
+        rpc='http://127.0.0.1:8545/',
+        chain_id=324,
+        tx_type=2,
+        coin_symbol='ETH',
+        decimals=18,
+        explorer='http://127.0.0.1'
+    )
+
+    return WalletRunner.create_jobs(
+        private_keys=[Account.create().key.hex() for _ in range(count)],
+        network=network
+    )
+
+
+def test_jitter_does_not_hold_the_concurrency_slot():
+    started_at = []
+
+    async def task(client):
+        started_at.append(time.monotonic())
+        await asyncio.sleep(0.1)
+
+        return client.account_manager.account_id
+
+    async def main():
+        runner = WalletRunner(task, concurrency=1, jitter=(0.2, 0.2), check_proxy=False)
+        start_time = time.monotonic()
+
+        async with ProviderPool():
+            results = await runner.run_all(create_jobs(3))
+
+        return results, [started - start_time for started in started_at]
+
+    results, start_delays = asyncio.run(main())
+
+    assert sorted(result.result for result in results) == [1, 2, 3]
+    assert start_delays[0] >= 0.2
+    # the jitter of every job is waited out at once, so a job starts as soon
+    # as the previous one frees the slot
+    assert all(
+        next_delay - delay < 0.2
+        for delay, next_delay in zip(start_delays, start_delays[1:])
+    )